@@ -6,17 +6,216 @@ A Python console application that takes JSON data and generates HTML dashboards.
 
 import json
 import argparse
+import hashlib
 import sys
 import os
+import re
+import time
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
-from jinja2 import Template
-import webbrowser
+from tools import json_backend
+
+# Jinja2, webbrowser and the optional JSON/NumPy backends are imported on the
+# code paths that use them, so --help and --sample start quickly.
+
+# Process-wide template state. Inline template sources are registered under a
+# name derived from their content hash, and one Environment (with an on-disk
+# bytecode cache) is kept per cache directory, so each distinct template is
+# compiled at most once per process and new processes reuse the bytecode.
+_template_sources = {}
+_environments = {}
+
+
+def _load_source(name):
+    """Serve registered inline template sources to Jinja2"""
+    source = _template_sources.get(name)
+    if source is None:
+        return None
+    # The name embeds the source hash, so a loaded template never goes stale
+    return source, None, lambda: True
+
+
+def _escape_script_json(text):
+    """Make JSON text safe to embed inside a <script> element"""
+    return text.replace('<', '\\u003c').replace('>', '\\u003e').replace('&', '\\u0026')
+
+
+def embed_json(value):
+    """Template filter encoding a value as compact JSON for a <script> element"""
+    return _escape_script_json(json_backend.dumps(value))
+
+
+def json_rows(rows):
+    """Template filter yielding rows as comma-separated JSON, one row at a time
+    
+    Used to embed large tables without building the whole JSON string.
+    """
+    separator = ''
+    for row in rows:
+        yield separator + _escape_script_json(json_backend.dumps(row))
+        separator = ','
+
+
+# Custom filters registered on every environment
+TEMPLATE_FILTERS = {
+    'tojson': json_backend.htmlsafe_dumps,
+    'json_rows': json_rows,
+    'embed_json': embed_json,
+}
+
+
+def _environment_fingerprint():
+    """Describe what compiled template code depends on besides its source
+    
+    Filter calling conventions are baked into the generated code, so cached
+    bytecode must not be reused across Jinja2 versions or filter changes.
+    """
+    import jinja2
+    filters = ','.join(
+        f"{name}={func.__module__}.{func.__qualname__}"
+        for name, func in sorted(TEMPLATE_FILTERS.items())
+    )
+    return f"jinja2-{jinja2.__version__};{filters}"
+
+
+def template_name(source):
+    """Return the cache key (template name) for a template source"""
+    h = hashlib.sha256(_environment_fingerprint().encode('utf-8'))
+    h.update(source.encode('utf-8'))
+    return f"dashboard-{h.hexdigest()[:16]}.html"
+
+
+# Subdirectory of the template cache directory holding precompiled modules
+COMPILED_TEMPLATES_DIR = 'compiled'
+
+
+def get_environment(cache_dir):
+    """Return the shared Jinja2 environment for a bytecode cache directory
+    
+    If templates were precompiled into the directory (see
+    precompile_templates), they are imported as Python modules instead of
+    being compiled. Module names derive from the template name, which hashes
+    the source, so an edited template is never served from a stale module:
+    it is not found there and is compiled from source as usual. The bytecode
+    cache keeps only the most recently used templates, so the entries of
+    superseded template versions are removed as new ones are compiled.
+    """
+    key = str(cache_dir)
+    env = _environments.get(key)
+    if env is None:
+        from jinja2 import ChoiceLoader, Environment, FunctionLoader, ModuleLoader
+        from tools.render_cache import TemplateBytecodeCache
+        Path(key).mkdir(parents=True, exist_ok=True)
+        loader = FunctionLoader(_load_source)
+        compiled_dir = Path(key) / COMPILED_TEMPLATES_DIR
+        if compiled_dir.is_dir():
+            loader = ChoiceLoader([ModuleLoader(str(compiled_dir)), loader])
+        env = Environment(
+            loader=loader,
+            bytecode_cache=TemplateBytecodeCache(key)
+        )
+        env.filters.update(TEMPLATE_FILTERS)
+        env = _environments.setdefault(key, env)
+    return env
+
+
+
+def precompile_templates(cache_dir, sources):
+    """Compile template sources to Python modules loaded by get_environment
+    
+    Modules for earlier versions of the templates are removed. Returns the
+    paths of the written modules.
+    """
+    from jinja2 import DictLoader, Environment
+    target = Path(cache_dir) / COMPILED_TEMPLATES_DIR
+    target.mkdir(parents=True, exist_ok=True)
+    for stale in target.glob('tmpl_*.py'):
+        stale.unlink()
+    env = Environment(loader=DictLoader({template_name(source): source for source in sources}))
+    env.filters.update(TEMPLATE_FILTERS)
+    env.compile_templates(str(target), zip=None, ignore_errors=False)
+    # Environments created before now would not look at the new modules
+    _environments.pop(str(cache_dir), None)
+    return sorted(target.glob('tmpl_*.py'))
+
+
+# Tables with more rows than this are embedded as JSON and paginated client-side
+LARGE_TABLE_THRESHOLD = 1000
+LARGE_TABLE_PAGE_SIZE = 100
+
+# Line and bar charts with more points than this are downsampled (LTTB)
+MAX_CHART_POINTS = 5000
+DOWNSAMPLED_CHART_TYPES = ('line', 'bar')
+
+# Font Awesome icons named in the template; alert icons come from the data and
+# the trend arrows are built from a template expression
+ICON_PATTERN = re.compile(r'\bfa-([a-z0-9]+(?:-[a-z0-9]+)*)')
+DYNAMIC_ICONS = ('arrow-up', 'arrow-down', 'arrow-right', 'info-circle')
+
+# Characters of rendered HTML buffered before each write in streaming mode
+STREAM_BUFFER_SIZE = 64 * 1024
+
+# Template blocks rendered and cached separately in incremental mode, with the
+# processed-data key each one depends on
+SECTION_FRAGMENTS = (
+    ('alerts', 'alerts'),
+    ('metrics', 'metrics'),
+    ('charts', 'charts'),
+    ('cards', 'cards'),
+    ('tables', 'tables'),
+    ('chart_scripts', 'charts'),
+    ('table_scripts', 'tables'),
+)
+
+# Extends the dashboard template, replacing each section with its fragment
+STITCH_TEMPLATE = '{% extends page %}' + ''.join(
+    f'{{% block {block} %}}{{{{ fragments.{block} }}}}{{% endblock %}}'
+    for block, _ in SECTION_FRAGMENTS
+)
+
+
+def write_chunks(chunks, f, buffer_size=STREAM_BUFFER_SIZE):
+    """Write an iterable of text chunks to f through a bounded buffer"""
+    buffer = []
+    buffered = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        buffered += len(chunk)
+        if buffered >= buffer_size:
+            f.write(''.join(buffer))
+            buffer.clear()
+            buffered = 0
+    if buffer:
+        f.write(''.join(buffer))
+
 
 class DashboardGenerator:
-    def __init__(self):
+    def __init__(self, use_cache=False, large_table_threshold=LARGE_TABLE_THRESHOLD,
+                 table_encoding='rows', max_chart_points=MAX_CHART_POINTS,
+                 offline_assets=False, shared_assets=False, precompress=False,
+                 incremental=False, profiler=None, chart_encoding='json'):
         self.template_dir = Path(__file__).parent / "templates"
         self.output_dir = Path(__file__).parent / "output"
+        self.use_cache = use_cache
+        self.large_table_threshold = large_table_threshold
+        self.table_encoding = table_encoding  # rows, columnar
+        self.max_chart_points = max_chart_points
+        self.chart_encoding = chart_encoding  # json, float64, float32
+        self.vendor_dir = Path(__file__).parent / "vendor"
+        self.offline_assets = offline_assets
+        self._asset_bundler = None
+        self.shared_assets = shared_assets
+        self.precompress = precompress
+        self._compressions = []
+        self.incremental = incremental
+        self._fragment_cache = None
+        self.fragment_stats = {'rendered': 0, 'reused': 0}
+        self.cache_hit = False
+        self._render_cache = None
+        # Optional tools.profiling.Profiler (or anything with a compatible
+        # stage() context manager) notified of each pipeline stage
+        self.profiler = profiler
         self.ensure_directories()
     
     def ensure_directories(self):
@@ -24,15 +223,24 @@ class DashboardGenerator:
         self.template_dir.mkdir(exist_ok=True)
         self.output_dir.mkdir(exist_ok=True)
     
+    def _stage(self, name, **counts):
+        """Profile a pipeline stage; yields a dict for extra counts"""
+        if self.profiler is None:
+            return nullcontext(counts)
+        return self.profiler.stage(name, **counts)
+    
     def load_json_data(self, file_path):
         """Load JSON data from file or stdin"""
         try:
-            if file_path == '-':
-                # Read from stdin
-                data = json.load(sys.stdin)
-            else:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+            with self._stage('load') as stage:
+                if file_path == '-':
+                    # Read from stdin
+                    raw = sys.stdin.buffer.read()
+                else:
+                    with open(file_path, 'rb') as f:
+                        raw = f.read()
+                stage['bytes_in'] = len(raw)
+                data = json_backend.loads(raw)
             return data
         except json.JSONDecodeError as e:
             print(f"❌ Error parsing JSON: {e}")
@@ -41,8 +249,31 @@ class DashboardGenerator:
             print(f"❌ File not found: {file_path}")
             sys.exit(1)
     
+    def load_json_stream(self, file_path):
+        """Load JSON data incrementally, leaving table rows on disk until rendered"""
+        from tools.json_stream import load_json_stream
+        try:
+            with self._stage('load') as stage:
+                if file_path != '-':
+                    stage['bytes_in'] = os.path.getsize(file_path)
+                return load_json_stream(file_path)
+        except json.JSONDecodeError as e:
+            print(f"❌ Error parsing JSON: {e}")
+            sys.exit(1)
+        except FileNotFoundError:
+            print(f"❌ File not found: {file_path}")
+            sys.exit(1)
+    
     def process_data(self, raw_data):
         """Process raw JSON data into dashboard-ready format"""
+        with self._stage('process') as stage:
+            processed = self._process(raw_data)
+            if self.profiler is not None:
+                from tools.profiling import data_counts
+                stage.update(data_counts(processed))
+        return processed
+    
+    def _process(self, raw_data):
         processed = {
             'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             'title': raw_data.get('title', 'Data Dashboard'),
@@ -73,12 +304,27 @@ class DashboardGenerator:
         """Process charts data"""
         processed_charts = []
         for chart in charts:
+            chart_type = chart.get('type', 'line')  # line, bar, pie, doughnut
+            labels = chart.get('labels', [])
+            datasets = chart.get('datasets', [])
+            if self.max_chart_points and chart_type in DOWNSAMPLED_CHART_TYPES:
+                from tools.downsample import downsample_series
+                labels, datasets = downsample_series(labels, datasets, self.max_chart_points)
+            # Line and bar data is validated here so the page can hand it to
+            # Chart.js pre-parsed (see tools/chart_data.py)
+            from tools.chart_data import pack_series, prepare_series
+            x_scale, labels, datasets = (prepare_series(chart_type, labels, datasets)
+                                         or (None, labels, datasets))
+            if x_scale and self.chart_encoding != 'json':
+                datasets = [dict(d, data=pack_series(d['data'], self.chart_encoding))
+                            for d in datasets]
             processed_charts.append({
                 'id': f"chart_{len(processed_charts) + 1}",
                 'title': chart.get('title', 'Chart'),
-                'type': chart.get('type', 'line'),  # line, bar, pie, doughnut
-                'labels': chart.get('labels', []),
-                'datasets': chart.get('datasets', []),
+                'type': chart_type,
+                'labels': labels,
+                'datasets': datasets,
+                'x_scale': x_scale,
                 'width': chart.get('width', '100%'),
                 'height': chart.get('height', '400px')
             })
@@ -88,15 +334,50 @@ class DashboardGenerator:
         """Process table data"""
         processed_tables = []
         for table in tables:
+            rows = table.get('rows', [])
+            # Lists and lazily loaded rows know their length; plain iterators don't
+            row_count = len(rows) if hasattr(rows, '__len__') else None
+            large = self._is_large_table(row_count)
+            columns = None
+            if large and self.table_encoding == 'columnar':
+                from tools.columnar import encode_columns
+                columns = encode_columns(rows)
+            headers = table.get('headers', [])
+            searchable = table.get('searchable', True)
+            sortable = table.get('sortable', True)
+            search_index = None
+            orders = None
+            # Search strings and per-column sort orders are embedded for
+            # tables rendered into the DOM. Large tables already embed their
+            # rows as data and streamed rows would have to be held in memory,
+            # so for those the page derives the same on first search or sort
+            if not large and isinstance(rows, list):
+                if searchable:
+                    from tools.search import search_index as build_search_index
+                    search_index = build_search_index(rows)
+                if sortable:
+                    from tools.sort_keys import sort_orders
+                    orders = sort_orders(rows, len(headers))
             processed_tables.append({
                 'title': table.get('title', 'Data Table'),
-                'headers': table.get('headers', []),
-                'rows': table.get('rows', []),
-                'searchable': table.get('searchable', True),
-                'sortable': table.get('sortable', True)
+                'headers': headers,
+                'rows': rows,
+                'searchable': searchable,
+                'search_index': search_index,
+                'sortable': sortable,
+                'sort_orders': orders,
+                'large': large,
+                'columns': columns,
+                'page_size': table.get('page_size', LARGE_TABLE_PAGE_SIZE)
             })
         return processed_tables
     
+    def _is_large_table(self, row_count):
+        """Whether a table should be embedded as data and paginated in the page"""
+        if row_count is None or self.large_table_threshold is None:
+            return False
+        return row_count > self.large_table_threshold
+    
     def _process_cards(self, cards):
         """Process card data"""
         processed_cards = []
@@ -118,10 +399,199 @@ class DashboardGenerator:
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{{ title }}</title>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <script src="https://cdn.jsdelivr.net/npm/chartjs-adapter-date-fns/dist/chartjs-adapter-date-fns.bundle.min.js"></script>
+    {% if assets %}
+    <style>{{ assets.styles }}</style>
+    <script>{{ assets.scripts }}</script>
+    {% elif shared_assets and shared_assets.vendor_js %}
+    <link rel="stylesheet" href="{{ shared_assets.vendor_css }}">
+    <script src="{{ shared_assets.vendor_js }}"></script>
+    {% else %}
+    <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.1/dist/chart.umd.js"></script>
+    <script src="https://cdn.jsdelivr.net/npm/chartjs-adapter-date-fns@3.0.0/dist/chartjs-adapter-date-fns.bundle.min.js"></script>
     <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
+    {% endif %}
+    {% if shared_assets %}
+    <link rel="stylesheet" href="{{ shared_assets.css }}">
+    {% else %}
     <style>
+{{ dashboard_styles }}
+    </style>
+    {% endif %}
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>{{ title }}</h1>
+            <p>{{ description }}</p>
+        </div>
+        
+        <div class="timestamp">
+            <i class="fas fa-clock"></i> Generated on: {{ timestamp }}
+        </div>
+        
+        {% block alerts %}{% if alerts %}
+        <div class="alerts-section">
+            {% for alert in alerts %}
+            <div class="alert alert-{{ alert.type }}">
+                <i class="fas fa-{{ alert.icon | default('info-circle') }}"></i>
+                {{ alert.message }}
+            </div>
+            {% endfor %}
+        </div>
+        {% endif %}{% endblock %}
+        
+        {% block metrics %}{% if metrics %}
+        <h2 class="section-title">
+            <i class="fas fa-chart-line"></i> Key Metrics
+        </h2>
+        <div class="grid grid-4">
+            {% for metric in metrics %}
+            <div class="card metric-card" style="background: linear-gradient(135deg, {{ metric.color }} 0%, {{ metric.color }}dd 100%);">
+                <div class="metric-name">{{ metric.name }}</div>
+                <div class="metric-value">{{ metric.value }}{{ metric.unit }}</div>
+                {% if metric.change %}
+                <div class="metric-change trend-{{ metric.trend }}">
+                    <i class="fas fa-arrow-{{ 'up' if metric.trend == 'up' else 'down' if metric.trend == 'down' else 'right' }}"></i>
+                    {{ metric.change }}
+                </div>
+                {% endif %}
+            </div>
+            {% endfor %}
+        </div>
+        {% endif %}{% endblock %}
+        
+        {% block charts %}{% if charts %}
+        <h2 class="section-title">
+            <i class="fas fa-chart-bar"></i> Charts
+        </h2>
+        <div class="grid grid-2">
+            {% for chart in charts %}
+            <div class="card">
+                <div class="chart-title">{{ chart.title }}</div>
+                <div class="chart-container">
+                    <canvas id="{{ chart.id }}"></canvas>
+                </div>
+            </div>
+            {% endfor %}
+        </div>
+        {% endif %}{% endblock %}
+        
+        {% block cards %}{% if cards %}
+        <h2 class="section-title">
+            <i class="fas fa-th-large"></i> Information Cards
+        </h2>
+        <div class="grid grid-3">
+            {% for card in cards %}
+            <div class="card">
+                <h3>{{ card.icon }} {{ card.title }}</h3>
+                <div>{{ card.content }}</div>
+            </div>
+            {% endfor %}
+        </div>
+        {% endif %}{% endblock %}
+        
+        {% block tables %}{% if tables %}
+        <h2 class="section-title">
+            <i class="fas fa-table"></i> Data Tables
+        </h2>
+        {% for table in tables %}
+        <div class="card">
+            <h3>{{ table.title }}</h3>
+            {% if table.searchable %}
+            <input type="text" class="search-box" placeholder="Search in {{ table.title }}..." 
+                   oninput="scheduleSearch(this, 'table{{ loop.index }}')">
+            {% if table.search_index is not none %}
+            <script type="application/json" id="table{{ loop.index }}-index">{{ table.search_index | embed_json }}</script>
+            {% endif %}
+            {% endif %}
+            {% if table.sort_orders is not none %}
+            <script type="application/json" id="table{{ loop.index }}-order">{{ table.sort_orders | embed_json }}</script>
+            {% endif %}
+            <div class="table-container">
+                <table class="data-table" id="table{{ loop.index }}">
+                    <thead>
+                        <tr>
+                            {% for header in table.headers %}
+                            <th {% if table.sortable %}onclick="sortTable({{ loop.index0 }}, 'table{{ loop.index }}')" style="cursor: pointer;"{% endif %}>
+                                {{ header }}
+                                {% if table.sortable %}<i class="fas fa-sort"></i>{% endif %}
+                            </th>
+                            {% endfor %}
+                        </tr>
+                    </thead>
+                    <tbody>
+                        {% if not table.large %}
+                        {% for row in table.rows %}
+                        <tr>
+                            {% for cell in row %}
+                            <td>{{ cell }}</td>
+                            {% endfor %}
+                        </tr>
+                        {% endfor %}
+                        {% endif %}
+                    </tbody>
+                </table>
+            </div>
+            {% if table.large %}
+            <div class="pagination">
+                <button type="button" id="table{{ loop.index }}-prev" onclick="changePage('table{{ loop.index }}', -1)">
+                    <i class="fas fa-chevron-left"></i>
+                </button>
+                <span id="table{{ loop.index }}-info"></span>
+                <button type="button" id="table{{ loop.index }}-next" onclick="changePage('table{{ loop.index }}', 1)">
+                    <i class="fas fa-chevron-right"></i>
+                </button>
+            </div>
+            {% if table.columns %}
+            <script type="application/json" id="table{{ loop.index }}-data" data-encoding="columnar">{{ table.columns | embed_json }}</script>
+            {% else %}
+            <script type="application/json" id="table{{ loop.index }}-data">[{% for chunk in table.rows | json_rows %}{{ chunk }}{% endfor %}]</script>
+            {% endif %}
+            {% endif %}
+        </div>
+        {% endfor %}
+        {% endif %}{% endblock %}
+        
+        <div class="loading" id="loading">
+            <div class="spinner"></div>
+            <p>Loading dashboard...</p>
+        </div>
+    </div>
+    
+    {% if shared_assets %}
+    <script src="{{ shared_assets.js }}"></script>
+    {% else %}
+    <script>
+{{ dashboard_script }}
+    </script>
+    {% endif %}
+    {% block chart_scripts %}{% if charts %}
+    <script type="application/json" id="chart-specs">{{ charts | embed_json }}</script>
+    {% endif %}{% endblock %}
+    <script>
+        {% block table_scripts %}{% for table in tables %}
+        {% if table.large %}
+        initLargeTable('table{{ loop.index }}', {{ table.page_size | int }});
+        {% endif %}
+        {% endfor %}{% endblock %}
+        
+        initCharts();
+        
+        console.log('📊 Dashboard loaded successfully!');
+    </script>
+    {% if live %}
+    <script>
+{{ live.script }}
+        connectLive({{ live.events_url | tojson }});
+    </script>
+    {% endif %}
+</body>
+</html>
+        """
+    
+    def get_dashboard_styles(self):
+        """Get the dashboard stylesheet, shared by every generated page"""
+        return """
         * {
             margin: 0;
             padding: 0;
@@ -309,6 +779,28 @@ class DashboardGenerator:
             border-color: #3498db;
         }
         
+        .pagination {
+            display: flex;
+            justify-content: flex-end;
+            align-items: center;
+            gap: 10px;
+            margin-top: 15px;
+            color: #7f8c8d;
+        }
+        
+        .pagination button {
+            padding: 6px 14px;
+            border: 2px solid #bdc3c7;
+            border-radius: 15px;
+            background: white;
+            cursor: pointer;
+        }
+        
+        .pagination button:disabled {
+            opacity: 0.4;
+            cursor: default;
+        }
+        
         .alert {
             padding: 15px 20px;
             border-radius: 10px;
@@ -360,229 +852,684 @@ class DashboardGenerator:
             .grid-2, .grid-3, .grid-4 { grid-template-columns: 1fr; }
             .metric-value { font-size: 2em; }
         }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>{{ title }}</h1>
-            <p>{{ description }}</p>
-        </div>
+        """
+    
+    def get_dashboard_script(self):
+        """Get the data-independent page script (tables, search and sort)"""
+        return """
+        // Chart.js instances by chart id, so live updates can patch them
+        const dashboardCharts = {};
         
-        <div class="timestamp">
-            <i class="fas fa-clock"></i> Generated on: {{ timestamp }}
-        </div>
+        // Charts are described by the chart-specs array and built when their
+        // canvas comes near the viewport, so a page with many charts does not
+        // construct them all before it can respond. Specs not built yet are
+        // kept here (live updates patch their data until then).
+        const pendingCharts = {};
+        const CHART_ROOT_MARGIN = '200px';
         
-        {% if alerts %}
-        <div class="alerts-section">
-            {% for alert in alerts %}
-            <div class="alert alert-{{ alert.type }}">
-                <i class="fas fa-{{ alert.icon | default('info-circle') }}"></i>
-                {{ alert.message }}
-            </div>
-            {% endfor %}
-        </div>
-        {% endif %}
+        // Chart.js instances' x_scale, for converting live updates
+        const chartScales = {};
         
-        {% if metrics %}
-        <h2 class="section-title">
-            <i class="fas fa-chart-line"></i> Key Metrics
-        </h2>
-        <div class="grid grid-4">
-            {% for metric in metrics %}
-            <div class="card metric-card" style="background: linear-gradient(135deg, {{ metric.color }} 0%, {{ metric.color }}dd 100%);">
-                <div class="metric-name">{{ metric.name }}</div>
-                <div class="metric-value">{{ metric.value }}{{ metric.unit }}</div>
-                {% if metric.change %}
-                <div class="metric-change trend-{{ metric.trend }}">
-                    <i class="fas fa-arrow-{{ 'up' if metric.trend == 'up' else 'down' if metric.trend == 'down' else 'right' }}"></i>
-                    {{ metric.change }}
-                </div>
-                {% endif %}
-            </div>
-            {% endfor %}
-        </div>
-        {% endif %}
+        // Values packed by the generator (--chart-encoding float64/float32):
+        // base64 of little-endian floats, gaps as NaN
+        function decodeSeries(data) {
+            if (!data || data.base64 === undefined) return data;
+            const binary = atob(data.base64);
+            const bytes = new Uint8Array(binary.length);
+            for (let i = 0; i < binary.length; i++) {
+                bytes[i] = binary.charCodeAt(i);
+            }
+            return data.dtype === 'float32' ? new Float32Array(bytes.buffer) : new Float64Array(bytes.buffer);
+        }
         
-        {% if charts %}
-        <h2 class="section-title">
-            <i class="fas fa-chart-bar"></i> Charts
-        </h2>
-        <div class="grid grid-2">
-            {% for chart in charts %}
-            <div class="card">
-                <div class="chart-title">{{ chart.title }}</div>
-                <div class="chart-container">
-                    <canvas id="{{ chart.id }}"></canvas>
-                </div>
-            </div>
-            {% endfor %}
-        </div>
-        {% endif %}
+        // Points in Chart.js's internal {x, y} format for prepared series: x
+        // is the label itself on a 'linear' axis and the label index (from
+        // offset) otherwise
+        function toPoints(xScale, labels, values, offset) {
+            values = decodeSeries(values);
+            const points = new Array(values.length);
+            for (let i = 0; i < values.length; i++) {
+                const y = values[i];
+                points[i] = { x: xScale === 'linear' ? labels[i] : offset + i, y: Number.isNaN(y) ? null : y };
+            }
+            return points;
+        }
         
-        {% if cards %}
-        <h2 class="section-title">
-            <i class="fas fa-th-large"></i> Information Cards
-        </h2>
-        <div class="grid grid-3">
-            {% for card in cards %}
-            <div class="card">
-                <h3>{{ card.icon }} {{ card.title }}</h3>
-                <div>{{ card.content }}</div>
-            </div>
-            {% endfor %}
-        </div>
-        {% endif %}
-        
-        {% if tables %}
-        <h2 class="section-title">
-            <i class="fas fa-table"></i> Data Tables
-        </h2>
-        {% for table in tables %}
-        <div class="card">
-            <h3>{{ table.title }}</h3>
-            {% if table.searchable %}
-            <input type="text" class="search-box" placeholder="Search in {{ table.title }}..." 
-                   onkeyup="searchTable(this, 'table{{ loop.index }}')">
-            {% endif %}
-            <div class="table-container">
-                <table class="data-table" id="table{{ loop.index }}">
-                    <thead>
-                        <tr>
-                            {% for header in table.headers %}
-                            <th {% if table.sortable %}onclick="sortTable({{ loop.index0 }}, 'table{{ loop.index }}')" style="cursor: pointer;"{% endif %}>
-                                {{ header }}
-                                {% if table.sortable %}<i class="fas fa-sort"></i>{% endif %}
-                            </th>
-                            {% endfor %}
-                        </tr>
-                    </thead>
-                    <tbody>
-                        {% for row in table.rows %}
-                        <tr>
-                            {% for cell in row %}
-                            <td>{{ cell }}</td>
-                            {% endfor %}
-                        </tr>
-                        {% endfor %}
-                    </tbody>
-                </table>
-            </div>
-        </div>
-        {% endfor %}
-        {% endif %}
+        function chartDatasets(spec, labels, datasets) {
+            if (!spec.x_scale) return datasets;
+            return datasets.map(dataset => Object.assign({}, dataset, {
+                data: toPoints(spec.x_scale, labels, dataset.data, 0)
+            }));
+        }
         
-        <div class="loading" id="loading">
-            <div class="spinner"></div>
-            <p>Loading dashboard...</p>
-        </div>
-    </div>
-    
-    <script>
-        // Initialize charts
-        {% for chart in charts %}
-        const ctx{{ loop.index }} = document.getElementById('{{ chart.id }}').getContext('2d');
-        new Chart(ctx{{ loop.index }}, {
-            type: '{{ chart.type }}',
-            data: {
-                labels: {{ chart.labels | tojson }},
-                datasets: {{ chart.datasets | tojson }}
-            },
-            options: {
+        function chartConfig(spec) {
+            const scales = {};
+            const plugins = {
+                legend: {
+                    position: 'top',
+                },
+                tooltip: {
+                    mode: 'index',
+                    intersect: false,
+                }
+            };
+            if (['line', 'bar'].includes(spec.type)) {
+                scales.y = { beginAtZero: true };
+            }
+            if (spec.x_scale === 'linear' || spec.x_scale === 'index') {
+                // Long line charts: a linear x axis lets Chart.js decimate
+                scales.x = { type: 'linear', bounds: 'data' };
+                plugins.decimation = { enabled: true, algorithm: 'lttb' };
+                if (spec.x_scale === 'index') {
+                    scales.x.ticks = {
+                        precision: 0,
+                        callback(value) { return this.chart.data.labels[value]; }
+                    };
+                    plugins.tooltip.callbacks = {
+                        title: items => items.length ? items[0].chart.data.labels[items[0].parsed.x] : ''
+                    };
+                }
+            }
+            const options = {
                 responsive: true,
                 maintainAspectRatio: false,
-                plugins: {
-                    legend: {
-                        position: 'top',
-                    },
-                    tooltip: {
-                        mode: 'index',
-                        intersect: false,
-                    }
+                plugins: plugins,
+                scales: scales
+            };
+            if (spec.x_scale) {
+                // Points are validated, sorted and unique on the server
+                options.parsing = false;
+                options.normalized = true;
+            }
+            return {
+                type: spec.type,
+                data: {
+                    labels: spec.labels,
+                    datasets: chartDatasets(spec, spec.labels, spec.datasets)
                 },
-                scales: {
-                    {% if chart.type in ['line', 'bar'] %}
-                    y: {
-                        beginAtZero: true
+                options: options
+            };
+        }
+        
+        function createChart(id) {
+            const spec = pendingCharts[id];
+            if (!spec) return;
+            delete pendingCharts[id];
+            const canvas = document.getElementById(id);
+            chartScales[id] = spec.x_scale;
+            dashboardCharts[id] = new Chart(canvas.getContext('2d'), chartConfig(spec));
+        }
+        
+        // Live updates: values arrive in the processed (spec) form
+        function appendChartData(id, labels, values) {
+            const chart = dashboardCharts[id];
+            const data = chart ? chart.data : pendingCharts[id];
+            if (!data) return;
+            const xScale = chart ? chartScales[id] : null;
+            const offset = data.labels.length;
+            data.labels.push(...labels);
+            values.forEach((points, i) => data.datasets[i].data.push(
+                ...(xScale ? toPoints(xScale, labels, points, offset) : points)));
+            if (chart) chart.update('none');
+        }
+        
+        function replaceChartData(id, labels, datasets) {
+            const chart = dashboardCharts[id];
+            if (!chart) {
+                if (pendingCharts[id]) Object.assign(pendingCharts[id], { labels: labels, datasets: datasets });
+                return;
+            }
+            chart.data.labels = labels;
+            chart.data.datasets = chartDatasets({ x_scale: chartScales[id] }, labels, datasets);
+            chart.update('none');
+        }
+        
+        // Readiness: the spinner shows until the charts in the first
+        // viewport exist; then body gets data-ready and 'dashboard:ready'
+        // is dispatched on document
+        function dashboardReady() {
+            document.getElementById('loading').style.display = 'none';
+            document.body.dataset.ready = 'true';
+            document.dispatchEvent(new Event('dashboard:ready'));
+        }
+        
+        function initCharts() {
+            const element = document.getElementById('chart-specs');
+            const specs = element ? JSON.parse(element.textContent) : [];
+            specs.forEach(spec => { pendingCharts[spec.id] = spec; });
+            if (!specs.length || !('IntersectionObserver' in window)) {
+                specs.forEach(spec => createChart(spec.id));
+                dashboardReady();
+                return;
+            }
+            document.getElementById('loading').style.display = 'block';
+            let ready = false;
+            const observer = new IntersectionObserver(entries => {
+                entries.forEach(entry => {
+                    if (entry.isIntersecting) {
+                        observer.unobserve(entry.target);
+                        createChart(entry.target.id);
                     }
-                    {% endif %}
+                });
+                // The first callback reports every canvas, so the charts on
+                // screen at load have been built once it returns
+                if (!ready) {
+                    ready = true;
+                    dashboardReady();
                 }
-            }
-        });
-        {% endfor %}
+            }, { rootMargin: CHART_ROOT_MARGIN });
+            specs.forEach(spec => observer.observe(document.getElementById(spec.id)));
+            // Printing shows every chart
+            window.addEventListener('beforeprint', () => Object.keys(pendingCharts).forEach(createChart));
+        }
         
-        // Search functionality
-        function searchTable(input, tableId) {
-            const filter = input.value.toLowerCase();
-            const table = document.getElementById(tableId);
-            const rows = table.getElementsByTagName('tr');
-            
-            for (let i = 1; i < rows.length; i++) {
-                const cells = rows[i].getElementsByTagName('td');
-                let found = false;
-                
-                for (let j = 0; j < cells.length; j++) {
-                    if (cells[j].textContent.toLowerCase().indexOf(filter) > -1) {
-                        found = true;
-                        break;
+        // Large tables: rows live in an embedded JSON array and only the
+        // current page is rendered into the DOM
+        const largeTables = {};
+        
+        function decodeColumnar(payload) {
+            const columns = payload.columns.map(column => {
+                if (column.type === 'delta') {
+                    const values = new Float64Array(column.values.length);
+                    let total = 0;
+                    for (let i = 0; i < values.length; i++) {
+                        total += column.values[i];
+                        values[i] = total;
                     }
+                    return values;
                 }
-                
-                rows[i].style.display = found ? '' : 'none';
+                if (column.type === 'dict') {
+                    return column.codes.map(code => column.dict[code]);
+                }
+                return column.values;
+            });
+            const rows = new Array(payload.length);
+            for (let i = 0; i < payload.length; i++) {
+                const length = payload.lengths ? payload.lengths[i] : columns.length;
+                const row = new Array(length);
+                for (let j = 0; j < length; j++) {
+                    row[j] = columns[j][i];
+                }
+                rows[i] = row;
             }
+            return rows;
         }
         
-        // Sort functionality
-        function sortTable(columnIndex, tableId) {
-            const table = document.getElementById(tableId);
-            const tbody = table.getElementsByTagName('tbody')[0];
-            const rows = Array.from(tbody.getElementsByTagName('tr'));
+        function initLargeTable(tableId, pageSize) {
+            const element = document.getElementById(tableId + '-data');
+            const payload = JSON.parse(element.textContent);
+            const rows = element.dataset.encoding === 'columnar' ? decodeColumnar(payload) : payload;
+            // order holds row indices in display order; view is the part of
+            // it that matches the search
+            const order = Array.from(rows, (row, i) => i);
+            largeTables[tableId] = { rows: rows, order: order, view: order, page: 0, pageSize: pageSize };
+            renderLargeTable(tableId);
+        }
+        
+        function renderLargeTable(tableId) {
+            const state = largeTables[tableId];
+            const tbody = document.getElementById(tableId).tBodies[0];
+            const pages = Math.max(1, Math.ceil(state.view.length / state.pageSize));
+            state.page = Math.min(Math.max(state.page, 0), pages - 1);
             
-            rows.sort((a, b) => {
-                const aText = a.getElementsByTagName('td')[columnIndex].textContent.trim();
-                const bText = b.getElementsByTagName('td')[columnIndex].textContent.trim();
-                
-                // Try to parse as numbers
-                const aNum = parseFloat(aText);
-                const bNum = parseFloat(bText);
-                
-                if (!isNaN(aNum) && !isNaN(bNum)) {
-                    return aNum - bNum;
+            const start = state.page * state.pageSize;
+            const end = Math.min(start + state.pageSize, state.view.length);
+            const fragment = document.createDocumentFragment();
+            for (let i = start; i < end; i++) {
+                const tr = document.createElement('tr');
+                for (const cell of state.rows[state.view[i]]) {
+                    const td = document.createElement('td');
+                    td.textContent = cell === null ? '' : cell;
+                    tr.appendChild(td);
                 }
-                
-                return aText.localeCompare(bText);
-            });
+                fragment.appendChild(tr);
+            }
+            tbody.replaceChildren(fragment);
             
-            rows.forEach(row => tbody.appendChild(row));
+            document.getElementById(tableId + '-info').textContent = state.view.length
+                ? `Rows ${start + 1}–${end} of ${state.view.length}`
+                : 'No matching rows';
+            document.getElementById(tableId + '-prev').disabled = state.page === 0;
+            document.getElementById(tableId + '-next').disabled = state.page >= pages - 1;
+        }
+        
+        function changePage(tableId, delta) {
+            largeTables[tableId].page += delta;
+            renderLargeTable(tableId);
+        }
+        
+        function updateLargeTableView(tableId) {
+            const state = largeTables[tableId];
+            const search = searchStates[tableId];
+            state.view = search && search.filter
+                ? state.order.filter(i => search.matches[i])
+                : state.order;
+        }
+        
+        function sortLargeTable(columnIndex, tableId) {
+            const state = largeTables[tableId];
+            state.order = columnOrder(tableId, columnIndex, () => state.rows.map(row => row[columnIndex]));
+            updateLargeTableView(tableId);
+            renderLargeTable(tableId);
+        }
+        
+        // Search: one lowercased string per row, embedded by the generator
+        // (or built here for streamed tables), matched against the query.
+        // Only rows whose visibility changes are touched in the DOM.
+        const SEARCH_DEBOUNCE_MS = 150;
+        const searchStates = {};
+        const searchTimers = {};
+        
+        // Body rows of regular tables in page order, which the search index
+        // follows; captured before the first sort reorders them
+        const tableRows = {};
+        
+        function originalRows(tableId) {
+            if (!tableRows[tableId]) {
+                tableRows[tableId] = Array.from(document.getElementById(tableId).tBodies[0].rows);
+            }
+            return tableRows[tableId];
+        }
+        
+        function rowSearchText(cells) {
+            return Array.from(cells, cell => cell === null ? '' : String(cell).toLowerCase()).join('\\n');
+        }
+        
+        function getSearchState(tableId) {
+            if (!searchStates[tableId]) {
+                const element = document.getElementById(tableId + '-index');
+                const large = largeTables[tableId];
+                const rows = large ? null : originalRows(tableId);
+                const index = element ? JSON.parse(element.textContent)
+                    : large ? large.rows.map(rowSearchText)
+                    : rows.map(tr => rowSearchText(Array.from(tr.cells, td => td.textContent)));
+                searchStates[tableId] = {
+                    index: index,
+                    rows: rows,
+                    filter: '',
+                    matches: new Uint8Array(index.length).fill(1)
+                };
+            }
+            return searchStates[tableId];
+        }
+        
+        function scheduleSearch(input, tableId) {
+            clearTimeout(searchTimers[tableId]);
+            searchTimers[tableId] = setTimeout(() => searchTable(input, tableId), SEARCH_DEBOUNCE_MS);
         }
         
-        // Loading animation
-        document.addEventListener('DOMContentLoaded', function() {
-            const loading = document.getElementById('loading');
-            loading.style.display = 'block';
+        function searchTable(input, tableId) {
+            const filter = input.value.toLowerCase();
+            const state = getSearchState(tableId);
+            if (filter === state.filter) return;
+            
+            // Rows that miss a query also miss any longer query containing it
+            const narrowing = filter.includes(state.filter);
+            const previous = state.matches;
+            const matches = new Uint8Array(previous.length);
+            for (let i = 0; i < matches.length; i++) {
+                if (narrowing && !previous[i]) continue;
+                matches[i] = state.index[i].includes(filter) ? 1 : 0;
+            }
+            state.filter = filter;
+            state.matches = matches;
             
-            setTimeout(() => {
-                loading.style.display = 'none';
-            }, 1000);
-        });
+            if (largeTables[tableId]) {
+                largeTables[tableId].page = 0;
+                updateLargeTableView(tableId);
+                renderLargeTable(tableId);
+                return;
+            }
+            for (let i = 0; i < matches.length; i++) {
+                if (matches[i] !== previous[i]) {
+                    state.rows[i].style.display = matches[i] ? '' : 'none';
+                }
+            }
+        }
         
-        console.log('📊 Dashboard loaded successfully!');
-    </script>
-</body>
-</html>
+        // Sort: the generator embeds the sorted row order of numeric columns;
+        // text columns, and every column of large and streamed tables, get
+        // their order computed here once. Sorting only reorders rows.
+        const sortOrders = {};
+        const TEXT_COLLATOR = new Intl.Collator();
+        const CURRENCY_SYMBOLS = /^[₹$€£¥]+/;
+        const NUMBER = /^(?:\\d[\\d,]*)?\\.?\\d+(?:[eE][+-]?\\d+)?$/;
+        const DURATION = /^(\\d+):([0-5]\\d)(?::([0-5]\\d))?$/;
+        
+        // Mirrors tools/sort_keys.py parse_sort_key
+        function sortKey(value) {
+            if (typeof value === 'number') return isNaN(value) ? null : value;
+            if (typeof value !== 'string') return null;
+            let text = value.trim();
+            const duration = DURATION.exec(text);
+            if (duration) {
+                return duration.slice(1).filter(part => part !== undefined)
+                    .reduce((seconds, part) => seconds * 60 + Number(part), 0);
+            }
+            let sign = '';
+            if (text[0] === '+' || text[0] === '-') {
+                sign = text[0];
+                text = text.slice(1);
+            }
+            text = text.replace(CURRENCY_SYMBOLS, '').trim();
+            if (text.endsWith('%')) text = text.slice(0, -1).trimEnd();
+            return NUMBER.test(text) ? Number(sign + text.replace(/,/g, '')) : null;
+        }
+        
+        function isBlank(value) {
+            return value === null || value === undefined || (typeof value === 'string' && !value.trim());
+        }
+        
+        function computeOrder(values) {
+            let keys = values.map(sortKey);
+            const numeric = keys.some(key => key !== null) &&
+                keys.every((key, i) => key !== null || isBlank(values[i]));
+            if (!numeric) {
+                keys = values.map(value => isBlank(value) ? null : String(value).trim());
+            }
+            const compare = numeric ? (x, y) => x - y : TEXT_COLLATOR.compare;
+            const order = Array.from(values, (value, i) => i);
+            return order.sort((a, b) => {
+                const x = keys[a], y = keys[b];
+                if (x === null || y === null) return (x === null) - (y === null) || a - b;
+                return compare(x, y) || a - b;
+            });
+        }
+        
+        function columnOrder(tableId, columnIndex, columnValues) {
+            if (!sortOrders[tableId]) {
+                const element = document.getElementById(tableId + '-order');
+                sortOrders[tableId] = element ? JSON.parse(element.textContent) : [];
+            }
+            const orders = sortOrders[tableId];
+            if (!orders[columnIndex]) {
+                orders[columnIndex] = computeOrder(columnValues());
+            }
+            return orders[columnIndex];
+        }
+        
+        function sortTable(columnIndex, tableId) {
+            if (largeTables[tableId]) {
+                sortLargeTable(columnIndex, tableId);
+                return;
+            }
+            const rows = originalRows(tableId);
+            const order = columnOrder(tableId, columnIndex, () => rows.map(tr =>
+                tr.cells[columnIndex] ? tr.cells[columnIndex].textContent : null));
+            const tbody = document.getElementById(tableId).tBodies[0];
+            const fragment = document.createDocumentFragment();
+            for (const i of order) {
+                fragment.appendChild(rows[i]);
+            }
+            tbody.appendChild(fragment);
+        }
+        """
+    
+    def get_template(self):
+        """Get the compiled dashboard template from the process-wide cache"""
+        return self._compile(self.get_dashboard_template())
+    
+    def get_stitch_template(self):
+        """Get the template that assembles a page from pre-rendered fragments"""
+        return self._compile(STITCH_TEMPLATE)
+    
+    def precompile_templates(self):
+        """Write the dashboard templates as Python modules for fast cold starts"""
+        return precompile_templates(self.template_dir, [self.get_dashboard_template(), STITCH_TEMPLATE])
+    
+    def _compile(self, source):
+        name = template_name(source)
+        _template_sources.setdefault(name, source)
+        return get_environment(self.template_dir).get_template(name)
+    
+    def get_asset_bundler(self):
+        """Get the bundler that inlines vendored assets in offline mode"""
+        if self._asset_bundler is None:
+            from tools.assets import AssetBundler
+            self._asset_bundler = AssetBundler(self.vendor_dir, self.template_dir / "assets")
+        return self._asset_bundler
+    
+    def referenced_icons(self, data):
+        """Font Awesome icons the page can show for this data"""
+        icons = set(ICON_PATTERN.findall(self.get_dashboard_template()))
+        icons.update(DYNAMIC_ICONS)
+        icons.update(alert.get('icon', 'info-circle') for alert in data.get('alerts', []))
+        return icons
+    
+    def template_context(self, data, output_path=None):
+        """Template variables for processed data, including page assets
+        
+        In shared asset mode (which needs the output_path to link from) the
+        stylesheet and script are written to content-hashed files in
+        output_dir instead of being inlined.
+        """
+        context = dict(
+            data,
+            dashboard_styles=self.get_dashboard_styles(),
+            dashboard_script=self.get_dashboard_script()
+        )
+        bundle = None
+        if self.offline_assets:
+            bundle = self.get_asset_bundler().bundle(self.referenced_icons(data))
+        if self.shared_assets and output_path is not None:
+            context['shared_assets'] = self.write_shared_assets(output_path, bundle)
+        elif bundle:
+            context['assets'] = bundle
+        return context
+    
+    def write_shared_assets(self, output_path, bundle=None):
+        """Write the shared asset files if needed; return hrefs relative to output_path"""
+        from tools.assets import minify_css
+        files = {
+            'css': ('dashboard', 'css', minify_css(self.get_dashboard_styles())),
+            'js': ('dashboard', 'js', self.get_dashboard_script().strip() + '\n')
+        }
+        if bundle:
+            files['vendor_css'] = ('vendor', 'css', bundle['styles'])
+            files['vendor_js'] = ('vendor', 'js', bundle['scripts'])
+        
+        prefix = self._shared_asset_prefix(output_path)
+        hrefs = {}
+        for key, (stem, extension, content) in files.items():
+            name = self._write_shared_asset(stem, extension, content)
+            hrefs[key] = name if prefix == '.' else Path(prefix, name).as_posix()
+        return hrefs
+    
+    def _shared_asset_prefix(self, output_path):
+        """Path from output_path's directory to the shared asset files"""
+        return os.path.relpath(self.output_dir, Path(output_path).parent)
+    
+    def _write_shared_asset(self, stem, extension, content):
+        digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:12]
+        path = self.output_dir / f"{stem}.{digest}.{extension}"
+        # Checked on every render, so files removed since are written again
+        if not path.exists():
+            # Write then rename so concurrent renders never see a partial file
+            tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(content, encoding='utf-8')
+            os.replace(tmp_path, path)
+        return path.name
+    
+    def render_html(self, data, output_path=None):
+        """Render processed data to an HTML string"""
+        template, context = self.prepare_render(data, output_path)
+        with self._stage('render') as stage:
+            html = template.render(**context)
+            stage['chars_out'] = len(html)
+        return html
+    
+    def prepare_render(self, data, output_path=None):
+        """Return the template to render and its context
+        
+        In incremental mode the sections are rendered (or fetched from the
+        fragment cache) up front and the page is stitched together from them.
+        """
+        with self._stage('compile'):
+            template = self.get_template()
+        with self._stage('context'):
+            context = self.template_context(data, output_path)
+        if not self.incremental:
+            return template, context
+        with self._stage('fragments') as stage:
+            context['fragments'] = self.render_fragments(context)
+            stage.update(self.fragment_stats)
+        context['page'] = template
+        return self.get_stitch_template(), context
+    
+    def render_fragments(self, context):
+        """Render each page section, reusing cached output for unchanged data
+        
+        Sections whose data holds one-shot iterators cannot be hashed and are
+        always rendered. fragment_stats counts rendered and reused sections.
+        """
+        template = self.get_template()
+        block_context = template.new_context(context)
+        cache = self.get_fragment_cache()
+        version = self.render_signature()
+        fragments = {}
+        self.fragment_stats = {'rendered': 0, 'reused': 0}
+        for block, section in SECTION_FRAGMENTS:
+            key = cache.key(context.get(section), f"{version}:{block}")
+            html = cache.get(key) if key else None
+            if html is None:
+                html = ''.join(template.blocks[block](block_context))
+                if key:
+                    cache.put(key, html)
+                self.fragment_stats['rendered'] += 1
+            else:
+                self.fragment_stats['reused'] += 1
+            fragments[block] = html
+        cache.evict()
+        return fragments
+    
+    def get_fragment_cache(self):
+        """Get the section fragment cache, kept on disk when use_cache is enabled"""
+        cache_dir = self.output_dir / ".render_cache" / "fragments" if self.use_cache else None
+        if self._fragment_cache is None or self._fragment_cache.cache_dir != cache_dir:
+            from tools.render_cache import FragmentCache
+            self._fragment_cache = FragmentCache(cache_dir)
+        return self._fragment_cache
+    
+    def render_signature(self, output_path=None):
+        """Identify everything besides the data that affects the rendered HTML
+        
+        Shared asset links are relative to the page, so a whole page's
+        signature (with output_path) includes where the assets are from it.
+        """
+        assets = hashlib.sha256(
+            (self.get_dashboard_styles() + self.get_dashboard_script()).encode('utf-8')
+        ).hexdigest()[:16]
+        signature = f"{template_name(self.get_dashboard_template())}:{assets}"
+        if self.shared_assets:
+            signature += ":shared"
+            if output_path is not None:
+                signature += f":{Path(self._shared_asset_prefix(output_path)).as_posix()}"
+        if self.offline_assets:
+            signature += f":offline-{self.get_asset_bundler().fingerprint()}"
+        return signature
+    
+    def get_render_cache(self):
+        """Get the render cache for the output directory, or None if disabled"""
+        if not self.use_cache:
+            return None
+        cache_dir = self.output_dir / ".render_cache"
+        if self._render_cache is None or self._render_cache.cache_dir != cache_dir:
+            from tools.render_cache import RenderCache
+            self._render_cache = RenderCache(cache_dir)
+        return self._render_cache
+    
+    def generate_dashboard(self, data, output_file, stream=False):
+        """Generate HTML dashboard from processed data
+        
+        When use_cache is enabled and the same data (ignoring the timestamp)
+        was rendered before with the same template, the cached page is reused
+        instead and cache_hit is set.
         """
+        output_path = self.output_dir / output_file
+        cache = self.get_render_cache()
+        key = None
+        self.cache_hit = False
+        if cache:
+            with self._stage('cache') as stage:
+                key = cache.key(data, self.render_signature(output_path))
+                self.cache_hit = bool(key) and cache.restore(key, output_path)
+                stage['hit'] = self.cache_hit
+        if self.cache_hit:
+            if self.shared_assets:
+                # The restored page links them; recreate any that were removed
+                bundle = None
+                if self.offline_assets:
+                    bundle = self.get_asset_bundler().bundle(self.referenced_icons(data))
+                self.write_shared_assets(output_path, bundle)
+            if self.precompress:
+                from tools.compress import compress_file, is_fresh
+                if not is_fresh(output_path):
+                    self._compressions.append(compress_file(output_path))
+            return output_path
+        
+        if stream:
+            self.stream_dashboard(data, output_file)
+        else:
+            html_content = self.render_html(data, output_path)
+            with self._stage('write') as stage:
+                self._write_output(output_path, [html_content])
+                stage['bytes_out'] = output_path.stat().st_size
+        
+        if key:
+            cache.store(key, output_path)
+        return output_path
     
-    def generate_dashboard(self, data, output_file):
-        """Generate HTML dashboard from processed data"""
-        template = Template(self.get_dashboard_template())
-        html_content = template.render(**data)
+    def stream_dashboard(self, data, output_file, buffer_size=STREAM_BUFFER_SIZE):
+        """Render the dashboard chunk by chunk straight to the output file
         
+        Only about buffer_size characters of HTML are held in memory at a time,
+        so peak memory does not grow with the size of the tables (except in
+        incremental mode, where each section is held as a whole fragment).
+        """
         output_path = self.output_dir / output_file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        template, context = self.prepare_render(data, output_path)
+        # Rendering and writing are interleaved, so they are one stage here
+        with self._stage('render+write') as stage:
+            self._write_output(output_path, template.generate(**context), buffer_size)
+            stage['bytes_out'] = output_path.stat().st_size
         
         return output_path
     
+    def _write_output(self, output_path, chunks, buffer_size=STREAM_BUFFER_SIZE):
+        """Write rendered chunks to output_path, feeding the compressor if enabled"""
+        if not self.precompress:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                write_chunks(chunks, f, buffer_size)
+            return
+        
+        from tools.compress import CompressedCopies, TeeWriter
+        copies = CompressedCopies(output_path)
+        try:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                write_chunks(chunks, TeeWriter(f, copies), buffer_size)
+        except BaseException:
+            copies.close(abort=True)
+            raise
+        # Closed only after the HTML file so the copies are never older than it
+        copies.close()
+        self._compressions.append(copies)
+    
+    def wait_for_compression(self, pending=0):
+        """Wait until at most pending compressions are still running
+        
+        Compression runs in the background so it overlaps with the next
+        render; call this before relying on the .gz/.br files. Returns a list
+        of error messages for compressions that failed.
+        """
+        errors = []
+        while len(self._compressions) > pending:
+            copies = self._compressions.pop(0)
+            try:
+                copies.wait()
+            except Exception as e:
+                errors.append(f"{copies.output_path}: {type(e).__name__}: {e}")
+        return errors
+    
     def create_sample_data(self):
         """Create sample JSON data for testing"""
         sample_data = {
@@ -692,6 +1639,182 @@ class DashboardGenerator:
         
         return sample_path
 
+def profile_context(args):
+    """Run under cProfile when --cprofile was given"""
+    if not args.cprofile:
+        return nullcontext()
+    from tools.profiling import cprofile_to
+    return cprofile_to(args.cprofile)
+
+def report_profile(args, generator):
+    """Print the stage timings of the last render (to stderr) and start afresh"""
+    profiler = generator.profiler
+    if profiler is None or not profiler.records:
+        return
+    output = profiler.json_lines() if args.profile == 'json' else profiler.summary()
+    print(output, file=sys.stderr)
+    profiler.reset()
+
+def generator_options(args):
+    """DashboardGenerator keyword options selected on the command line"""
+    return {
+        'use_cache': not args.no_cache,
+        'large_table_threshold': args.large_table_threshold,
+        'table_encoding': args.table_encoding,
+        'max_chart_points': args.max_chart_points,
+        'chart_encoding': args.chart_encoding,
+        'offline_assets': args.offline,
+        'shared_assets': args.shared_assets,
+        'precompress': args.precompress,
+        'incremental': args.incremental
+    }
+
+def run_batch(args):
+    """Render every dashboard described by --batch and report per-file results"""
+    from tools.batch import load_jobs, render_batch
+    
+    try:
+        jobs = load_jobs(args.batch)
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+    if not jobs:
+        print(f"❌ Error: No input files match: {args.batch}")
+        sys.exit(1)
+    
+    if args.verbose:
+        print(f"📦 Rendering {len(jobs)} dashboards with {args.workers or os.cpu_count()} workers")
+    
+    def report(result):
+        if result['error']:
+            print(f"❌ {result['input']}: {result['error']}")
+        else:
+            cached = " ♻️ cached" if result.get('cached') else ""
+            print(f"✅ {result['input']} → {result['output']} ({result['seconds']:.3f}s{cached})")
+        for warning in result.get('warnings', ()):
+            print(f"⚠️  Compression failed: {warning}")
+    
+    start = time.perf_counter()
+    results = render_batch(jobs, workers=args.workers, on_result=report,
+                           stream=args.stream, json_backend_name=args.json_backend,
+                           **generator_options(args))
+    elapsed = time.perf_counter() - start
+    
+    failed = [r for r in results if r['error']]
+    cached = sum(1 for r in results if r.get('cached'))
+    print(f"📊 Batch complete: {len(results) - len(failed)} succeeded ({cached} cached), {len(failed)} failed "
+          f"in {elapsed:.2f}s ({len(results) / max(elapsed, 1e-9):.1f} dashboards/s)")
+    if failed:
+        sys.exit(1)
+
+def follow_live_input(input_path, generator, live):
+    """Publish the input file to the live feed whenever it changes"""
+    import threading
+    from tools.watch import watch
+    
+    input_path = Path(input_path).resolve()
+    
+    def publish(paths):
+        if input_path not in paths:
+            return
+        try:
+            with open(input_path, 'rb') as f:
+                raw_data = json_backend.loads(f.read())
+        except (OSError, ValueError) as e:
+            # Often a half-written file; the next change will be picked up
+            print(f"⚠️  Skipping update of {input_path}: {e}")
+            return
+        delta = live.publish(generator.process_data(raw_data))
+        if delta:
+            print(f"📡 Pushed update {live.version}: {', '.join(sorted(k for k in delta if k != 'timestamp'))}")
+    
+    threading.Thread(target=watch, args=([input_path.parent], publish), daemon=True).start()
+
+def run_watch(args, generator):
+    """Re-render whenever an input changes, keeping the process and template warm"""
+    from tools.batch import load_input, load_jobs, spec_directories
+    from tools.watch import watch
+    
+    def current_jobs():
+        return load_jobs(args.batch) if args.batch else [(args.input, args.output)]
+    
+    def render(jobs):
+        for input_path, output_file in jobs:
+            start = time.perf_counter()
+            try:
+                with generator._stage('load') as stage:
+                    stage['bytes_in'] = os.path.getsize(input_path)
+                    raw_data = load_input(input_path, stream=args.stream)
+                processed_data = generator.process_data(raw_data)
+                output_path = generator.generate_dashboard(processed_data, output_file, stream=args.stream)
+                errors = generator.wait_for_compression()
+            except Exception as e:
+                print(f"❌ {input_path}: {type(e).__name__}: {e}")
+                continue
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            cached = " ♻️ cached" if generator.cache_hit else ""
+            print(f"✅ {input_path} → {output_path} ({elapsed_ms:.1f} ms{cached})")
+            for error in errors:
+                print(f"⚠️  Compression failed: {error}")
+            report_profile(args, generator)
+    
+    try:
+        jobs = current_jobs()
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+    render(jobs)
+    directories = spec_directories(args.batch, jobs) if args.batch else [Path(args.input).resolve().parent]
+    manifest = Path(args.batch).resolve() if args.batch and args.batch.endswith('.jsonl') else None
+    print(f"👀 Watching {len(jobs)} input(s) for changes (Ctrl+C to stop)")
+    
+    def on_change(paths):
+        nonlocal jobs
+        previous = set(jobs)
+        try:
+            jobs = current_jobs()
+        except ValueError as e:
+            print(f"❌ {e}")
+            return
+        # New manifest entries or newly matching files render too
+        affected = [job for job in jobs
+                    if Path(job[0]).resolve() in paths or job not in previous]
+        if manifest in paths and not affected:
+            return
+        render(affected)
+    
+    try:
+        watch(directories, on_change, debounce=args.debounce)
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+
+def run_server(args, generator):
+    """Serve dashboards over HTTP until interrupted"""
+    from tools.server import create_server
+    
+    live = None
+    if args.live:
+        from tools.live import LiveFeed
+        live = LiveFeed()
+        if args.input:
+            live.publish(generator.process_data(generator.load_json_data(args.input)))
+            if args.input != '-':
+                follow_live_input(args.input, generator, live)
+    
+    server = create_server(args.host, args.port, generator=generator, verbose=args.verbose, live=live)
+    host, port = server.server_address[:2]
+    print(f"🚀 Dashboard server listening on http://{host}:{port}")
+    if live:
+        print(f"📡 Live dashboard: http://{host}:{port}/ (POST new data to /update)")
+    else:
+        print(f"💡 Try: curl -X POST --data @data.json http://{host}:{port}/render")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Shutting down")
+    finally:
+        server.server_close()
+
 def main():
     parser = argparse.ArgumentParser(
         description='Dashboard Generator - Convert JSON data to HTML dashboards',
@@ -702,6 +1825,9 @@ Examples:
   python dashboard_generator.py -i data.json -o dashboard.html --open
   python dashboard_generator.py --sample
   cat data.json | python dashboard_generator.py -i - -o dashboard.html
+  python dashboard_generator.py --batch "data/*.json" --workers 8
+  python dashboard_generator.py --batch manifest.jsonl
+  python dashboard_generator.py --serve --port 8000
         """
     )
     
@@ -735,9 +1861,166 @@ Examples:
         help='Enable verbose output'
     )
     
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Load table rows incrementally and stream the HTML to the output file'
+    )
+    
+    parser.add_argument(
+        '--large-table-threshold',
+        type=int,
+        default=LARGE_TABLE_THRESHOLD,
+        metavar='ROWS',
+        help=f'Paginate tables with more rows than this client-side (default: {LARGE_TABLE_THRESHOLD})'
+    )
+    
+    parser.add_argument(
+        '--table-encoding',
+        choices=['rows', 'columnar'],
+        default='rows',
+        help='How large tables are embedded: row arrays or compact columnar data (default: rows)'
+    )
+    
+    parser.add_argument(
+        '--max-chart-points',
+        type=int,
+        default=MAX_CHART_POINTS,
+        metavar='POINTS',
+        help=f'Downsample line/bar charts to about this many points, 0 to disable (default: {MAX_CHART_POINTS})'
+    )
+    
+    parser.add_argument(
+        '--chart-encoding',
+        choices=['json', 'float64', 'float32'],
+        default='json',
+        help='How line/bar chart values are embedded: JSON numbers or base64 binary floats (default: json)'
+    )
+    
+    parser.add_argument(
+        '--json-backend',
+        choices=['auto', 'orjson', 'simdjson', 'ujson', 'stdlib'],
+        default='auto',
+        help='JSON library for parsing input and embedding chart data (default: fastest installed)'
+    )
+    
+    parser.add_argument(
+        '--offline',
+        action='store_true',
+        help='Inline vendored Chart.js and Font Awesome so the page needs no network'
+    )
+    
+    parser.add_argument(
+        '--shared-assets',
+        action='store_true',
+        help='Write the CSS/JS shared by all dashboards once as content-hashed files in the output directory'
+    )
+    
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Re-render only the page sections (metrics, charts, tables, ...) whose data changed'
+    )
+    
+    parser.add_argument(
+        '--precompress',
+        action='store_true',
+        help='Also write .html.gz (and .html.br if brotli is installed) next to each dashboard'
+    )
+    
+    parser.add_argument(
+        '--precompile',
+        action='store_true',
+        help='Compile the dashboard templates to Python modules in templates/compiled/ and exit (e.g. at image build time)'
+    )
+    
+    parser.add_argument(
+        '--fetch-assets',
+        action='store_true',
+        help='Download the assets used by --offline into vendor/ and exit'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const='text',
+        choices=['text', 'json'],
+        help='Print per-stage timings, sizes and counts to stderr as a table (text) or JSON lines (json)'
+    )
+    
+    parser.add_argument(
+        '--profile-memory',
+        action='store_true',
+        help='With --profile: also record the peak traced memory of each stage (slower)'
+    )
+    
+    parser.add_argument(
+        '--cprofile',
+        metavar='FILE',
+        help='Write cProfile statistics of the render to FILE (view with python -m pstats FILE)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always re-render, even if the input is unchanged since the last run'
+    )
+    
+    parser.add_argument(
+        '--batch',
+        metavar='SPEC',
+        help='Render many dashboards: a glob of input files or a JSONL manifest of {"input", "output"} entries'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Worker processes for --batch (default: CPU count)'
+    )
+    
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Keep running and re-render when the input file (or --batch inputs) change'
+    )
+    
+    parser.add_argument(
+        '--debounce',
+        type=float,
+        default=0.2,
+        metavar='SECONDS',
+        help='With --watch: wait for this long without further changes before re-rendering (default: 0.2)'
+    )
+    
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        help='Run a render server exposing POST /render and GET /stats'
+    )
+    
+    parser.add_argument(
+        '--live',
+        action='store_true',
+        help='With --serve: serve the dashboard at / and push changes (to -i or via POST /update) over server-sent events'
+    )
+    
+    parser.add_argument(
+        '--host',
+        default='127.0.0.1',
+        help='Host for --serve (default: 127.0.0.1)'
+    )
+    
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=8000,
+        help='Port for --serve (default: 8000)'
+    )
+    
     args = parser.parse_args()
     
-    generator = DashboardGenerator()
+    generator = DashboardGenerator(**generator_options(args))
     
     if args.sample:
         sample_path = generator.create_sample_data()
@@ -745,32 +2028,96 @@ Examples:
         print(f"💡 Try: python dashboard_generator.py -i {sample_path} -o sample_dashboard.html --open")
         return
     
+    try:
+        # Before any batch workers start, which select the same backend
+        json_backend.set_backend(args.json_backend)
+    except ValueError as e:
+        print(f"❌ Error: {e} (installed: {', '.join(json_backend.available_backends())})")
+        sys.exit(1)
+    if args.profile or args.profile_memory:
+        from tools.profiling import Profiler
+        generator.profiler = Profiler(memory=args.profile_memory)
+    
+    if args.precompile:
+        paths = generator.precompile_templates()
+        print(f"🛠️  Precompiled {len(paths)} templates into {paths[0].parent}")
+        return
+    
+    if args.fetch_assets:
+        from tools.assets import fetch_assets
+        try:
+            paths = fetch_assets(generator.vendor_dir)
+        except ValueError as e:
+            print(f"❌ Error: {e}")
+            sys.exit(1)
+        for path in paths:
+            print(f"📥 Fetched: {path}")
+        return
+    
+    if args.watch:
+        if not (args.batch or args.input) or args.input == '-':
+            print("❌ Error: --watch needs an input file (-i) or --batch")
+            sys.exit(1)
+        run_watch(args, generator)
+        return
+    
+    if args.batch:
+        run_batch(args)
+        return
+    
+    if args.serve:
+        if args.profile or args.profile_memory:
+            # Request threads share the generator, so their records would
+            # interleave and pile up with nothing to report them
+            print("❌ Error: --profile and --profile-memory cannot be used with --serve")
+            sys.exit(1)
+        run_server(args, generator)
+        return
+    
     if not args.input:
         print("❌ Error: Input file required. Use -i option or --sample to generate sample data.")
         parser.print_help()
         sys.exit(1)
     
     try:
-        if args.verbose:
-            print(f"📖 Loading data from: {args.input}")
-        
-        raw_data = generator.load_json_data(args.input)
-        
-        if args.verbose:
-            print("🔄 Processing data...")
-        
-        processed_data = generator.process_data(raw_data)
-        
-        if args.verbose:
-            print(f"🎨 Generating dashboard: {args.output}")
-        
-        output_path = generator.generate_dashboard(processed_data, args.output)
+        with profile_context(args):
+            if args.verbose:
+                print(f"📖 Loading data from: {args.input}")
+            
+            if args.stream:
+                raw_data = generator.load_json_stream(args.input)
+            else:
+                raw_data = generator.load_json_data(args.input)
+            
+            if args.verbose:
+                print("🔄 Processing data...")
+            
+            processed_data = generator.process_data(raw_data)
+            
+            if args.verbose:
+                print(f"🎨 Generating dashboard: {args.output}")
+            
+            output_path = generator.generate_dashboard(processed_data, args.output, stream=args.stream)
+            compression_errors = generator.wait_for_compression()
         
+        if generator.cache_hit:
+            print("♻️  Input unchanged, reused cached render")
+        elif args.incremental and args.verbose:
+            stats = generator.fragment_stats
+            print(f"🧩 Re-rendered {stats['rendered']} sections, reused {stats['reused']}")
         print(f"✅ Dashboard generated successfully!")
         print(f"📄 Output file: {output_path}")
+        if args.precompress:
+            for error in compression_errors:
+                print(f"⚠️  Compression failed: {error}")
+            if not compression_errors:
+                from tools.compress import available_formats
+                print(f"🗜️  Precompressed: {', '.join(f'{output_path.name}.{fmt}' for fmt in available_formats())}")
         print(f"📊 Contains: {len(processed_data['metrics'])} metrics, {len(processed_data['charts'])} charts, {len(processed_data['tables'])} tables")
+        report_profile(args, generator)
         
         if args.open:
+            import webbrowser
             webbrowser.open(f"file://{output_path.absolute()}")
             print("🌐 Dashboard opened in browser")
             
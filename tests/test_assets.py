@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Tests for offline asset bundling (uses stand-in vendor files, no network)
+"""
+
+import base64
+import hashlib
+import io
+
+import pytest
+
+from tools import assets
+from tools.assets import AssetBundler, VENDOR_ASSETS, fetch_assets, split_css_rules, subset_icon_css
+from tests.test_rendering import make_generator, make_raw_data
+
+FONT_AWESOME_CSS = """
+/*! Font Awesome Free 6.0.0 */
+.fa,.fas{font-family:"Font Awesome 6 Free";font-weight:900}
+.fa-spin{animation-name:fa-spin}
+@keyframes fa-spin{0%{transform:rotate(0deg)}to{transform:rotate(1turn)}}
+.fa-clock:before,.fa-clock-four:before{content:"\\f017"}
+.fa-circle-info:before,.fa-info-circle:before{content:"\\f05a"}
+.fa-bell:before{content:"\\f0f3"}
+@font-face{font-family:"Font Awesome 6 Brands";src:url(../webfonts/fa-brands-400.woff2) format("woff2")}
+@font-face{font-family:"Font Awesome 6 Free";font-weight:900;src:url(../webfonts/fa-solid-900.woff2) format("woff2"),url(../webfonts/fa-solid-900.ttf) format("truetype")}
+@font-face{font-family:"FontAwesome";font-display:block;src:url(../webfonts/fa-solid-900.woff2) format("woff2"),url(../webfonts/fa-solid-900.ttf) format("truetype")}
+@font-face{font-family:"Font Awesome 5 Free";font-display:block;font-weight:900;src:url(../webfonts/fa-solid-900.woff2) format("woff2"),url(../webfonts/fa-solid-900.ttf) format("truetype")}
+"""
+
+
+@pytest.fixture
+def vendor_dir(tmp_path):
+    vendor = tmp_path / "vendor"
+    vendor.mkdir()
+    for name in VENDOR_ASSETS:
+        (vendor / name).write_text(f"/* {name} */ var x = '</script>';\n//# sourceMappingURL=x.map\n")
+    (vendor / "fontawesome.min.css").write_text(FONT_AWESOME_CSS)
+    (vendor / "fa-solid-900.woff2").write_bytes(b"woff2-font-bytes")
+    return vendor
+
+
+def test_split_css_rules_keeps_nested_blocks():
+    rules = split_css_rules("@charset 'x';a{b:c}@media (x){d{e:f}}")
+    assert rules == ["@charset 'x';", "a{b:c}", "@media (x){d{e:f}}"]
+
+
+def test_subset_keeps_only_used_icons():
+    css, codepoints = subset_icon_css(FONT_AWESOME_CSS, {"info-circle"}, font_data=b"font")
+    assert ".fa-info-circle:before{" in css
+    assert "circle-info" not in css and "fa-clock" not in css and "fa-bell" not in css
+    assert "@keyframes fa-spin" in css and ".fa,.fas{" in css
+    assert "Brands" not in css
+    # The v4/v5 compatibility faces would embed the same font again
+    assert css.count("@font-face") == 1 and '"Font Awesome 6 Free";font-weight:900;src:' in css
+    assert css.count("data:font/woff2;base64," + base64.b64encode(b"font").decode()) == 1
+    assert "../webfonts" not in css
+    assert codepoints == {0xf05a}
+
+
+def test_bundle_is_cached_on_disk(tmp_path, vendor_dir, monkeypatch):
+    bundle = AssetBundler(vendor_dir, tmp_path / "cache").bundle({"bell"})
+    assert ".fa-bell:before" in bundle["styles"]
+    assert "</script>" not in bundle["scripts"] and "sourceMappingURL" not in bundle["scripts"]
+    assert len(list((tmp_path / "cache").glob("bundle-*.json"))) == 1
+
+    # A new bundler (as in a new process) reuses the cached bundle
+    def no_rebuild(self, icons):
+        raise AssertionError("bundle rebuilt")
+    monkeypatch.setattr(AssetBundler, "_build", no_rebuild)
+    assert AssetBundler(vendor_dir, tmp_path / "cache").bundle({"bell"}) == bundle
+
+
+def test_fetch_assets_verifies_pinned_checksums(tmp_path, monkeypatch):
+    bodies = {url: f"/* {name} */".encode() for name, (url, _) in VENDOR_ASSETS.items()}
+    monkeypatch.setattr(assets.urllib.request, "urlopen", lambda url, timeout: io.BytesIO(bodies[url]))
+    pinned = {name: (url, hashlib.sha256(bodies[url]).hexdigest())
+              for name, (url, _) in VENDOR_ASSETS.items()}
+    monkeypatch.setattr(assets, "VENDOR_ASSETS", pinned)
+    assert "@" in pinned["chart.js"][0]
+
+    paths = fetch_assets(tmp_path / "vendor")
+    assert sorted(path.name for path in paths) == sorted(VENDOR_ASSETS)
+
+    # One changed file means nothing is written
+    bodies[pinned["chart.js"][0]] = b"/* another release */"
+    with pytest.raises(ValueError, match="chart.js: expected"):
+        fetch_assets(tmp_path / "changed")
+    assert not (tmp_path / "changed").exists()
+
+
+def test_missing_vendor_files(tmp_path):
+    with pytest.raises(FileNotFoundError, match="--fetch-assets"):
+        AssetBundler(tmp_path / "empty", tmp_path / "cache").bundle({"bell"})
+
+
+def test_offline_render_has_no_cdn_references(tmp_path, vendor_dir):
+    generator = make_generator(tmp_path)
+    generator.vendor_dir = vendor_dir
+    generator.offline_assets = True
+    raw_data = make_raw_data()
+    raw_data["alerts"][0]["icon"] = "bell"
+    html = generator.render_html(generator.process_data(raw_data))
+    assert "cdn.jsdelivr.net" not in html and "cdnjs.cloudflare.com" not in html
+    assert ".fa-bell:before" in html and ".fa-clock:before" in html
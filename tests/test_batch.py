@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Tests for batch dashboard rendering
+"""
+
+import json
+
+import pytest
+
+from tools.batch import load_jobs, render_batch
+from tests.test_rendering import make_raw_data
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    for name in ("north", "south", "east"):
+        (data_dir / f"{name}.json").write_text(json.dumps(make_raw_data()), encoding="utf-8")
+    (data_dir / "broken.json").write_text("{not json", encoding="utf-8")
+    return data_dir
+
+
+def test_load_jobs_from_glob(inputs):
+    jobs = load_jobs(str(inputs / "*.json"))
+    assert [output for _, output in jobs] == ["broken.html", "east.html", "north.html", "south.html"]
+
+
+def test_load_jobs_from_manifest(tmp_path, inputs):
+    manifest = tmp_path / "manifest.jsonl"
+    manifest.write_text(
+        json.dumps({"input": str(inputs / "north.json"), "output": "n.html"}) + "\n\n"
+        + json.dumps({"input": str(inputs / "south.json")}) + "\n",
+        encoding="utf-8"
+    )
+    assert load_jobs(str(manifest)) == [
+        (str(inputs / "north.json"), "n.html"),
+        (str(inputs / "south.json"), "south.html"),
+    ]
+
+
+def test_load_jobs_rejects_colliding_outputs(tmp_path):
+    for region in ("eu", "us"):
+        (tmp_path / region).mkdir()
+        (tmp_path / region / "north.json").write_text("{}", encoding="utf-8")
+    with pytest.raises(ValueError, match="north.html"):
+        load_jobs(str(tmp_path / "**" / "*.json"))
+
+    manifest = tmp_path / "manifest.jsonl"
+    manifest.write_text("".join(
+        json.dumps({"input": str(tmp_path / region / "north.json"), "output": f"{region}.html"}) + "\n"
+        for region in ("eu", "us")), encoding="utf-8")
+    assert [output for _, output in load_jobs(str(manifest))] == ["eu.html", "us.html"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_render_batch_reports_failures_without_aborting(tmp_path, inputs, workers):
+    output_dir = tmp_path / "output"
+    seen = []
+    results = render_batch(load_jobs(str(inputs / "*.json")), workers=workers,
+                           on_result=seen.append, output_dir=str(output_dir))
+
+    assert len(results) == len(seen) == 4
+    failed = [r for r in results if r["error"]]
+    assert [r["input"] for r in failed] == [str(inputs / "broken.json")]
+    assert "JSONDecodeError" in failed[0]["error"]
+    assert all(r["seconds"] >= 0 for r in results)
+    assert sorted(p.name for p in output_dir.glob("*.html")) == ["east.html", "north.html", "south.html"]
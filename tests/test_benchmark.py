@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Tests for the benchmark suite (tiny sizes; the real scenarios run via
+python -m tools.benchmark)
+"""
+
+import json
+
+from tools import benchmark
+from tools.benchmark import compare, run_scenario, synthetic_dashboard
+
+
+def test_synthetic_dashboard_sizes_and_determinism():
+    data = synthetic_dashboard(metrics=3, charts=2, points=50, tables=2, rows=10, columns=7)
+    assert len(data['metrics']) == 3
+    assert [len(c['datasets'][0]['data']) for c in data['charts']] == [50, 50]
+    assert [len(t['rows']) for t in data['tables']] == [10, 10]
+    assert all(len(row) == 7 for row in data['tables'][0]['rows'])
+    assert data['tables'][0]['rows'][0][1].startswith('₹')
+    assert synthetic_dashboard(rows=5, seed=1) == synthetic_dashboard(rows=5, seed=1)
+    assert synthetic_dashboard(rows=5, seed=1) != synthetic_dashboard(rows=5, seed=2)
+
+
+def test_run_scenario_measures_each_stage(tmp_path):
+    result = run_scenario(dict(metrics=2, charts=1, points=20, tables=1, rows=30, columns=3),
+                          repeat=1, work_dir=tmp_path)
+    assert set(result) == {'load', 'process', 'render'}
+    assert all(entry['seconds'] >= 0 and entry['peak_bytes'] > 0 for entry in result.values())
+    assert result['process']['throughput'] > 0
+
+
+def test_compare_flags_regressions_beyond_threshold():
+    baseline = {'big': {'render': {'seconds': 1.0, 'peak_bytes': 100 * 2**20}}}
+    ok = {'big': {'render': {'seconds': 1.2, 'peak_bytes': 110 * 2**20}}}
+    slow = {'big': {'render': {'seconds': 1.5, 'peak_bytes': 100 * 2**20}},
+            'new': {'render': {'seconds': 9.0, 'peak_bytes': 0}}}
+    assert compare(ok, baseline, threshold=0.25) == []
+    assert compare(slow, baseline, threshold=0.25) == [('big', 'render', 'seconds', 1.0, 1.5)]
+
+
+def test_compare_ignores_noise_floor():
+    baseline = {'small': {'load': {'seconds': 0.0001, 'peak_bytes': 1000}}}
+    current = {'small': {'load': {'seconds': 0.0009, 'peak_bytes': 5000}}}
+    assert compare(current, baseline) == []
+
+
+def test_main_saves_baseline_then_fails_on_regression(tmp_path, monkeypatch):
+    measurements = {'small': {'render': {'seconds': 0.1, 'peak_bytes': 2**21, 'throughput': 1.0}}}
+    monkeypatch.setattr(benchmark, 'run_benchmarks', lambda *args, **kwargs: measurements)
+    baseline = tmp_path / "baseline.json"
+
+    assert benchmark.main(['--baseline', str(baseline), '--save']) == 0
+    assert json.loads(baseline.read_text())['small']['render']['seconds'] == 0.1
+    assert benchmark.main(['--baseline', str(baseline)]) == 0
+
+    measurements['small']['render']['seconds'] = 0.2
+    assert benchmark.main(['--baseline', str(baseline)]) == 1
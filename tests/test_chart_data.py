@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests for the pre-parsed chart data path
+"""
+
+import json
+import math
+
+import pytest
+
+from tools.chart_data import DECIMATION_MIN_POINTS, pack_series, prepare_series, unpack_series
+from tests.test_rendering import make_generator, make_raw_data
+
+
+def test_short_series_keep_category_axis():
+    labels = ["Jan", "Feb", "Mar"]
+    datasets = [{"label": "Sales", "data": [10, float("nan"), None]}]
+    x_scale, new_labels, new_datasets = prepare_series("bar", labels, datasets)
+    assert x_scale == "category"
+    assert new_labels is labels
+    assert new_datasets == [{"label": "Sales", "data": [10, None, None]}]
+    assert math.isnan(datasets[0]["data"][1])  # input not modified
+
+
+def test_unsuitable_charts_are_left_alone():
+    assert prepare_series("pie", ["a"], [{"data": [1]}]) is None
+    assert prepare_series("line", ["a", "b"], [{"data": [1, "2"]}]) is None
+    assert prepare_series("line", ["a", "b"], [{"data": [{"x": 1, "y": 2}]}]) is None
+    assert prepare_series("line", ["a"], [{"label": "no data"}]) is None
+
+
+def test_long_line_with_numeric_labels_is_sorted_on_linear_axis():
+    n = DECIMATION_MIN_POINTS + 1
+    labels = list(range(n, 0, -1))
+    data = [float(i) for i in range(n)]
+    x_scale, new_labels, new_datasets = prepare_series("line", labels, [{"data": data}])
+    assert x_scale == "linear"
+    assert new_labels == list(range(1, n + 1))
+    assert new_datasets[0]["data"][:2] == [float(n - 1), float(n - 2)]
+    assert labels[0] == n
+
+
+def test_long_line_with_text_or_repeated_labels_uses_index_axis():
+    n = DECIMATION_MIN_POINTS + 1
+    data = [{"data": list(range(n))}]
+    assert prepare_series("line", [f"d{i}" for i in range(n)], data)[0] == "index"
+    assert prepare_series("line", [i // 2 for i in range(n)], data)[0] == "index"
+    # Bars are never decimated
+    assert prepare_series("bar", [f"d{i}" for i in range(n)], data)[0] == "category"
+
+
+def test_processed_charts_carry_x_scale(tmp_path):
+    generator = make_generator(tmp_path)
+    raw_data = make_raw_data()
+    raw_data["charts"].append({"title": "Share", "type": "pie", "labels": ["a"],
+                               "datasets": [{"data": [1]}]})
+    charts = generator.process_data(raw_data)["charts"]
+    assert [chart["x_scale"] for chart in charts] == ["category", None]
+
+
+@pytest.mark.parametrize("dtype, size", [("float64", 8), ("float32", 4)])
+def test_pack_series_round_trip(dtype, size):
+    values = [1.5, None, -2.25, 1000]
+    payload = pack_series(values, dtype)
+    assert payload["length"] == 4
+    assert len(payload["base64"]) == 4 * -(-4 * size // 3)
+    assert unpack_series(payload) == [1.5, None, -2.25, 1000.0]
+
+
+def test_float32_keeps_about_seven_digits():
+    assert unpack_series(pack_series([1 / 3], "float32"))[0] == pytest.approx(1 / 3, rel=1e-7)
+
+
+def test_packed_chart_encoding(tmp_path):
+    generator = make_generator(tmp_path)
+    generator.chart_encoding = "float32"
+    raw_data = make_raw_data()
+    raw_data["charts"].append({"title": "Share", "type": "pie", "labels": ["a"],
+                               "datasets": [{"data": [1]}]})
+    data = generator.process_data(raw_data)
+    line, pie = data["charts"]
+    assert unpack_series(line["datasets"][0]["data"]) == [10, 20, 30]
+    assert pie["datasets"][0]["data"] == [1]
+
+    html = generator.render_html(data)
+    specs = json.loads(html.split('id="chart-specs">')[1].split("</script>")[0])
+    assert specs[0]["datasets"][0]["data"]["dtype"] == "float32"
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Tests for the columnar table encoding
+"""
+
+import json
+import re
+
+from tools.columnar import decode_columns, encode_columns
+from tests.test_rendering import make_generator, make_raw_data
+
+
+def test_round_trip_with_column_types():
+    rows = [[f"item {i % 3}", 1000 + i * 7, i / 4, f"unique {i}", None if i % 2 else True]
+            for i in range(50)]
+    payload = encode_columns(rows)
+    assert [c['type'] for c in payload['columns']] == ['dict', 'delta', 'number', 'raw', 'raw']
+    assert payload['columns'][1]['values'][:3] == [1000, 7, 7]
+    assert 'lengths' not in payload
+    assert decode_columns(json.loads(json.dumps(payload))) == rows
+
+
+def test_round_trip_ragged_and_empty():
+    rows = [["a"], ["b", 2, 3], [], ["c", 4]]
+    assert decode_columns(encode_columns(rows)) == rows
+    assert decode_columns(encode_columns([])) == []
+
+
+def test_columnar_tables_are_smaller(tmp_path):
+    generator = make_generator(tmp_path)
+    generator.large_table_threshold = 0
+    raw_data = make_raw_data()
+    raw_data['tables'][0]['rows'] = [[f"Region {i % 5}", i, i * 3] for i in range(2000)]
+
+    row_html = generator.render_html(generator.process_data(raw_data))
+    generator.table_encoding = 'columnar'
+    data = generator.process_data(raw_data)
+    columnar_html = generator.render_html(data)
+
+    assert 'data-encoding="columnar"' in columnar_html
+    assert decode_columns(data['tables'][0]['columns']) == raw_data['tables'][0]['rows']
+    # Compare the embedded table data, not the page's fixed markup and script
+    embedded = r'<script type="application/json" id="table1-data"[^>]*>(.*?)</script>'
+    row_payload = re.search(embedded, row_html).group(1)
+    columnar_payload = re.search(embedded, columnar_html).group(1)
+    assert len(columnar_payload) < len(row_payload) / 2
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Tests for precompressed dashboard output
+"""
+
+import gzip
+import json
+import os
+
+import pytest
+
+from tools import compress
+from tools.batch import load_jobs, render_batch
+from tools.compress import CompressedCopies, compress_file, is_fresh
+from tests.test_rendering import make_generator, make_raw_data
+
+
+def test_streaming_copies_match_input(tmp_path):
+    path = tmp_path / "page.html"
+    text = "<p>héllo</p>" * 10000
+    copies = CompressedCopies(path, formats=('gz',))
+    for i in range(0, len(text), 777):
+        copies.write(text[i:i + 777])
+    copies.close()
+    copies.wait()
+
+    assert gzip.decompress((tmp_path / "page.html.gz").read_bytes()).decode('utf-8') == text
+    assert [p.name for p in tmp_path.iterdir()] == ["page.html.gz"]
+
+
+def test_gzip_output_is_reproducible(tmp_path):
+    path = tmp_path / "page.html"
+    path.write_text("<html>same</html>", encoding="utf-8")
+    compress_file(path, formats=('gz',)).wait()
+    first = (tmp_path / "page.html.gz").read_bytes()
+    compress_file(path, formats=('gz',)).wait()
+    assert (tmp_path / "page.html.gz").read_bytes() == first
+
+
+def test_aborted_copies_leave_nothing_behind(tmp_path):
+    copies = CompressedCopies(tmp_path / "page.html", formats=('gz',))
+    copies.write("<html>partial")
+    copies.close(abort=True)
+    copies.wait()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_failure_after_last_chunk_is_reported(tmp_path):
+    # os.replace fails once every chunk has been consumed
+    (tmp_path / "page.html.gz").mkdir()
+    copies = CompressedCopies(tmp_path / "page.html", formats=('gz',))
+    copies.write("<p>done</p>")
+    copies.close()
+    copies.thread.join(timeout=5)
+    assert copies.done()
+    with pytest.raises(OSError):
+        copies.wait()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["page.html.gz"]
+
+
+def test_brotli_copy(tmp_path):
+    brotli = pytest.importorskip('brotli')
+    path = tmp_path / "page.html"
+    path.write_text("<html>brotli</html>" * 500, encoding="utf-8")
+    compress_file(path, formats=('br',)).wait()
+    assert brotli.decompress((tmp_path / "page.html.br").read_bytes()) == path.read_bytes()
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_generator_writes_compressed_siblings(tmp_path, monkeypatch, stream):
+    monkeypatch.setattr(compress, 'available_formats', lambda: ('gz',))
+    generator = make_generator(tmp_path)
+    generator.precompress = True
+    data = generator.process_data(make_raw_data(rows=50))
+    output_path = generator.generate_dashboard(data, "dash.html", stream=stream)
+
+    assert generator.wait_for_compression() == []
+    gz_path = output_path.with_name("dash.html.gz")
+    assert gzip.decompress(gz_path.read_bytes()) == output_path.read_bytes()
+    assert is_fresh(output_path, formats=('gz',))
+
+
+def test_cache_hit_recompresses_stale_siblings(tmp_path, monkeypatch):
+    monkeypatch.setattr(compress, 'available_formats', lambda: ('gz',))
+    generator = make_generator(tmp_path)
+    generator.use_cache = True
+    generator.precompress = True
+    data = generator.process_data(make_raw_data())
+    output_path = generator.generate_dashboard(data, "dash.html")
+    generator.wait_for_compression()
+    gz_path = output_path.with_name("dash.html.gz")
+    gz_path.unlink()
+
+    generator.generate_dashboard(data, "dash.html")
+    assert generator.cache_hit
+    assert generator.wait_for_compression() == []
+    assert gzip.decompress(gz_path.read_bytes()) == output_path.read_bytes()
+
+
+def test_is_fresh_detects_older_sibling(tmp_path):
+    path = tmp_path / "page.html"
+    path.write_text("<html></html>", encoding="utf-8")
+    compress_file(path, formats=('gz',)).wait()
+    assert is_fresh(path, formats=('gz',))
+    os.utime(tmp_path / "page.html.gz", ns=(0, 0))
+    assert not is_fresh(path, formats=('gz',))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch_completes_compression_before_returning(tmp_path, workers):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    for name in ("north", "south", "east"):
+        (data_dir / f"{name}.json").write_text(json.dumps(make_raw_data()), encoding="utf-8")
+    output_dir = tmp_path / "output"
+
+    results = render_batch(load_jobs(str(data_dir / "*.json")), workers=workers,
+                           output_dir=str(output_dir), use_cache=False, precompress=True)
+
+    assert not any(r["error"] or r.get("warnings") for r in results)
+    for name in ("north", "south", "east"):
+        html = (output_dir / f"{name}.html").read_bytes()
+        assert gzip.decompress((output_dir / f"{name}.html.gz").read_bytes()) == html
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for chart downsampling
+"""
+
+import math
+
+import pytest
+
+from tools import downsample
+from tools.downsample import downsample_series, lttb_indices
+from tests.test_rendering import make_generator, make_raw_data
+
+
+def wave(n):
+    values = [math.sin(i / 50) for i in range(n)]
+    values[n // 3] = 25.0  # a spike that must survive
+    return values
+
+
+@pytest.fixture(params=['python', 'numpy'])
+def backend(request, monkeypatch):
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(downsample, 'np', None)
+    return request.param
+
+
+def test_lttb_keeps_endpoints_and_peaks(backend):
+    values = wave(10000)
+    indices = lttb_indices(values, 500)
+    assert len(indices) == 500
+    assert indices[0] == 0 and indices[-1] == 9999
+    assert indices == sorted(set(indices))
+    assert 10000 // 3 in indices
+
+
+def test_numpy_matches_python(monkeypatch):
+    pytest.importorskip('numpy')
+    values = wave(5000)
+    expected = lttb_indices(values, 300)
+    monkeypatch.setattr(downsample, 'np', None)
+    assert lttb_indices(values, 300) == expected
+
+
+def test_short_series_unchanged():
+    assert lttb_indices([1, 2, 3], 10) == [0, 1, 2]
+
+
+def test_series_stay_aligned(backend):
+    n = 4000
+    labels = [f"t{i}" for i in range(n)]
+    datasets = [
+        {'label': 'a', 'data': wave(n)},
+        {'label': 'b', 'data': [(i * 7919) % 101 for i in range(n)]},
+        {'label': 'short', 'data': [1, 2, 3]},
+    ]
+    new_labels, new_datasets = downsample_series(labels, datasets, 200)
+
+    assert 200 <= len(new_labels) <= 400
+    assert len(new_datasets[0]['data']) == len(new_datasets[1]['data']) == len(new_labels)
+    assert new_datasets[2]['data'] == [1, 2, 3]
+    # Every kept point still pairs with its original label
+    for label, value in zip(new_labels, new_datasets[1]['data']):
+        assert value == (int(label[1:]) * 7919) % 101
+    assert len(datasets[0]['data']) == n
+
+
+def test_process_charts_downsamples_line_charts(tmp_path):
+    generator = make_generator(tmp_path)
+    generator.max_chart_points = 100
+    raw_data = make_raw_data()
+    raw_data['charts'].append({
+        'title': 'Long', 'type': 'line',
+        'labels': list(range(1000)), 'datasets': [{'data': wave(1000)}]
+    })
+    raw_data['charts'].append({
+        'title': 'Pie', 'type': 'pie',
+        'labels': list(range(1000)), 'datasets': [{'data': wave(1000)}]
+    })
+    charts = generator.process_data(raw_data)['charts']
+    assert len(charts[1]['labels']) == 100
+    assert len(charts[2]['labels']) == 1000
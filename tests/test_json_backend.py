@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests that every JSON backend has the same semantics as the standard library
+"""
+
+import json
+import math
+
+import pytest
+from jinja2.utils import htmlsafe_json_dumps
+
+from tools import json_backend
+
+SAMPLES = [
+    {"title": "Sales ₹ — \"quoted\" </script>", "nested": {"b": [1, 2.5, -3e-7], "a": None}},
+    [True, False, None, 0, -1, 2 ** 53, 1e16, 0.1, "", " 😀"],
+    {"labels": [f"t{i}" for i in range(100)], "data": [i * 0.37 for i in range(100)]},
+    "plain string",
+    12345678901234567890123,
+]
+
+
+@pytest.fixture(params=json_backend.available_backends())
+def backend(request):
+    json_backend.set_backend(request.param)
+    yield request.param
+    json_backend.set_backend()
+
+
+@pytest.mark.parametrize("sample", SAMPLES)
+def test_round_trip_matches_stdlib(backend, sample):
+    text = json.dumps(sample)
+    assert json_backend.loads(text) == json.loads(text)
+    assert json_backend.loads(text.encode('utf-8')) == json.loads(text)
+    assert json.loads(json_backend.dumps(sample)) == sample
+
+
+def test_loads_accepts_what_stdlib_accepts(backend):
+    assert math.isnan(json_backend.loads('[NaN]')[0])
+    with pytest.raises(json.JSONDecodeError):
+        json_backend.loads('{"a": }')
+
+
+def test_non_finite_floats_become_null(backend):
+    assert json.loads(json_backend.dumps({"a": [1.0, float('nan'), float('inf')]})) == {"a": [1.0, None, None]}
+
+
+def test_sort_keys(backend):
+    assert json_backend.dumps({"b": 1, "a": {"d": 2, "c": 3}}, sort_keys=True) == '{"a":{"c":3,"d":2},"b":1}'
+
+
+@pytest.mark.parametrize("sample", SAMPLES)
+def test_htmlsafe_dumps_matches_jinja_tojson(backend, sample):
+    ours = str(json_backend.htmlsafe_dumps(sample))
+    for char in "<>&'":
+        assert char not in ours
+    assert json.loads(ours) == json.loads(str(htmlsafe_json_dumps(sample)))
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        json_backend.set_backend('nope')
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental JSON loader
+"""
+
+import io
+import json
+import sys
+
+import pytest
+
+from tools import json_stream
+from tools.json_stream import LazyRows, load_json_stream
+
+
+def make_document():
+    return {
+        "title": "Große Tabelle ✅",
+        "metrics": [{"name": "Users", "value": 12345.678e-3}],
+        "tables": [
+            {
+                "title": "First",
+                "rows": [[f"Zeile {i} – ü", i, i * 1.5, None, True] for i in range(200)],
+                "sortable": False
+            },
+            {"title": "Empty", "rows": []},
+            {"title": "No rows"}
+        ],
+        "cards": [{"title": "After tables", "content": "still parsed"}],
+        "alerts": []
+    }
+
+
+def expected_rows(document):
+    return [table.get("rows") for table in document["tables"]]
+
+
+@pytest.fixture(params=[5, 64 * 1024])
+def read_size(request, monkeypatch):
+    """Exercise both tiny chunks (every token split) and the default size"""
+    monkeypatch.setattr(json_stream, "READ_SIZE", request.param)
+    return request.param
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_matches_json_load(tmp_path, read_size, indent):
+    document = make_document()
+    path = tmp_path / "input.json"
+    path.write_text(json.dumps(document, indent=indent, ensure_ascii=False), encoding="utf-8")
+
+    data = load_json_stream(str(path))
+
+    assert isinstance(data["tables"][0]["rows"], LazyRows)
+    assert len(data["tables"][0]["rows"]) == 200
+    for table, rows in zip(data["tables"], expected_rows(document)):
+        if rows is not None:
+            assert list(table["rows"]) == rows
+            # Views can be iterated more than once
+            assert list(table["rows"]) == rows
+        table.pop("rows", None)
+    stripped = json.loads(json.dumps(document))
+    for table in stripped["tables"]:
+        table.pop("rows", None)
+    assert data == stripped
+
+
+def test_reads_stdin(monkeypatch):
+    document = make_document()
+    raw = json.dumps(document, ensure_ascii=False).encode("utf-8")
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(raw), encoding="utf-8"))
+
+    data = load_json_stream("-")
+    assert list(data["tables"][0]["rows"]) == document["tables"][0]["rows"]
+    assert data["cards"] == document["cards"]
+
+
+@pytest.mark.parametrize("text", ['{"title": "x",}', '{"tables": [{"rows": [1, 2}]}', '{"a": 1} 2'])
+def test_rejects_invalid_json(tmp_path, text):
+    path = tmp_path / "bad.json"
+    path.write_text(text, encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError):
+        load_json_stream(str(path))
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Tests for live dashboard deltas and the server-sent events endpoints
+"""
+
+import copy
+import json
+import threading
+import urllib.request
+
+import pytest
+
+from tools.live import LiveFeed, diff_dashboards
+from tools.server import create_server
+from tests.test_rendering import make_generator, make_raw_data
+
+
+@pytest.fixture
+def generator(tmp_path):
+    return make_generator(tmp_path)
+
+
+def test_unchanged_data_has_no_delta(generator):
+    assert diff_dashboards(generator.process_data(make_raw_data()),
+                           generator.process_data(make_raw_data())) is None
+
+
+def test_metric_and_alert_deltas(generator):
+    raw_data = make_raw_data()
+    old = generator.process_data(copy.deepcopy(raw_data))
+    raw_data['metrics'][0]['value'] = "2,000"
+    raw_data['alerts'] = []
+    delta = diff_dashboards(old, generator.process_data(raw_data))
+    assert delta['metrics'] == [[0, dict(old['metrics'][0], value="2,000")]]
+    assert delta['alerts'] == []
+    assert 'charts' not in delta and 'timestamp' in delta
+
+
+def test_appended_chart_points(generator):
+    raw_data = make_raw_data()
+    old = generator.process_data(copy.deepcopy(raw_data))
+    raw_data['charts'][0]['labels'] += ["Apr", "May"]
+    raw_data['charts'][0]['datasets'][0]['data'] += [40, 50]
+    delta = diff_dashboards(old, generator.process_data(raw_data))
+    assert delta['charts'] == [{'id': 'chart_1', 'append': {'labels': ["Apr", "May"], 'data': [[40, 50]]}}]
+
+
+def test_rewritten_chart_points_are_replaced(generator):
+    raw_data = make_raw_data()
+    old = generator.process_data(copy.deepcopy(raw_data))
+    raw_data['charts'][0]['datasets'][0]['data'] = [11, 20, 30]
+    change = diff_dashboards(old, generator.process_data(raw_data))['charts'][0]
+    assert change['replace']['datasets'][0]['data'] == [11, 20, 30]
+
+
+def test_packed_chart_points_are_replaced(generator):
+    generator.chart_encoding = "float64"
+    raw_data = make_raw_data()
+    old = generator.process_data(copy.deepcopy(raw_data))
+    raw_data['charts'][0]['labels'] += ["Apr"]
+    raw_data['charts'][0]['datasets'][0]['data'] += [40]
+    change = diff_dashboards(old, generator.process_data(raw_data))['charts'][0]
+    assert change['replace']['datasets'][0]['data']['length'] == 4
+
+
+@pytest.mark.parametrize("change", [
+    lambda raw: raw['tables'][0]['rows'].append(["New", "1"]),
+    lambda raw: raw['metrics'].append({"name": "Extra", "value": 1}),
+    lambda raw: raw['charts'][0].update(type="bar"),
+])
+def test_structural_changes_reload(generator, change):
+    raw_data = make_raw_data()
+    old = generator.process_data(copy.deepcopy(raw_data))
+    change(raw_data)
+    assert diff_dashboards(old, generator.process_data(raw_data)) == {'reload': True}
+
+
+def test_feed_history_and_catch_up(generator):
+    feed = LiveFeed(history=2)
+    raw_data = make_raw_data()
+    feed.publish(generator.process_data(raw_data))
+    for value in ("1", "2", "3"):
+        raw_data['metrics'][0]['value'] = value
+        feed.publish(generator.process_data(raw_data))
+
+    assert feed.version == 4
+    assert [version for version, _ in feed.wait(2, timeout=0)] == [3, 4]
+    # Version 1 is older than the remembered history
+    assert feed.wait(1, timeout=0) == [(4, {'reload': True})]
+    assert feed.wait(4, timeout=0) == []
+
+
+def test_live_server_pushes_deltas(generator):
+    raw_data = make_raw_data()
+    feed = LiveFeed()
+    feed.publish(generator.process_data(raw_data))
+    server = create_server('127.0.0.1', 0, generator=generator, live=feed)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    base_url = f"http://{host}:{port}"
+    try:
+        with urllib.request.urlopen(f"{base_url}/") as response:
+            page = response.read().decode('utf-8')
+        assert 'connectLive("/events?since=1")' in page
+
+        events = urllib.request.urlopen(f"{base_url}/events?since=1", timeout=5)
+        assert events.headers['Content-Type'] == 'text/event-stream'
+        assert events.readline() == b'retry: 2000\n'
+
+        raw_data['metrics'][0]['value'] = "5,678"
+        request = urllib.request.Request(f"{base_url}/update", data=json.dumps(raw_data).encode(),
+                                         method='POST')
+        with urllib.request.urlopen(request) as response:
+            assert json.loads(response.read()) == {'version': 2, 'changed': ['metrics']}
+
+        lines = [events.readline() for _ in range(5)]
+        assert lines[1:4] == [b'id: 2\n', b'event: delta\n', lines[3]]
+        delta = json.loads(lines[3][len(b'data: '):])
+        assert delta['metrics'][0][1]['value'] == "5,678"
+        events.close()
+    finally:
+        server.shutdown()
+        server.server_close()
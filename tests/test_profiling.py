@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for render pipeline profiling
+"""
+
+import json
+import pstats
+
+from tools.profiling import Profiler, cprofile_to, data_counts
+from tests.test_rendering import make_generator, make_raw_data
+
+
+def test_generator_reports_each_stage(tmp_path):
+    generator = make_generator(tmp_path)
+    generator.profiler = Profiler()
+    input_path = tmp_path / "data.json"
+    input_path.write_text(json.dumps(make_raw_data(rows=7)), encoding="utf-8")
+
+    data = generator.process_data(generator.load_json_data(str(input_path)))
+    output_path = generator.generate_dashboard(data, "dash.html")
+
+    records = {r['stage']: r for r in generator.profiler.records}
+    assert list(records) == ['load', 'process', 'compile', 'context', 'render', 'write']
+    assert records['load']['bytes_in'] == input_path.stat().st_size
+    assert records['process']['rows'] == 7 and records['process']['points'] == 3
+    assert records['write']['bytes_out'] == output_path.stat().st_size
+    assert all(r['wall_ms'] >= 0 and r['cpu_ms'] >= 0 for r in records.values())
+
+
+def test_streaming_and_incremental_stages(tmp_path):
+    generator = make_generator(tmp_path)
+    generator.profiler = Profiler()
+    generator.incremental = True
+    generator.generate_dashboard(generator.process_data(make_raw_data()), "dash.html", stream=True)
+    stages = [r['stage'] for r in generator.profiler.records]
+    assert stages == ['process', 'compile', 'context', 'fragments', 'render+write']
+    assert generator.profiler.records[3]['rendered'] == 7
+
+
+def test_memory_and_output_formats():
+    profiler = Profiler(memory=True)
+    try:
+        with profiler.stage('allocate') as stage:
+            block = bytearray(4 * 1024 * 1024)
+            stage['bytes_out'] = len(block)
+    finally:
+        profiler.close()
+    assert profiler.records[0]['peak_bytes'] >= 4 * 1024 * 1024
+
+    lines = [json.loads(line) for line in profiler.json_lines().splitlines()]
+    assert [line['stage'] for line in lines] == ['allocate', 'total']
+    summary = profiler.summary()
+    assert 'bytes_out=4,194,304' in summary and summary.splitlines()[-1].startswith('total')
+
+
+def test_data_counts_skip_unsized_rows():
+    data = {'tables': [{'rows': [[1], [2]]}, {'rows': iter([[3]])}],
+            'charts': [{'datasets': [{'data': [1, 2, 3]}, {'data': [4]}]}]}
+    assert data_counts(data) == {'metrics': 0, 'charts': 1, 'points': 4, 'tables': 2, 'rows': 2}
+
+
+def test_cprofile_dump(tmp_path):
+    path = tmp_path / "render.prof"
+    with cprofile_to(path):
+        sum(range(1000))
+    assert pstats.Stats(str(path)).total_calls > 0
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Tests for the content-addressed render cache
+"""
+
+import json
+import os
+import stat
+
+from tools.render_cache import FragmentCache, RenderCache, content_key
+from tools.json_stream import LazyRows
+from tests.test_rendering import make_generator, make_raw_data
+
+
+def test_key_ignores_timestamp_but_not_content(tmp_path):
+    generator = make_generator(tmp_path)
+    first = generator.process_data(make_raw_data())
+    second = dict(first, timestamp="1999-01-01 00:00:00")
+    changed = generator.process_data(make_raw_data(rows=4))
+
+    assert content_key(first, "v1") == content_key(second, "v1")
+    assert content_key(first, "v1") != content_key(first, "v2")
+    assert content_key(first, "v1") != content_key(changed, "v1")
+
+
+def test_key_hashes_lazy_rows_without_loading_them(tmp_path, monkeypatch):
+    generator = make_generator(tmp_path)
+    loaded = []
+    for index, rows in enumerate([50, 50, 51]):
+        input_path = tmp_path / f"input{index}.json"
+        input_path.write_text(json.dumps(make_raw_data(rows=rows)), encoding="utf-8")
+        loaded.append(generator.process_data(generator.load_json_stream(str(input_path))))
+    assert isinstance(loaded[0]["tables"][0]["rows"], LazyRows)
+
+    # list() sizes its result with len(); rows must be streamed into the hash instead
+    def no_list(self):
+        raise AssertionError("rows materialized")
+    monkeypatch.setattr(LazyRows, "__len__", no_list)
+    first, same, changed = (content_key(data, "v1") for data in loaded)
+    assert first == same != changed
+
+
+def test_key_skips_one_shot_iterators(tmp_path):
+    generator = make_generator(tmp_path)
+    raw_data = make_raw_data()
+    raw_data["tables"][0]["rows"] = iter([["a", "1"]])
+    assert content_key(generator.process_data(raw_data), "v1") is None
+
+
+def test_generate_dashboard_reuses_unchanged_render(tmp_path):
+    generator = make_generator(tmp_path)
+    generator.use_cache = True
+
+    output_path = generator.generate_dashboard(generator.process_data(make_raw_data()), "cached.html")
+    assert not generator.cache_hit
+    mtime = output_path.stat().st_mtime_ns
+
+    generator.generate_dashboard(generator.process_data(make_raw_data()), "cached.html")
+    assert generator.cache_hit
+    assert output_path.stat().st_mtime_ns == mtime
+
+    # A deleted output is restored from the cache without rendering
+    output_path.unlink()
+    generator.generate_dashboard(generator.process_data(make_raw_data()), "cached.html")
+    assert generator.cache_hit
+    assert "<td>Product 2</td>" in output_path.read_text(encoding="utf-8")
+
+    generator.generate_dashboard(generator.process_data(make_raw_data(rows=5)), "cached.html")
+    assert not generator.cache_hit
+    assert "<td>Product 4</td>" in output_path.read_text(encoding="utf-8")
+
+
+def test_restore_replaces_output_overwritten_without_the_cache(tmp_path):
+    generator = make_generator(tmp_path)
+    generator.use_cache = True
+    first = make_raw_data()
+    generator.generate_dashboard(generator.process_data(first), "page.html")
+
+    # An uncached render of other data (e.g. --no-cache) does not update the marker
+    generator.use_cache = False
+    other = dict(make_raw_data(), title="Other Dashboard")
+    output_path = generator.generate_dashboard(generator.process_data(other), "page.html")
+    assert "<h1>Other Dashboard</h1>" in output_path.read_text(encoding="utf-8")
+
+    generator.use_cache = True
+    generator.generate_dashboard(generator.process_data(first), "page.html")
+    assert generator.cache_hit
+    assert "<h1>Test Dashboard</h1>" in output_path.read_text(encoding="utf-8")
+
+    # A truncated file (e.g. a failed streaming render) is replaced too
+    output_path.write_text("<!DOCTYPE html><html>", encoding="utf-8")
+    generator.generate_dashboard(generator.process_data(first), "page.html")
+    assert "<h1>Test Dashboard</h1>" in output_path.read_text(encoding="utf-8")
+
+
+def test_restored_output_keeps_a_normal_file_mode(tmp_path):
+    generator = make_generator(tmp_path)
+    generator.use_cache = True
+    output_path = generator.generate_dashboard(generator.process_data(make_raw_data()), "cached.html")
+    mode = stat.S_IMODE(output_path.stat().st_mode)
+
+    output_path.unlink()
+    generator.generate_dashboard(generator.process_data(make_raw_data()), "cached.html")
+    assert generator.cache_hit
+    assert stat.S_IMODE(output_path.stat().st_mode) == mode
+
+    # An existing output keeps its own mode when the cached render replaces it
+    output_path.write_text("stale", encoding="utf-8")
+    output_path.chmod(0o640)
+    generator.generate_dashboard(generator.process_data(make_raw_data()), "cached.html")
+    assert stat.S_IMODE(output_path.stat().st_mode) == 0o640
+
+
+def test_lru_eviction(tmp_path):
+    cache = RenderCache(tmp_path / "cache", max_entries=2)
+    for index, key in enumerate(["a", "b", "c"]):
+        output_path = tmp_path / f"{key}.html"
+        output_path.write_text(key, encoding="utf-8")
+        cache.store(key, output_path)
+        os.utime(cache._entry(key), (index, index))
+        if key == "b":
+            # Touching "a" makes "b" the least recently used entry
+            assert cache.restore("a", tmp_path / "a.html")
+            os.utime(cache._entry("a"), (10, 10))
+    cache.evict()
+    assert sorted(p.stem for p in cache.entries_dir.glob("*.html")) == ["a", "c"]
+
+
+def test_fragment_cache_memory_and_disk(tmp_path):
+    cache = FragmentCache(tmp_path / "fragments")
+    key = cache.key([{"name": "Users", "value": "1"}], "v1")
+    assert key != cache.key([{"name": "Users", "value": "2"}], "v1")
+    assert key != cache.key([{"name": "Users", "value": "1"}], "v2")
+    assert cache.get(key) is None
+    cache.put(key, "<div>1</div>")
+    assert cache.get(key) == "<div>1</div>"
+    # A new cache over the same directory (e.g. the next run) sees it too
+    assert FragmentCache(tmp_path / "fragments").get(key) == "<div>1</div>"
+
+
+def test_fragment_cache_memory_limit():
+    cache = FragmentCache(memory_chars=10)
+    cache.put("a", "x" * 6)
+    cache.put("b", "y" * 6)
+    assert cache.get("a") is None
+    assert cache.get("b") == "y" * 6
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Rendering tests for Dashboard Generator
+Covers template caching and the render paths of dashboard_generator.py
+"""
+
+import json
+import os
+
+import pytest
+
+import dashboard_generator
+from dashboard_generator import DashboardGenerator
+
+
+def make_generator(tmp_path):
+    """Create a generator that writes into a temporary directory"""
+    generator = DashboardGenerator()
+    generator.template_dir = tmp_path / "templates"
+    generator.output_dir = tmp_path / "output"
+    generator.ensure_directories()
+    return generator
+
+
+def make_raw_data(rows=3):
+    """Create a small dashboard input with every section populated"""
+    return {
+        "title": "Test Dashboard",
+        "description": "Rendering test fixture",
+        "metrics": [
+            {"name": "Users", "value": "1,234", "change": "+5%", "trend": "up"}
+        ],
+        "charts": [
+            {
+                "title": "Growth",
+                "type": "line",
+                "labels": ["Jan", "Feb", "Mar"],
+                "datasets": [{"label": "Growth", "data": [10, 20, 30]}]
+            }
+        ],
+        "tables": [
+            {
+                "title": "Products",
+                "headers": ["Product", "Sales"],
+                "rows": [[f"Product {i}", str(i * 10)] for i in range(rows)]
+            }
+        ],
+        "cards": [{"title": "Status", "content": "All good", "icon": "✅"}],
+        "alerts": [{"type": "info", "message": "Heads up", "icon": "info-circle"}]
+    }
+
+
+def test_template_compiled_once_per_process(tmp_path):
+    first = make_generator(tmp_path)
+    second = make_generator(tmp_path)
+    assert first.get_template() is second.get_template()
+
+
+def test_template_bytecode_cached_on_disk(tmp_path):
+    generator = make_generator(tmp_path)
+    generator.get_template()
+    assert list(generator.template_dir.glob("__jinja2_*.cache"))
+
+    # A fresh environment (as in a new process) loads the cached bytecode
+    dashboard_generator._environments.pop(str(generator.template_dir))
+    template = generator.get_template()
+    assert "Test Dashboard" in template.render(**generator.process_data(make_raw_data()))
+
+
+def test_stale_template_bytecode_is_evicted(tmp_path):
+    from tools.render_cache import DEFAULT_MAX_BYTECODE_ENTRIES
+    generator = make_generator(tmp_path)
+    generator.get_template()
+    current = list(generator.template_dir.glob("__jinja2_*.cache"))
+
+    # Entries left behind by earlier template versions
+    for index in range(DEFAULT_MAX_BYTECODE_ENTRIES):
+        stale = generator.template_dir / f"__jinja2_stale{index}.cache"
+        stale.write_bytes(b"")
+        os.utime(stale, (index, index))
+    # Loading the current template (as in a new process) marks it recently used
+    dashboard_generator._environments.pop(str(generator.template_dir))
+    generator.get_template()
+    generator.get_stitch_template()
+
+    remaining = set(generator.template_dir.glob("__jinja2_*.cache"))
+    assert len(remaining) == DEFAULT_MAX_BYTECODE_ENTRIES
+    assert set(current) <= remaining
+    assert not (generator.template_dir / "__jinja2_stale0.cache").exists()
+
+
+def test_precompiled_templates_load_without_compiling(tmp_path, monkeypatch):
+    generator = make_generator(tmp_path)
+    paths = generator.precompile_templates()
+    assert len(paths) == 2
+
+    # A fresh environment imports the modules instead of compiling source
+    import jinja2
+    def fail(*args, **kwargs):
+        raise AssertionError("template compiled from source")
+    monkeypatch.setattr(jinja2.Environment, "compile", fail)
+    dashboard_generator._environments.pop(str(generator.template_dir), None)
+    data = generator.process_data(make_raw_data())
+    output_path = generator.generate_dashboard(data, "dashboard.html")
+    assert "Test Dashboard" in output_path.read_text(encoding="utf-8")
+
+
+def test_stale_precompiled_templates_fall_back_to_source(tmp_path, monkeypatch):
+    generator = make_generator(tmp_path)
+    generator.precompile_templates()
+    dashboard_generator._environments.pop(str(generator.template_dir), None)
+
+    edited = generator.get_dashboard_template().replace("Generated on:", "Built on:")
+    monkeypatch.setattr(generator, "get_dashboard_template", lambda: edited)
+    html = generator.render_html(generator.process_data(make_raw_data()))
+    assert "Built on:" in html
+
+
+def test_generate_dashboard_writes_html(tmp_path):
+    generator = make_generator(tmp_path)
+    data = generator.process_data(make_raw_data())
+    output_path = generator.generate_dashboard(data, "test.html")
+    html = output_path.read_text(encoding="utf-8")
+    assert "<h1>Test Dashboard</h1>" in html
+    assert "<td>Product 2</td>" in html
+
+
+def test_charts_embedded_as_one_spec_array(tmp_path):
+    generator = make_generator(tmp_path)
+    raw_data = make_raw_data()
+    raw_data['charts'].append({"title": "Share", "type": "pie", "labels": ["a", "b"],
+                               "datasets": [{"data": [1, 2]}]})
+    html = generator.render_html(generator.process_data(raw_data))
+
+    specs = json.loads(html.split('<script type="application/json" id="chart-specs">')[1].split('</script>')[0])
+    assert [(spec['id'], spec['type']) for spec in specs] == [('chart_1', 'line'), ('chart_2', 'pie')]
+    assert specs[0]['labels'] == ["Jan", "Feb", "Mar"]
+    # Charts are built lazily by the page script, not inline per chart
+    assert html.count('new Chart(') == 1
+    assert 'initCharts();' in html
+
+
+def test_stream_dashboard_matches_render(tmp_path):
+    generator = make_generator(tmp_path)
+    data = generator.process_data(make_raw_data(rows=500))
+    rendered = generator.generate_dashboard(data, "rendered.html")
+    streamed = generator.generate_dashboard(data, "streamed.html", stream=True)
+    assert streamed.read_text(encoding="utf-8") == rendered.read_text(encoding="utf-8")
+
+
+def test_stream_dashboard_consumes_rows_lazily(tmp_path):
+    generator = make_generator(tmp_path)
+    raw_data = make_raw_data()
+    raw_data["tables"][0]["rows"] = ([f"Row {i}", str(i)] for i in range(1000))
+    data = generator.process_data(raw_data)
+    output_path = generator.stream_dashboard(data, "lazy.html", buffer_size=256)
+    assert "<td>Row 999</td>" in output_path.read_text(encoding="utf-8")
+
+
+def test_stream_dashboard_from_incremental_loader(tmp_path):
+    generator = make_generator(tmp_path)
+    input_path = tmp_path / "input.json"
+    input_path.write_text(json.dumps(make_raw_data(rows=50)), encoding="utf-8")
+
+    data = generator.process_data(generator.load_json_stream(str(input_path)))
+    html = generator.stream_dashboard(data, "incremental.html").read_text(encoding="utf-8")
+    assert "<td>Product 49</td>" in html
+
+
+def test_large_tables_are_embedded_and_paginated(tmp_path):
+    generator = make_generator(tmp_path)
+    generator.large_table_threshold = 10
+    data = generator.process_data(make_raw_data(rows=11))
+    assert data['tables'][0]['large']
+
+    html = generator.render_html(data)
+    assert "<td>Product 0</td>" not in html
+    assert '<script type="application/json" id="table1-data">[["Product 0","0"],' in html
+    assert "initLargeTable('table1', 100);" in html
+
+
+def test_small_tables_render_rows(tmp_path):
+    generator = make_generator(tmp_path)
+    generator.large_table_threshold = 10
+    data = generator.process_data(make_raw_data(rows=10))
+    assert not data['tables'][0]['large']
+    assert "<td>Product 9</td>" in generator.render_html(data)
+
+
+def test_embedded_rows_cannot_close_the_script(tmp_path):
+    generator = make_generator(tmp_path)
+    generator.large_table_threshold = 0
+    raw_data = make_raw_data()
+    raw_data['tables'][0]['rows'] = [["</script><b>x</b>", "&"]]
+    html = generator.render_html(generator.process_data(raw_data))
+    assert "</script><b>" not in html
+    assert '\\u003c/script\\u003e' in html
+
+
+def test_shared_assets_written_once_and_linked(tmp_path):
+    generator = make_generator(tmp_path)
+    generator.shared_assets = True
+    data = generator.process_data(make_raw_data())
+
+    first = generator.generate_dashboard(data, "first.html").read_text(encoding="utf-8")
+    (generator.output_dir / "team").mkdir()
+    nested = generator.generate_dashboard(data, "team/second.html", stream=True).read_text(encoding="utf-8")
+
+    css = sorted(generator.output_dir.glob("dashboard.*.css"))
+    js = sorted(generator.output_dir.glob("dashboard.*.js"))
+    assert len(css) == len(js) == 1
+    assert f'<link rel="stylesheet" href="{css[0].name}">' in first
+    assert f'<script src="{js[0].name}"></script>' in first
+    assert f'href="../{css[0].name}"' in nested
+    assert ".metric-card" not in first
+    assert "function searchTable" in js[0].read_text(encoding="utf-8")
+
+
+def test_cached_shared_asset_pages_link_from_their_own_directory(tmp_path):
+    generator = make_generator(tmp_path)
+    generator.shared_assets = True
+    generator.use_cache = True
+    data = generator.process_data(make_raw_data())
+
+    generator.generate_dashboard(data, "first.html")
+    for asset in generator.output_dir.glob("dashboard.*"):
+        asset.unlink()
+    (generator.output_dir / "team").mkdir()
+    nested = generator.generate_dashboard(data, "team/second.html")
+    assert not generator.cache_hit
+    css = next(generator.output_dir.glob("dashboard.*.css"))
+    assert f'href="../{css.name}"' in nested.read_text(encoding="utf-8")
+
+    # A cache hit re-creates asset files that were removed
+    css.unlink()
+    generator.generate_dashboard(data, "first.html")
+    assert generator.cache_hit
+    assert css.exists()
+
+
+def test_inline_assets_by_default(tmp_path):
+    generator = make_generator(tmp_path)
+    html = generator.render_html(generator.process_data(make_raw_data()))
+    assert ".metric-card {" in html
+    assert "function searchTable" in html
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_incremental_render_matches_full_render(tmp_path, stream):
+    generator = make_generator(tmp_path)
+    data = generator.process_data(make_raw_data(rows=20))
+    full = generator.generate_dashboard(data, "full.html", stream=stream)
+
+    generator.incremental = True
+    incremental = generator.generate_dashboard(data, "inc.html", stream=stream)
+    assert incremental.read_text(encoding="utf-8") == full.read_text(encoding="utf-8")
+    assert generator.fragment_stats == {'rendered': 7, 'reused': 0}
+
+
+def test_incremental_render_only_changed_sections(tmp_path):
+    generator = make_generator(tmp_path)
+    generator.incremental = True
+    raw_data = make_raw_data()
+    generator.render_html(generator.process_data(raw_data))
+
+    raw_data['metrics'][0]['value'] = "9,999"
+    html = generator.render_html(generator.process_data(raw_data))
+    assert generator.fragment_stats == {'rendered': 1, 'reused': 6}
+    assert "9,999" in html and "1,234" not in html
+
+    raw_data['charts'][0]['datasets'][0]['data'].append(40)
+    raw_data['charts'][0]['labels'].append("Apr")
+    generator.render_html(generator.process_data(raw_data))
+    # The chart markup and the chart script both depend on the chart data
+    assert generator.fragment_stats == {'rendered': 2, 'reused': 5}
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Tests for the table search index
+"""
+
+import json
+import re
+
+from tools.search import search_index
+from tools.json_stream import load_json_stream
+from tests.test_rendering import make_generator, make_raw_data
+
+
+def embedded_index(html, table_id="table1"):
+    match = re.search(rf'<script type="application/json" id="{table_id}-index">(.*?)</script>', html)
+    return json.loads(match.group(1)) if match else None
+
+
+def test_rows_are_normalized_per_cell():
+    rows = [["Widget A", "₹2,45,000", None], ["MIXED case", 42, True]]
+    assert search_index(rows) == ["widget a\n₹2,45,000\n", "mixed case\n42\ntrue"]
+
+
+def test_index_embedded_for_searchable_tables(tmp_path):
+    generator = make_generator(tmp_path)
+    raw = make_raw_data(rows=3)
+    raw["tables"].append({"title": "Hidden", "headers": ["A"], "rows": [["x"]], "searchable": False})
+    html = generator.render_html(generator.process_data(raw))
+
+    assert embedded_index(html) == ["product 0\n0", "product 1\n10", "product 2\n20"]
+    assert embedded_index(html, "table2") is None
+    assert 'oninput="scheduleSearch(this, \'table1\')"' in html
+
+
+def test_large_tables_are_indexed_by_the_page(tmp_path):
+    # Their rows are already embedded as data, so the index is not repeated
+    generator = make_generator(tmp_path)
+    generator.large_table_threshold = 2
+    html = generator.render_html(generator.process_data(make_raw_data(rows=5)))
+    assert embedded_index(html) is None
+    assert 'id="table1-data"' in html
+
+
+def test_streamed_tables_are_indexed_by_the_page(tmp_path):
+    generator = make_generator(tmp_path)
+    path = tmp_path / "input.json"
+    path.write_text(json.dumps(make_raw_data(rows=3)), encoding="utf-8")
+    data = generator.process_data(load_json_stream(str(path)))
+    assert data["tables"][0]["search_index"] is None
+    assert embedded_index(generator.render_html(data)) is None
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tests for the dashboard render server (localhost only)
+"""
+
+import gzip
+import json
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tools.server import create_server
+from tests.test_rendering import make_generator, make_raw_data
+
+
+@pytest.fixture
+def base_url(tmp_path):
+    server = create_server('127.0.0.1', 0, generator=make_generator(tmp_path))
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    yield f"http://{host}:{port}"
+    server.shutdown()
+    server.server_close()
+
+
+def post(url, body, headers=None):
+    request = urllib.request.Request(url, data=body, headers=headers or {}, method='POST')
+    with urllib.request.urlopen(request) as response:
+        return response.status, dict(response.headers), response.read()
+
+
+def get_json(url):
+    with urllib.request.urlopen(url) as response:
+        return json.loads(response.read())
+
+
+def test_render_returns_html(base_url):
+    status, headers, body = post(f"{base_url}/render", json.dumps(make_raw_data()).encode())
+    assert status == 200
+    assert headers['Content-Type'].startswith('text/html')
+    assert b"<h1>Test Dashboard</h1>" in body
+
+
+def test_render_gzip(base_url):
+    status, headers, body = post(f"{base_url}/render", json.dumps(make_raw_data()).encode(),
+                                 {'Accept-Encoding': 'gzip'})
+    assert headers['Content-Encoding'] == 'gzip'
+    assert b"<h1>Test Dashboard</h1>" in gzip.decompress(body)
+
+
+def test_concurrent_requests_and_stats(base_url):
+    body = json.dumps(make_raw_data()).encode()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        statuses = list(pool.map(lambda _: post(f"{base_url}/render", body)[0], range(16)))
+    assert statuses == [200] * 16
+
+    with pytest.raises(urllib.error.HTTPError) as excinfo:
+        post(f"{base_url}/render", b"{not json")
+    assert excinfo.value.code == 400
+
+    stats = get_json(f"{base_url}/stats")
+    assert stats['requests'] == 17
+    assert stats['errors'] == 1
+    assert stats['p50_ms'] is not None and stats['max_ms'] >= stats['p50_ms']
+
+
+def test_unknown_path(base_url):
+    with pytest.raises(urllib.error.HTTPError) as excinfo:
+        get_json(f"{base_url}/nope")
+    assert excinfo.value.code == 404
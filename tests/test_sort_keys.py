@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Tests for the precomputed table sort orders
+"""
+
+import json
+import re
+
+import pytest
+
+from tools.sort_keys import column_order, parse_sort_key, sort_orders
+from tests.test_rendering import make_generator, make_raw_data
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("₹2,45,000", 245000),
+    ("+15%", 15),
+    ("-3.5 %", -3.5),
+    ("$1,234.50", 1234.5),
+    ("3:45", 225),
+    ("1:02:03", 3723),
+    (42, 42),
+    ("Product 1", None),
+    ("٣", None),
+    ("١:٣٠", None),
+    ("", None),
+    (True, None),
+    (None, None),
+])
+def test_parse_sort_key(value, expected):
+    assert parse_sort_key(value) == expected
+
+
+def test_formatted_numbers_sort_numerically():
+    # parseFloat-style sorting put "₹2,45,000" first (NaN) and 10% before 9%
+    assert column_order(["₹2,45,000", "₹89,000", "₹1,98,000"]) == [1, 2, 0]
+    assert column_order(["+10%", "-2%", "+9%"]) == [1, 2, 0]
+    assert column_order(["10:05", "9:59", "1:00:00"]) == [1, 0, 2]
+
+
+def test_text_columns_are_left_to_the_page():
+    # The page orders text with Intl.Collator, which Python cannot reproduce
+    assert column_order(["Zoe", "Émile", "adam", "Ölkers", "Bob"]) is None
+    # One unparseable cell makes the whole column text
+    assert column_order(["10", "9", "n/a"]) is None
+    # Blanks sort last and ties keep row order
+    assert column_order([2, None, 1, "", 2, 1]) == [2, 5, 0, 4, 1, 3]
+
+
+def test_ragged_rows():
+    assert sort_orders([["b", 2], ["a"]], 2) == [None, [0, 1]]
+
+
+def test_orders_embedded_for_sortable_tables(tmp_path):
+    generator = make_generator(tmp_path)
+    raw = make_raw_data(rows=3)
+    raw["tables"][0]["rows"] = [["A", "₹2,45,000"], ["B", "₹89,000"], ["C", "₹1,98,000"]]
+    raw["tables"].append({"title": "Fixed", "headers": ["A"], "rows": [["x"]], "sortable": False})
+    html = generator.render_html(generator.process_data(raw))
+
+    match = re.search(r'<script type="application/json" id="table1-order">(.*?)</script>', html)
+    assert json.loads(match.group(1)) == [None, [1, 2, 0]]
+    assert 'id="table2-order"' not in html
+
+
+def test_large_tables_are_sorted_by_the_page(tmp_path):
+    generator = make_generator(tmp_path)
+    generator.large_table_threshold = 2
+    data = generator.process_data(make_raw_data(rows=5))
+    assert data["tables"][0]["sort_orders"] is None
+    assert 'id="table1-order"' not in generator.render_html(data)
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Startup guard: --help and --sample must not import the heavy or optional
+modules that only rendering needs. The import time budget is wall-clock and
+machine dependent, so it is checked by python -m tools.importtime rather
+than here.
+"""
+
+import pytest
+
+from tools.importtime import SCRIPT, measure, parse_importtime
+
+
+def _stat(path):
+    return path.stat().st_mtime_ns if path.exists() else None
+
+
+@pytest.mark.parametrize("args", [["--help"], ["--sample"]])
+def test_cli_startup_imports_stay_lazy(args):
+    sample_path = SCRIPT.parent / "output" / "sample_data.json"
+    before = _stat(sample_path)
+    _, modules, eager = measure(args, repeat=1)
+    assert 'argparse' in modules
+    assert eager == []
+    # The CLI runs from a temporary copy and leaves the repository alone
+    assert _stat(sample_path) == before
+
+
+def test_parse_importtime_totals_top_level_imports():
+    stderr = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       100 |        100 |   re._parser",
+        "import time:       200 |        300 | re",
+        "import time:        50 |         50 | textwrap",
+    ])
+    modules, total = parse_importtime(stderr)
+    assert modules == {'re._parser': 100, 're': 300, 'textwrap': 50}
+    assert total == 350
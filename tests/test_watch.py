@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests for input file watching
+"""
+
+import threading
+import time
+
+import pytest
+
+from tools.batch import spec_directories
+from tools.watch import InotifyWatcher, PollingWatcher, watch
+
+
+def make_watcher(kind, directory):
+    if kind == 'inotify':
+        try:
+            return InotifyWatcher([directory])
+        except (OSError, AttributeError):
+            pytest.skip("inotify not available")
+    return PollingWatcher([directory], interval=0.01)
+
+
+@pytest.fixture(params=['inotify', 'polling'])
+def kind(request):
+    return request.param
+
+
+def test_watcher_reports_changed_files(tmp_path, kind):
+    (tmp_path / "a.json").write_text("{}")
+    watcher = make_watcher(kind, tmp_path)
+    try:
+        assert watcher.changes(timeout=0.05) == set()
+        (tmp_path / "a.json").write_text('{"title": "changed"}')
+        (tmp_path / "b.json").write_text("{}")
+        changed = set()
+        deadline = time.monotonic() + 2
+        while changed != {tmp_path / "a.json", tmp_path / "b.json"} and time.monotonic() < deadline:
+            changed |= watcher.changes(timeout=0.1)
+        assert changed == {tmp_path.resolve() / "a.json", tmp_path.resolve() / "b.json"}
+    finally:
+        watcher.close()
+
+
+def test_watch_debounces_bursts(tmp_path, kind):
+    path = tmp_path / "data.json"
+    path.write_text("{}")
+    calls = []
+    stop = threading.Event()
+    thread = threading.Thread(target=watch, args=([tmp_path], calls.append),
+                              kwargs={'debounce': 0.2, 'stop': stop,
+                                      'watcher': make_watcher(kind, tmp_path)})
+    thread.start()
+    try:
+        time.sleep(0.1)
+        for i in range(5):
+            path.write_text(f'{{"n": {i}}}')
+            time.sleep(0.02)
+        deadline = time.monotonic() + 3
+        while not calls and time.monotonic() < deadline:
+            time.sleep(0.05)
+        time.sleep(0.3)
+    finally:
+        stop.set()
+        thread.join()
+    assert calls == [{path.resolve()}]
+
+
+def test_spec_directories(tmp_path):
+    (tmp_path / "data" / "eu").mkdir(parents=True)
+    input_path = tmp_path / "data" / "eu" / "north.json"
+    jobs = [(str(input_path), "north.html")]
+    assert spec_directories(str(tmp_path / "data" / "**" / "*.json"), jobs) == [
+        (tmp_path / "data").resolve(), (tmp_path / "data" / "eu").resolve()
+    ]
+    manifest = tmp_path / "manifest.jsonl"
+    manifest.write_text("")
+    assert spec_directories(str(manifest), jobs) == [tmp_path.resolve(), (tmp_path / "data" / "eu").resolve()]
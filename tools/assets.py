@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Offline Asset Bundling
+Vendors the third-party libraries the dashboard page uses (Chart.js, the
+date-fns adapter and Font Awesome) and builds a self-contained bundle that is
+inlined into the page: Font Awesome is cut down to the icons the dashboard
+references, its font is embedded as a data URI, and the result is minified
+and cached on disk keyed by the vendored files and icon set.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import re
+import tempfile
+import urllib.request
+from pathlib import Path
+
+# Local file name -> (CDN URL, sha256 of the file). Versions are pinned in the
+# URLs and kept in sync with the tags in the dashboard template; fetch_assets
+# refuses a download whose digest differs from the one recorded here, and one
+# with no digest recorded yet (it reports the digest to record).
+CHART_JS_VERSION = '4.4.1'
+DATE_ADAPTER_VERSION = '3.0.0'
+FONT_AWESOME_VERSION = '6.0.0'
+VENDOR_ASSETS = {
+    'chart.js': (
+        f'https://cdn.jsdelivr.net/npm/chart.js@{CHART_JS_VERSION}/dist/chart.umd.js',
+        None,
+    ),
+    'chartjs-adapter-date-fns.bundle.min.js': (
+        f'https://cdn.jsdelivr.net/npm/chartjs-adapter-date-fns@{DATE_ADAPTER_VERSION}'
+        '/dist/chartjs-adapter-date-fns.bundle.min.js',
+        None,
+    ),
+    'fontawesome.min.css': (
+        f'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/{FONT_AWESOME_VERSION}/css/all.min.css',
+        None,
+    ),
+    'fa-solid-900.woff2': (
+        f'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/{FONT_AWESOME_VERSION}/webfonts/fa-solid-900.woff2',
+        None,
+    ),
+}
+VENDOR_SCRIPTS = ('chart.js', 'chartjs-adapter-date-fns.bundle.min.js')
+VENDOR_STYLESHEET = 'fontawesome.min.css'
+VENDOR_FONT = 'fa-solid-900.woff2'
+# The solid face the FA6 classes use; all.min.css also declares v4/v5 aliases
+ICON_FONT_FAMILY = 'Font Awesome 6 Free'
+
+# Bump when the bundle format changes so stale cache entries are ignored
+BUNDLE_VERSION = 2
+
+_ICON_SELECTOR = re.compile(r'^\.fa-([a-z0-9-]+)::?before$')
+_ICON_CONTENT = re.compile(r'content:\s*"\\([0-9a-fA-F]+)"')
+_FONT_FAMILY = re.compile(r'font-family:\s*["\']?([^;"\'}]+)')
+_FONT_URL = re.compile(r'url\(([^)]*)\)')
+_SOURCE_MAP = re.compile(r'^\s*//[#@] sourceMappingURL=.*$', re.MULTILINE)
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+_CSS_SPACE = re.compile(r'\s*([{};:,>])\s*')
+
+
+def fetch_assets(vendor_dir):
+    """Download every vendored asset into vendor_dir; return the paths
+
+    All downloads are checked against their recorded sha256 first and nothing
+    is written unless every one matches, so a CDN file that changed (or a
+    missing digest) raises ValueError instead of reaching vendor/.
+    """
+    downloads = {}
+    mismatches = []
+    for name, (url, expected) in VENDOR_ASSETS.items():
+        with urllib.request.urlopen(url, timeout=30) as response:
+            body = response.read()
+        digest = hashlib.sha256(body).hexdigest()
+        if digest != expected:
+            mismatches.append(f"{name}: expected {expected or 'no recorded digest'}, got {digest}")
+        downloads[name] = body
+    if mismatches:
+        raise ValueError("Downloaded assets do not match VENDOR_ASSETS in tools/assets.py:\n  "
+                         + "\n  ".join(mismatches))
+    vendor_dir = Path(vendor_dir)
+    vendor_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for name, body in downloads.items():
+        path = vendor_dir / name
+        path.write_bytes(body)
+        paths.append(path)
+    return paths
+
+
+def split_css_rules(css):
+    """Split a stylesheet into top-level rules, keeping nested blocks intact"""
+    rules = []
+    depth = 0
+    start = 0
+    for index, char in enumerate(css):
+        if char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                rules.append(css[start:index + 1].strip())
+                start = index + 1
+        elif char == ';' and depth == 0:
+            # Top-level statements such as @charset
+            rules.append(css[start:index + 1].strip())
+            start = index + 1
+    return [rule for rule in rules if rule]
+
+
+def minify_css(css):
+    css = _CSS_COMMENT.sub('', css)
+    css = _CSS_SPACE.sub(r'\1', css)
+    return re.sub(r'\s+', ' ', css).replace(';}', '}').strip()
+
+
+def subset_icon_css(css, icons, font_data=None):
+    """Keep Font Awesome's base rules plus the rules for the given icons
+
+    Icon rules (".fa-name:before{content:...}") for other icons are dropped and
+    the selector lists of kept ones are trimmed. Only the Font Awesome 6 solid
+    @font-face is kept (not the v4/v5 compatibility faces over the same font
+    file); with font_data it is embedded as a woff2 data URI. Returns the CSS
+    and the set of codepoints the kept icons use.
+    """
+    kept = []
+    codepoints = set()
+    for rule in split_css_rules(minify_css(css)):
+        head, _, body = rule.partition('{')
+        if head.startswith('@font-face'):
+            family = _FONT_FAMILY.search(body)
+            if 'fa-solid-900' not in body or not family or family.group(1).strip() != ICON_FONT_FAMILY:
+                continue
+            if font_data is not None:
+                data_uri = 'data:font/woff2;base64,' + base64.b64encode(font_data).decode('ascii')
+                body = re.sub(r'src:[^;}]*', f'src:url({data_uri}) format("woff2")', body)
+            kept.append(head + '{' + body)
+            continue
+        selectors = head.split(',')
+        names = [_ICON_SELECTOR.match(s.strip()) for s in selectors]
+        if head.startswith('@') or not all(names):
+            kept.append(rule)
+            continue
+        used = [s for s, match in zip(selectors, names) if match.group(1) in icons]
+        if used:
+            kept.append(','.join(used) + '{' + body)
+            content = _ICON_CONTENT.search(body)
+            if content:
+                codepoints.add(int(content.group(1), 16))
+    return ''.join(kept), codepoints
+
+
+def subset_font(font_data, codepoints):
+    """Reduce a woff2 font to the given codepoints if fontTools is installed"""
+    try:
+        from fontTools import subset
+        from fontTools.ttLib import TTFont
+    except ImportError:  # optional dependency
+        return font_data
+    import io
+    try:
+        font = TTFont(io.BytesIO(font_data))
+        subsetter = subset.Subsetter()
+        subsetter.populate(unicodes=codepoints)
+        subsetter.subset(font)
+        font.flavor = 'woff2'
+        output = io.BytesIO()
+        font.save(output)
+        return output.getvalue()
+    except Exception:
+        # e.g. woff2 support (brotli) missing: ship the full font
+        return font_data
+
+
+def minify_js(js):
+    """Drop source map references; vendored scripts are already minified"""
+    return _SOURCE_MAP.sub('', js).strip()
+
+
+def _script_safe(text):
+    """Prevent inlined code from closing its <script> element early"""
+    return re.sub(r'</(script)', r'<\\/\1', text, flags=re.IGNORECASE)
+
+
+class AssetBundler:
+    """Builds and caches the inline asset bundle from a vendor directory"""
+
+    def __init__(self, vendor_dir, cache_dir):
+        self.vendor_dir = Path(vendor_dir)
+        self.cache_dir = Path(cache_dir)
+        self._bundles = {}
+
+    def missing(self):
+        """Names of vendored assets that have not been fetched yet"""
+        return [name for name in VENDOR_ASSETS if not (self.vendor_dir / name).exists()]
+
+    def fingerprint(self):
+        """Cheap identity of the vendored files (name, size and mtime)"""
+        h = hashlib.sha256(str(BUNDLE_VERSION).encode('ascii'))
+        for name in sorted(VENDOR_ASSETS):
+            path = self.vendor_dir / name
+            if path.exists():
+                stat = path.stat()
+                h.update(f"{name}:{stat.st_size}:{stat.st_mtime_ns};".encode('utf-8'))
+        return h.hexdigest()[:16]
+
+    def bundle(self, icons):
+        """Return {'scripts': ..., 'styles': ...} for the given icon names"""
+        missing = self.missing()
+        if missing:
+            raise FileNotFoundError(
+                f"Vendored assets missing from {self.vendor_dir}: {', '.join(missing)} "
+                "(run with --fetch-assets once while online)"
+            )
+
+        icons = sorted(set(icons))
+        key = hashlib.sha256(json.dumps([self.fingerprint(), icons]).encode('utf-8')).hexdigest()[:24]
+        bundle = self._bundles.get(key)
+        if bundle is not None:
+            return bundle
+
+        cache_path = self.cache_dir / f"bundle-{key}.json"
+        try:
+            bundle = json.loads(cache_path.read_text(encoding='utf-8'))
+        except (FileNotFoundError, ValueError):
+            bundle = self._build(icons)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix='.tmp-')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(bundle, f)
+            os.replace(tmp, cache_path)
+        self._bundles[key] = bundle
+        return bundle
+
+    def _build(self, icons):
+        css = (self.vendor_dir / VENDOR_STYLESHEET).read_text(encoding='utf-8')
+        font = (self.vendor_dir / VENDOR_FONT).read_bytes()
+        # Subset the CSS first to learn the codepoints, then the font itself
+        _, codepoints = subset_icon_css(css, icons)
+        styles, _ = subset_icon_css(css, icons, font_data=subset_font(font, codepoints))
+
+        scripts = [minify_js((self.vendor_dir / name).read_text(encoding='utf-8'))
+                   for name in VENDOR_SCRIPTS]
+        return {
+            'scripts': _script_safe(';\n'.join(scripts)),
+            'styles': styles.replace('</', '<\\/'),
+        }
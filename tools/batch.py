@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Batch Dashboard Rendering
+Renders many dashboards in one invocation using a process pool. Each worker
+keeps a single DashboardGenerator (and its compiled template) for all of the
+jobs it handles, and a failing job is reported without aborting the batch.
+"""
+
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import util as mp_util
+from pathlib import Path
+
+from dashboard_generator import DashboardGenerator
+from tools import json_backend
+
+# The generator owned by the current worker process (see _init_worker)
+_generator = None
+_options = {}
+
+
+def load_jobs(spec):
+    """Expand a batch spec into a list of (input_path, output_file) jobs
+
+    The spec is either a JSONL manifest (one {"input": ..., "output": ...}
+    object per line, output optional) or a glob pattern of input files.
+    Outputs default to the input file name with an .html extension. Raises
+    ValueError if two jobs would write the same output file (for example
+    eu/north.json and us/north.json from a recursive glob).
+    """
+    jobs = []
+    if spec.endswith('.jsonl') and os.path.isfile(spec):
+        with open(spec, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                if 'input' not in entry:
+                    raise ValueError(f"{spec}:{line_number}: manifest entry has no 'input'")
+                jobs.append((entry['input'], entry.get('output') or default_output(entry['input'])))
+    else:
+        for input_path in sorted(glob.glob(spec, recursive=True)):
+            jobs.append((input_path, default_output(input_path)))
+
+    inputs_by_output = {}
+    for input_path, output_file in jobs:
+        other = inputs_by_output.setdefault(os.path.normpath(output_file), input_path)
+        if other != input_path:
+            raise ValueError(f"{other} and {input_path} would both be written to {output_file}; "
+                             f"list them in a manifest with distinct outputs")
+    return jobs
+
+
+def default_output(input_path):
+    return Path(input_path).with_suffix('.html').name
+
+
+def spec_directories(spec, jobs):
+    """Directories to watch for changes to a batch spec and its inputs
+
+    Covers the manifest's directory or the non-wildcard base of the glob, so
+    that files added later are noticed too.
+    """
+    if spec.endswith('.jsonl') and os.path.isfile(spec):
+        base = Path(spec).parent
+    else:
+        parts = []
+        for part in Path(spec).parts:
+            if glob.has_magic(part):
+                break
+            parts.append(part)
+        base = Path(*parts) if parts else Path('.')
+        if not base.is_dir():
+            base = base.parent
+    return sorted({base.resolve()} | {Path(input_path).resolve().parent for input_path, _ in jobs})
+
+
+def load_input(input_path, stream=False):
+    """Parse an input file, raising instead of exiting on errors"""
+    if stream:
+        from tools.json_stream import load_json_stream
+        return load_json_stream(input_path)
+    with open(input_path, 'rb') as f:
+        return json_backend.loads(f.read())
+
+
+def _init_worker(options, generator_options):
+    """Create the per-worker generator and compile the template up front"""
+    global _generator, _options
+    _options = options
+    if options.get('json_backend'):
+        json_backend.set_backend(options['json_backend'])
+    _generator = DashboardGenerator(**generator_options)
+    if options.get('output_dir'):
+        _generator.output_dir = Path(options['output_dir'])
+        _generator.ensure_directories()
+    _generator.get_template()
+    if _generator.precompress:
+        # Pool workers exit without joining threads: finish the last
+        # background compression first
+        mp_util.Finalize(None, _finish_compression, exitpriority=10)
+
+
+def _finish_compression():
+    for error in _generator.wait_for_compression():
+        print(f"Compression failed: {error}", file=sys.stderr)
+
+
+def _render_job(job):
+    """Render one dashboard, returning a result record instead of raising"""
+    input_path, output_file = job
+    start = time.perf_counter()
+    result = {'input': input_path, 'output': None, 'error': None, 'cached': False}
+    try:
+        raw_data = load_input(input_path, stream=_options.get('stream', False))
+        processed_data = _generator.process_data(raw_data)
+        output_path = _generator.generate_dashboard(
+            processed_data, output_file, stream=_options.get('stream', False)
+        )
+        result['output'] = str(output_path)
+        result['cached'] = _generator.cache_hit
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    # Let this page's compression overlap the next render, but no more than that
+    warnings = _generator.wait_for_compression(pending=1)
+    if warnings:
+        result['warnings'] = warnings
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def render_batch(jobs, workers=None, on_result=None, output_dir=None, stream=False,
+                 json_backend_name=None, **generator_options):
+    """Render all jobs and return their result records in completion order
+
+    workers defaults to the CPU count; workers=1 renders in-process. Extra
+    keyword options (e.g. use_cache) are passed to each worker's
+    DashboardGenerator. If given, on_result is called with each record as
+    soon as it is available. With precompress, .gz/.br files are complete
+    when this returns.
+    """
+    workers = workers or os.cpu_count() or 1
+    options = {'output_dir': output_dir, 'stream': stream, 'json_backend': json_backend_name}
+    results = []
+
+    if workers == 1 or len(jobs) <= 1:
+        _init_worker(options, generator_options)
+        for job in jobs:
+            result = _render_job(job)
+            results.append(result)
+            if on_result:
+                on_result(result)
+        if _generator.precompress:
+            _finish_compression()
+        return results
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(options, generator_options)) as executor:
+        futures = {executor.submit(_render_job, job): job for job in jobs}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                # The worker itself died (e.g. BrokenProcessPool)
+                result = {'input': futures[future][0], 'output': None,
+                          'error': f"{type(e).__name__}: {e}", 'seconds': 0.0}
+            results.append(result)
+            if on_result:
+                on_result(result)
+    return results
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Render Benchmarks
+Generates synthetic dashboards of configurable size (N metrics, M charts of K
+points, T tables of R rows x C columns), measures the time and peak memory of
+the load, process and render stages for each scenario, and compares the run
+with a stored JSON baseline, failing when a stage regressed beyond a
+threshold.
+
+Usage (from the repository root):
+  python -m tools.benchmark --save            # record a baseline
+  python -m tools.benchmark                   # compare with it (exit 1 on regression)
+  python -m tools.benchmark --scenario large_table --repeat 5
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+from dashboard_generator import DashboardGenerator
+from tools.profiling import Profiler
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent.parent / '.benchmarks' / 'baseline.json'
+DEFAULT_THRESHOLD = 0.25
+
+# Measurements below these floors are dominated by noise and never fail
+MIN_SECONDS = 0.005
+MIN_PEAK_BYTES = 1024 * 1024
+
+SCENARIOS = {
+    'small': dict(metrics=4, charts=2, points=12, tables=1, rows=20, columns=5),
+    'many_metrics': dict(metrics=500, charts=0, points=0, tables=0, rows=0, columns=0),
+    'long_charts': dict(metrics=4, charts=8, points=20000, tables=0, rows=0, columns=0),
+    'wide_table': dict(metrics=0, charts=0, points=0, tables=1, rows=500, columns=40),
+    'large_table': dict(metrics=4, charts=1, points=100, tables=1, rows=100000, columns=6),
+}
+
+# Stages reported per scenario, built from the profiler's pipeline stages,
+# and the profiler counts their throughput is measured in
+STAGES = {
+    'load': (('load',), ('bytes_in',), 'B/s'),
+    'process': (('process',), ('rows', 'points'), 'items/s'),
+    'render': (('compile', 'context', 'fragments', 'render', 'write', 'render+write'), ('bytes_out',), 'B/s'),
+}
+
+
+def synthetic_dashboard(metrics=4, charts=2, points=12, tables=1, rows=20, columns=5, seed=0):
+    """Deterministic dashboard input of the given size
+
+    Table cells mix the formats real inputs use: names, Indian-grouped
+    currency, signed percentages, plain integers and durations.
+    """
+    rng = random.Random(seed)
+    trends = ('up', 'down', 'neutral')
+    data = {
+        'title': 'Synthetic Dashboard',
+        'description': f"{metrics} metrics, {charts} charts x {points} points, "
+                       f"{tables} tables x {rows} rows x {columns} columns",
+        'metrics': [
+            {'name': f"Metric {i}", 'value': f"{rng.randint(0, 10**6):,}",
+             'change': f"{rng.uniform(-20, 20):+.1f}%", 'trend': rng.choice(trends)}
+            for i in range(metrics)
+        ],
+        'charts': [],
+        'tables': [],
+        'cards': [{'title': 'About', 'content': 'Generated for benchmarking', 'icon': '🧪'}],
+        'alerts': [{'type': 'info', 'message': 'Synthetic data', 'icon': 'info-circle'}],
+    }
+    for c in range(charts):
+        value = 1000.0
+        series = []
+        for _ in range(points):
+            value += rng.gauss(0, 25)
+            series.append(round(value, 2))
+        data['charts'].append({
+            'title': f"Series {c}",
+            'type': 'line' if c % 2 == 0 else 'bar',
+            'labels': [f"P{i}" for i in range(points)],
+            'datasets': [{'label': f"Series {c}", 'data': series}],
+        })
+    cell_makers = (
+        lambda i: f"Item {i}",
+        lambda i: f"₹{rng.randint(0, 10**7):,}",
+        lambda i: f"{rng.uniform(-50, 50):+.1f}%",
+        lambda i: rng.randint(0, 10**6),
+        lambda i: f"{rng.randint(0, 59)}:{rng.randint(0, 59):02d}",
+    )
+    for t in range(tables):
+        makers = [cell_makers[c % len(cell_makers)] for c in range(columns)]
+        data['tables'].append({
+            'title': f"Table {t}",
+            'headers': [f"Column {c}" for c in range(columns)],
+            'rows': [[make(i) for make in makers] for i in range(rows)],
+        })
+    return data
+
+
+def _collect(profiler):
+    """Reduce profiler records to {stage: {'seconds', 'peak_bytes', 'items'}}"""
+    result = {}
+    for stage, (names, counts, _) in STAGES.items():
+        records = [r for r in profiler.records if r['stage'] in names]
+        if not records:
+            continue
+        entry = {
+            'seconds': sum(r['wall_ms'] for r in records) / 1000,
+            'items': sum(r.get(count, 0) for r in records for count in counts),
+        }
+        if profiler.memory:
+            entry['peak_bytes'] = max(r['peak_bytes'] for r in records)
+        result[stage] = entry
+    return result
+
+
+def run_scenario(params, repeat=3, work_dir=None, **generator_options):
+    """Benchmark one scenario: best-of-repeat timings plus one memory pass"""
+    with tempfile.TemporaryDirectory(dir=work_dir) as tmp:
+        tmp = Path(tmp)
+        input_path = tmp / 'input.json'
+        input_path.write_text(json.dumps(synthetic_dashboard(**params)), encoding='utf-8')
+        generator = DashboardGenerator(use_cache=False, **generator_options)
+        generator.output_dir = tmp / 'output'
+        generator.ensure_directories()
+
+        def once(profiler):
+            generator.profiler = profiler
+            data = generator.process_data(generator.load_json_data(str(input_path)))
+            generator.generate_dashboard(data, 'dashboard.html')
+            generator.wait_for_compression()
+            return _collect(profiler)
+
+        once(Profiler())  # warm up: template compile, imports
+        runs = [once(Profiler()) for _ in range(repeat)]
+        memory_profiler = Profiler(memory=True)
+        try:
+            memory = once(memory_profiler)
+        finally:
+            memory_profiler.close()
+
+    result = {}
+    for stage in runs[0]:
+        seconds = min(run[stage]['seconds'] for run in runs)
+        entry = {'seconds': round(seconds, 6), 'peak_bytes': memory[stage]['peak_bytes']}
+        if runs[0][stage]['items']:
+            entry['throughput'] = round(runs[0][stage]['items'] / max(seconds, 1e-9), 1)
+        result[stage] = entry
+    return result
+
+
+def run_benchmarks(scenarios=None, repeat=3, **generator_options):
+    """Return {scenario: {stage: measurements}} for the named scenarios"""
+    names = scenarios or list(SCENARIOS)
+    return {name: run_scenario(SCENARIOS[name], repeat=repeat, **generator_options) for name in names}
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """List regressions of results against baseline beyond threshold
+
+    Each entry is (scenario, stage, metric, baseline_value, current_value).
+    Scenarios or stages missing from the baseline are skipped.
+    """
+    regressions = []
+    for scenario, stages in results.items():
+        for stage, current in stages.items():
+            previous = baseline.get(scenario, {}).get(stage)
+            if not previous:
+                continue
+            for metric in ('seconds', 'peak_bytes'):
+                if metric not in previous or metric not in current:
+                    continue
+                floor = MIN_SECONDS if metric == 'seconds' else MIN_PEAK_BYTES
+                if current[metric] < floor:
+                    continue
+                if current[metric] > previous[metric] * (1 + threshold):
+                    regressions.append((scenario, stage, metric, previous[metric], current[metric]))
+    return regressions
+
+
+def format_results(results, baseline=None):
+    lines = [f"{'Scenario':<14} {'Stage':<8} {'Seconds':>10} {'vs base':>8} {'Peak MB':>9} {'Throughput':>22}"]
+    for scenario, stages in results.items():
+        for stage, entry in stages.items():
+            previous = (baseline or {}).get(scenario, {}).get(stage, {}).get('seconds')
+            change = f"{(entry['seconds'] / previous - 1) * 100:+.0f}%" if previous else '-'
+            rate = f"{entry['throughput']:,.0f} {STAGES[stage][2]}" if 'throughput' in entry else '-'
+            lines.append(f"{scenario:<14} {stage:<8} {entry['seconds']:>10.4f} {change:>8} "
+                         f"{entry['peak_bytes'] / (1024 * 1024):>9.1f} {rate:>22}")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark dashboard load, process and render')
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS),
+                        help='Scenario to run (repeatable; default: all)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per scenario (best is kept)')
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE, help='Baseline JSON file')
+    parser.add_argument('--save', action='store_true', help='Store this run as the baseline')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Allowed slowdown or memory growth as a fraction (default: 0.25)')
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.scenario, repeat=args.repeat)
+    baseline = None
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+    print(format_results(results, baseline))
+
+    if args.save:
+        merged = dict(baseline or {}, **results)
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(merged, indent=2, sort_keys=True) + '\n', encoding='utf-8')
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+    if baseline is None:
+        print(f"No baseline at {args.baseline}; run with --save to record one")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    for scenario, stage, metric, previous, current in regressions:
+        print(f"REGRESSION {scenario}/{stage} {metric}: {previous} -> {current}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
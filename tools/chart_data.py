@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Chart Data Preparation
+Validates and orders line and bar chart series so the page can hand them to
+Chart.js pre-parsed ({x, y} points with parsing: false and normalized: true)
+and skip its per-point parsing, sorting and uniqueness checks. Long line
+charts get a linear x axis, which is what Chart.js's decimation needs: their
+numeric labels become x values (sorted here), other labels are shown at the
+point index.
+
+pack_series optionally replaces a prepared series with a base64-encoded
+Float64 or Float32 buffer, which the page decodes into a typed array instead
+of parsing decimal JSON.
+"""
+
+import base64
+import math
+import sys
+from array import array
+
+PREPARED_CHART_TYPES = ('line', 'bar')
+
+# Line charts with more points than this get a linear x axis and decimation
+DECIMATION_MIN_POINTS = 1000
+
+# Packed dtypes and their array module typecodes
+_TYPECODES = {'float64': 'd', 'float32': 'f'}
+
+_INVALID = object()
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _clean_value(value):
+    """A y value as Chart.js takes it unparsed: a finite number or None (gap)"""
+    if value is None:
+        return None
+    if not _is_number(value):
+        return _INVALID
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def prepare_series(chart_type, labels, datasets):
+    """Return (x_scale, labels, datasets) for the pre-parsed path, or None
+
+    x_scale is 'category' (x is the label index on the usual category
+    axis), 'index' (label index on a linear axis labelled with the labels)
+    or 'linear' (numeric labels as x values, sorted ascending). None means
+    the chart does not fit the path, e.g. a dataset holds something other
+    than numbers, and it is rendered as before. The inputs are not modified.
+    """
+    if chart_type not in PREPARED_CHART_TYPES:
+        return None
+    cleaned = []
+    for dataset in datasets:
+        data = dataset.get('data')
+        if not isinstance(data, list):
+            return None
+        values = [_clean_value(value) for value in data]
+        if any(value is _INVALID for value in values):
+            return None
+        cleaned.append(dict(dataset, data=values))
+
+    n = max([len(labels)] + [len(d['data']) for d in cleaned])
+    if chart_type != 'line' or n <= DECIMATION_MIN_POINTS:
+        return 'category', labels, cleaned
+
+    aligned = all(len(d['data']) == len(labels) for d in cleaned)
+    if aligned and labels and all(_is_number(x) and math.isfinite(x) for x in labels):
+        order = sorted(range(len(labels)), key=labels.__getitem__)
+        if all(labels[a] != labels[b] for a, b in zip(order, order[1:])):
+            if order != list(range(len(labels))):
+                labels = [labels[i] for i in order]
+                cleaned = [dict(d, data=[d['data'][i] for i in order]) for d in cleaned]
+            return 'linear', labels, cleaned
+    return 'index', labels, cleaned
+
+
+def pack_series(values, dtype='float64'):
+    """Pack prepared values as base64 of little-endian floats (gaps as NaN)
+
+    Returns {'dtype', 'length', 'base64'}, the form the page decodes.
+    float32 halves the size but keeps only about 7 significant digits.
+    """
+    if None in values:
+        values = [math.nan if value is None else value for value in values]
+    packed = array(_TYPECODES[dtype], values)
+    if sys.byteorder == 'big':
+        packed.byteswap()
+    return {
+        'dtype': dtype,
+        'length': len(packed),
+        'base64': base64.b64encode(packed.tobytes()).decode('ascii'),
+    }
+
+
+def unpack_series(payload):
+    """Values of a pack_series payload, with gaps as None (mirrors the page)"""
+    packed = array(_TYPECODES[payload['dtype']])
+    packed.frombytes(base64.b64decode(payload['base64']))
+    if sys.byteorder == 'big':
+        packed.byteswap()
+    return [None if math.isnan(value) else value for value in packed]
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Columnar Table Encoding
+Encodes table rows column by column for compact embedding in a page:
+integer columns are delta-encoded, other numeric columns are stored as plain
+arrays, and string columns with many repeats are dictionary-encoded.
+decode_columns mirrors the decoder in the dashboard page.
+"""
+
+# A string column is dictionary-encoded when it has at most this fraction of
+# distinct values
+DICTIONARY_MAX_RATIO = 0.5
+
+
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _encode_column(values):
+    if values and all(_is_int(v) for v in values):
+        deltas = [values[0]]
+        deltas.extend(b - a for a, b in zip(values, values[1:]))
+        return {'type': 'delta', 'values': deltas}
+    if values and all(_is_number(v) for v in values):
+        return {'type': 'number', 'values': values}
+    if values and all(isinstance(v, str) for v in values):
+        codes = {}
+        for value in values:
+            codes.setdefault(value, len(codes))
+        if len(codes) <= len(values) * DICTIONARY_MAX_RATIO:
+            return {'type': 'dict', 'dict': list(codes), 'codes': [codes[v] for v in values]}
+    return {'type': 'raw', 'values': values}
+
+
+def encode_columns(rows):
+    """Encode an iterable of rows into a columnar payload
+
+    The rows are read once; memory use is that of the columns themselves.
+    Ragged rows are supported by recording each row's length.
+    """
+    columns = []
+    lengths = []
+    for row in rows:
+        for index, value in enumerate(row):
+            if index == len(columns):
+                # A new column: earlier (shorter) rows have no value here
+                columns.append([None] * len(lengths))
+            columns[index].append(value)
+        for column in columns[len(row):]:
+            column.append(None)
+        lengths.append(len(row))
+
+    payload = {'length': len(lengths), 'columns': [_encode_column(c) for c in columns]}
+    if any(length != len(columns) for length in lengths):
+        payload['lengths'] = lengths
+    return payload
+
+
+def _decode_column(column):
+    kind = column['type']
+    if kind == 'delta':
+        values = []
+        total = 0
+        for delta in column['values']:
+            total += delta
+            values.append(total)
+        return values
+    if kind == 'dict':
+        return [column['dict'][code] for code in column['codes']]
+    return column['values']
+
+
+def decode_columns(payload):
+    """Decode a columnar payload back into a list of rows"""
+    columns = [_decode_column(c) for c in payload['columns']]
+    rows = [list(row) for row in zip(*columns)] if columns else [[] for _ in range(payload['length'])]
+    for row, length in zip(rows, payload.get('lengths', ())):
+        del row[length:]
+    return rows
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Precompressed Output
+Writes .gz (and .br when the brotli module is installed) copies of rendered
+dashboards for static file servers. Compression runs on a background thread
+fed from the render stream, so it overlaps with rendering; the queue between
+them is bounded, so memory stays flat for large pages.
+"""
+
+import gzip
+import os
+import queue
+import threading
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9
+
+# Chunks buffered between the renderer and the compression thread
+QUEUE_SIZE = 16
+
+_ABORT = object()
+
+
+def available_formats():
+    """Compressed formats that can be produced here"""
+    return ('gz', 'br') if brotli else ('gz',)
+
+
+class _GzipSink:
+    def __init__(self, f):
+        # mtime=0 keeps output byte-identical across runs of the same page
+        self.stream = gzip.GzipFile(filename='', mode='wb', fileobj=f,
+                                    compresslevel=GZIP_LEVEL, mtime=0)
+
+    def write(self, data):
+        self.stream.write(data)
+
+    def close(self):
+        self.stream.close()
+
+
+class _BrotliSink:
+    def __init__(self, f):
+        self.f = f
+        self.compressor = brotli.Compressor(mode=brotli.MODE_TEXT, quality=BROTLI_QUALITY)
+
+    def write(self, data):
+        self.f.write(self.compressor.process(data))
+
+    def close(self):
+        self.f.write(self.compressor.finish())
+
+
+_SINKS = {'gz': _GzipSink, 'br': _BrotliSink}
+
+
+class CompressedCopies:
+    """Background writer of compressed siblings (page.html.gz, page.html.br)
+
+    Call write() with each chunk of the page as it is rendered and close()
+    at the end; wait() blocks until the files are complete and re-raises any
+    error from the compression thread. Files appear atomically when done.
+    """
+
+    def __init__(self, output_path, formats=None):
+        self.output_path = Path(output_path)
+        self.formats = formats or available_formats()
+        self.paths = [self.output_path.with_name(f"{self.output_path.name}.{fmt}")
+                      for fmt in self.formats]
+        self.error = None
+        self.queue = queue.Queue(maxsize=QUEUE_SIZE)
+        self.thread = threading.Thread(target=self._run, name=f"compress-{self.output_path.name}")
+        self.thread.start()
+
+    def write(self, text):
+        self.queue.put(text.encode('utf-8'))
+
+    def close(self, abort=False):
+        """Finish the files, or discard them with abort=True (failed render)"""
+        self.queue.put(_ABORT if abort else None)
+
+    def done(self):
+        return not self.thread.is_alive()
+
+    def wait(self):
+        self.thread.join()
+        if self.error:
+            raise self.error
+
+    def _run(self):
+        tmp_paths = [path.with_name(f".{path.name}.{os.getpid()}.tmp") for path in self.paths]
+        files = []
+        finished = False  # the renderer has sent its last chunk
+        try:
+            files = [open(tmp, 'wb') for tmp in tmp_paths]
+            sinks = [_SINKS[fmt](f) for fmt, f in zip(self.formats, files)]
+            while True:
+                data = self.queue.get()
+                if data is None or data is _ABORT:
+                    finished = True
+                if data is None:
+                    break
+                if data is _ABORT:
+                    self._discard(files, tmp_paths)
+                    return
+                for sink in sinks:
+                    sink.write(data)
+            for sink in sinks:
+                sink.close()
+            for f in files:
+                f.close()
+            for tmp, path in zip(tmp_paths, self.paths):
+                os.replace(tmp, path)
+        except BaseException as e:
+            self.error = e
+            self._discard(files, tmp_paths)
+            # Keep draining so the renderer never blocks on a full queue
+            while not finished and self.queue.get() not in (None, _ABORT):
+                pass
+
+    @staticmethod
+    def _discard(files, tmp_paths):
+        for f in files:
+            f.close()
+        for tmp in tmp_paths:
+            try:
+                os.unlink(tmp)
+            except FileNotFoundError:
+                pass
+
+
+class TeeWriter:
+    """File-like object sending text both to a file and to CompressedCopies"""
+
+    def __init__(self, f, copies):
+        self.f = f
+        self.copies = copies
+
+    def write(self, text):
+        self.f.write(text)
+        self.copies.write(text)
+
+
+def compress_file(path, formats=None, chunk_size=64 * 1024):
+    """Start compressing an existing HTML file; returns the CompressedCopies"""
+    copies = CompressedCopies(path, formats)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for chunk in iter(lambda: f.read(chunk_size), ''):
+                copies.write(chunk)
+    except BaseException:
+        copies.close(abort=True)
+        raise
+    copies.close()
+    return copies
+
+
+def is_fresh(path, formats=None):
+    """Whether every compressed sibling exists and is newer than the HTML"""
+    path = Path(path)
+    mtime = path.stat().st_mtime_ns
+    for fmt in formats or available_formats():
+        sibling = path.with_name(f"{path.name}.{fmt}")
+        if not sibling.exists() or sibling.stat().st_mtime_ns < mtime:
+            return False
+    return True
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Chart Downsampling
+Reduces long chart series with Largest-Triangle-Three-Buckets (LTTB), which
+keeps the peaks and troughs that define a line's visual shape. Uses NumPy
+when it is installed and falls back to pure Python otherwise.
+"""
+
+_UNLOADED = object()
+
+# NumPy is imported the first time a series actually needs downsampling, so
+# dashboards with short charts never pay for the import
+np = _UNLOADED
+
+
+def _numpy():
+    """The numpy module, or None if it is not installed"""
+    global np
+    if np is _UNLOADED:
+        try:
+            import numpy
+        except ImportError:  # optional dependency
+            numpy = None
+        np = numpy
+    return np
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _bucket_bounds(i, every, n):
+    """Index ranges of bucket i and of the bucket after it"""
+    start = int(i * every) + 1
+    end = int((i + 1) * every) + 1
+    next_end = min(int((i + 2) * every) + 1, n)
+    return start, end, next_end
+
+
+def _lttb_python(values, threshold):
+    n = len(values)
+    every = (n - 2) / (threshold - 2)
+    selected = [0]
+    a = 0
+    for i in range(threshold - 2):
+        start, end, next_end = _bucket_bounds(i, every, n)
+        # Average of the next bucket (the last point when there is none)
+        if end < next_end:
+            avg_x = (end + next_end - 1) / 2
+            avg_y = sum(values[end:next_end]) / (next_end - end)
+        else:
+            avg_x, avg_y = n - 1, values[n - 1]
+
+        a_y = values[a]
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = abs((a - avg_x) * (values[j] - a_y) - (a - j) * (avg_y - a_y))
+            if area > best_area:
+                best, best_area = j, area
+        selected.append(best)
+        a = best
+    selected.append(n - 1)
+    return selected
+
+
+def _lttb_numpy(values, threshold):
+    y = np.asarray(values, dtype=np.float64)
+    n = len(y)
+    every = (n - 2) / (threshold - 2)
+    cumulative = np.concatenate(([0.0], np.cumsum(y)))
+    selected = [0]
+    a = 0
+    for i in range(threshold - 2):
+        start, end, next_end = _bucket_bounds(i, every, n)
+        if end < next_end:
+            avg_x = (end + next_end - 1) / 2
+            avg_y = (cumulative[next_end] - cumulative[end]) / (next_end - end)
+        else:
+            avg_x, avg_y = n - 1, y[n - 1]
+
+        xs = np.arange(start, end)
+        areas = np.abs((a - avg_x) * (y[start:end] - y[a]) - (a - xs) * (avg_y - y[a]))
+        a = start + int(np.argmax(areas))
+        selected.append(a)
+    selected.append(n - 1)
+    return selected
+
+
+def lttb_indices(values, threshold):
+    """Return the indices of at most threshold points that best keep the shape"""
+    n = len(values)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+    if _numpy() is not None:
+        return _lttb_numpy(values, threshold)
+    return _lttb_python(values, threshold)
+
+
+def downsample_series(labels, datasets, threshold):
+    """Downsample labels and every dataset's data to a shared set of points
+
+    Each numeric dataset selects its own LTTB points and the union is kept, so
+    labels stay aligned across datasets. Returns new (labels, datasets); the
+    inputs are not modified.
+    """
+    n = max([len(labels)] + [len(d.get('data', [])) for d in datasets])
+    if n <= threshold:
+        return labels, datasets
+
+    selected = set()
+    for dataset in datasets:
+        data = dataset.get('data', [])
+        if len(data) == n and all(_is_number(v) for v in data):
+            selected.update(lttb_indices(data, threshold))
+    if not selected:
+        # Nothing numeric to guide the choice: keep evenly spaced points
+        step = n / threshold
+        selected = {int(i * step) for i in range(threshold)} | {n - 1}
+    indices = sorted(selected)
+
+    def pick(values):
+        return [values[i] for i in indices] if len(values) == n else values
+
+    new_datasets = [dict(d, data=pick(d['data'])) if 'data' in d else d for d in datasets]
+    return pick(labels), new_datasets
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+CLI Startup Import Budget
+Runs dashboard_generator.py under python -X importtime and reports how long
+its imports take beyond bare interpreter startup, the slowest modules, and
+whether any module that should load lazily was imported. The script runs from
+a temporary copy so that commands like --sample write their output there
+rather than into the repository.
+
+Usage (from the repository root):
+  python -m tools.importtime                 # checks --help and --sample
+  python -m tools.importtime --budget-ms 30 -- --help
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parent.parent / 'dashboard_generator.py'
+
+# Import cost allowed on top of interpreter startup
+DEFAULT_BUDGET_MS = 60
+
+# Modules that only the render, --open and optional backend paths need
+LAZY_MODULES = ('jinja2', 'markupsafe', 'webbrowser', 'numpy', 'orjson', 'ujson', 'simdjson')
+
+DEFAULT_COMMANDS = (('--help',), ('--sample',))
+
+# Each command is timed this many times and the fastest run kept, since a
+# single run is easily inflated by whatever else the machine is doing
+DEFAULT_REPEAT = 3
+
+
+def parse_importtime(stderr):
+    """Return {module: cumulative_us} and the top-level total from importtime output"""
+    modules = {}
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        cumulative = int(cumulative)
+        modules[name.strip()] = cumulative
+        if not name[1:].startswith(' '):
+            total += cumulative  # top-level import
+    return modules, total
+
+
+def _importtime(command, cwd):
+    # The copied script still imports tools/ and friends from the repository
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(
+        filter(None, [str(SCRIPT.parent), os.environ.get('PYTHONPATH')])))
+    result = subprocess.run([sys.executable, '-X', 'importtime', *command],
+                            capture_output=True, text=True, cwd=cwd, env=env)
+    return parse_importtime(result.stderr)
+
+
+def measure(args, repeat=DEFAULT_REPEAT):
+    """Import cost of running the CLI with args, beyond interpreter startup
+
+    Returns (milliseconds, {module: cumulative_us}, lazily loaded modules
+    that were imported anyway), from the fastest of repeat runs.
+    """
+    with tempfile.TemporaryDirectory() as workdir:
+        script = shutil.copy(SCRIPT, workdir)
+        baseline = min(_importtime(['-c', 'pass'], workdir)[1] for _ in range(repeat))
+        modules, total = min((_importtime([script, *args], workdir) for _ in range(repeat)),
+                             key=lambda run: run[1])
+    eager = sorted(name for name in modules if name.split('.')[0] in LAZY_MODULES)
+    return max(total - baseline, 0) / 1000, modules, eager
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Check the import cost of the dashboard CLI')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help=f'Allowed import time beyond interpreter startup (default: {DEFAULT_BUDGET_MS})')
+    parser.add_argument('--top', type=int, default=8, help='Slowest modules to list')
+    parser.add_argument('cli_args', nargs='*', help='Arguments for dashboard_generator.py (after --)')
+    args = parser.parse_args(argv)
+
+    failed = False
+    for command in [args.cli_args] if args.cli_args else DEFAULT_COMMANDS:
+        milliseconds, modules, eager = measure(command)
+        status = 'ok' if milliseconds <= args.budget_ms and not eager else 'FAIL'
+        failed |= status == 'FAIL'
+        print(f"{' '.join(command)}: {milliseconds:.1f} ms of imports "
+              f"(budget {args.budget_ms:g} ms) {status}")
+        for name, cumulative in sorted(modules.items(), key=lambda item: -item[1])[:args.top]:
+            print(f"  {cumulative / 1000:8.1f} ms  {name}")
+        if eager:
+            print(f"  imported eagerly: {', '.join(eager)}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Pluggable JSON Backend
+Uses the fastest installed JSON library (orjson, then simdjson for parsing
+and ujson) and falls back to the standard library. Every backend has the
+same semantics:
+
+- loads accepts exactly what json.loads accepts (inputs a fast parser rejects,
+  such as NaN literals, and numbers too long for it are handed to the
+  standard library)
+- dumps produces compact JSON in which non-finite floats become null
+
+The optional libraries are imported when a backend is first selected or
+used, not on import, to keep command line startup fast.
+"""
+
+import json
+import math
+import re
+
+orjson = simdjson = ujson = None
+
+_FAST_ERRORS = (TypeError, ValueError, OverflowError)
+
+# Integers beyond 64 bits, which some fast parsers silently turn into floats
+_LONG_DIGITS = re.compile(r'\d{19,}')
+_LONG_DIGITS_BYTES = re.compile(rb'\d{19,}')
+
+
+def _stdlib_loads(data):
+    return json.loads(data)
+
+
+def _stdlib_dumps(obj, sort_keys):
+    return json.dumps(obj, sort_keys=sort_keys, separators=(',', ':'),
+                      ensure_ascii=False, allow_nan=False)
+
+
+def _orjson_dumps(obj, sort_keys):
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return orjson.dumps(obj, option=option).decode('utf-8')
+
+
+def _ujson_dumps(obj, sort_keys):
+    return ujson.dumps(obj, sort_keys=sort_keys, ensure_ascii=False,
+                       escape_forward_slashes=False, allow_nan=False)
+
+
+_LOADERS = {}
+_DUMPERS = {}
+
+# Selected on first use (see _selected) unless set_backend is called
+_loads = None
+_dumps = None
+LOADS_BACKEND = DUMPS_BACKEND = None
+
+
+def _import_backends():
+    """Import the optional libraries once and fill in the backend tables"""
+    global orjson, simdjson, ujson
+    if _LOADERS:
+        return
+    try:
+        import orjson
+    except ImportError:  # optional dependency
+        pass
+    try:
+        import simdjson
+    except ImportError:  # optional dependency
+        pass
+    try:
+        import ujson
+    except ImportError:  # optional dependency
+        pass
+    _DUMPERS.update({
+        'stdlib': _stdlib_dumps,
+        'orjson': _orjson_dumps if orjson else None,
+        'ujson': _ujson_dumps if ujson else None,
+    })
+    _LOADERS.update({
+        'stdlib': _stdlib_loads,
+        'orjson': orjson.loads if orjson else None,
+        'simdjson': simdjson.loads if simdjson else None,
+        'ujson': ujson.loads if ujson else None,
+    })
+
+
+def available_backends():
+    """Names of the installed backends, fastest first"""
+    _import_backends()
+    return [name for name in ('orjson', 'simdjson', 'ujson', 'stdlib')
+            if _LOADERS[name] or _DUMPERS.get(name)]
+
+
+def set_backend(name='auto'):
+    """Select a backend by name, or the fastest available with 'auto'
+
+    A backend that only parses (simdjson) is paired with the fastest
+    available serializer.
+    """
+    global _loads, _dumps, LOADS_BACKEND, DUMPS_BACKEND
+    _import_backends()
+    if name == 'auto':
+        LOADS_BACKEND = next(n for n in ('orjson', 'simdjson', 'ujson', 'stdlib') if _LOADERS[n])
+        DUMPS_BACKEND = next(n for n in ('orjson', 'ujson', 'stdlib') if _DUMPERS[n])
+    elif _LOADERS.get(name) or _DUMPERS.get(name):
+        LOADS_BACKEND = name if _LOADERS.get(name) else 'stdlib'
+        DUMPS_BACKEND = name if _DUMPERS.get(name) else next(
+            n for n in ('orjson', 'ujson', 'stdlib') if _DUMPERS[n])
+    else:
+        raise ValueError(f"JSON backend not available: {name}")
+    _loads = _LOADERS[LOADS_BACKEND]
+    _dumps = _DUMPERS[DUMPS_BACKEND]
+
+
+def _selected():
+    if _loads is None:
+        set_backend()
+
+
+def loads(data):
+    """Parse JSON from str or bytes"""
+    _selected()
+    long_digits = _LONG_DIGITS_BYTES if isinstance(data, (bytes, bytearray)) else _LONG_DIGITS
+    if _loads is not _stdlib_loads and long_digits.search(data):
+        return json.loads(data)
+    try:
+        return _loads(data)
+    except _FAST_ERRORS:
+        if _loads is _stdlib_loads:
+            raise
+    # Let the standard library accept (or reject with its usual error) what
+    # the fast parser refused
+    return json.loads(data)
+
+
+def _finite(obj):
+    """Copy of obj with NaN and infinities replaced by None"""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+def dumps(obj, sort_keys=False):
+    """Serialize obj to compact JSON text"""
+    _selected()
+    try:
+        return _dumps(obj, sort_keys)
+    except _FAST_ERRORS:
+        pass
+    obj = _finite(obj)
+    try:
+        return _dumps(obj, sort_keys)
+    except _FAST_ERRORS:
+        # Types only the standard library handles (e.g. huge ints); anything
+        # it cannot serialize either raises the usual TypeError here
+        return _stdlib_dumps(obj, sort_keys)
+
+
+def htmlsafe_dumps(obj):
+    """Drop-in replacement for Jinja2's tojson filter using the fast backend"""
+    from markupsafe import Markup
+    text = dumps(obj, sort_keys=True)
+    return Markup(
+        text.replace('<', '\\u003c').replace('>', '\\u003e')
+            .replace('&', '\\u0026').replace("'", '\\u0027')
+    )
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Incremental JSON Loader
+Parses dashboard input in chunks so that huge tables never become one giant
+Python object tree. Everything except tables[*].rows is decoded eagerly; each
+table's rows are replaced by a LazyRows view that decodes them on demand.
+"""
+
+import codecs
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import weakref
+
+# Bytes read per chunk; grows geometrically while a single value is incomplete
+READ_SIZE = 64 * 1024
+
+_decoder = json.JSONDecoder()
+_whitespace = re.compile(r'[ \t\n\r]*')
+_number_tail = re.compile(r'[0-9eE.+\-]*')
+
+
+class _Scanner:
+    """Chunked reader over a binary JSON stream that tracks byte offsets"""
+
+    def __init__(self, f, offset=0):
+        self.f = f
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.buffer = ''
+        self.pos = 0
+        self.offset = offset  # byte offset of buffer[0] in the file
+        self.eof = False
+
+    def fill(self, size=READ_SIZE):
+        """Read another chunk into the buffer; return False at end of input"""
+        if self.eof:
+            return False
+        chunk = self.f.read(size)
+        if self.pos:
+            # Drop the consumed prefix so the buffer stays about one chunk long
+            self.offset += len(self.buffer[:self.pos].encode('utf-8'))
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        if not chunk:
+            self.eof = True
+            self.buffer += self.decoder.decode(b'', final=True)
+            return False
+        self.buffer += self.decoder.decode(chunk)
+        return True
+
+    def tell(self):
+        """Return the byte offset of the next unread character"""
+        return self.offset + len(self.buffer[:self.pos].encode('utf-8'))
+
+    def error(self, message):
+        return json.JSONDecodeError(message, self.buffer, self.pos)
+
+    def peek(self):
+        """Return the next non-whitespace character without consuming it"""
+        while True:
+            self.pos = _whitespace.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, char):
+        """Consume char (after optional whitespace) or raise"""
+        if self.peek() != char:
+            raise self.error(f"Expecting '{char}'")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value"""
+        if not self.peek():
+            raise self.error('Expecting value')
+        size = READ_SIZE
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill(size):
+                    raise
+                size *= 2
+                continue
+            # A number that runs to the end of the buffer may continue in the
+            # next chunk, so it is only complete once more input is seen
+            if (isinstance(value, (int, float)) and not self.eof
+                    and _number_tail.match(self.buffer, end).end() == len(self.buffer)):
+                self.fill(size)
+                continue
+            self.pos = end
+            return value
+
+    def items(self, close):
+        """Yield once per element of a container until the close character"""
+        if self.peek() == close:
+            self.pos += 1
+            return
+        while True:
+            yield
+            char = self.peek()
+            if char == ',':
+                self.pos += 1
+            elif char == close:
+                self.pos += 1
+                return
+            else:
+                raise self.error(f"Expecting ',' or '{close}'")
+
+    def skip_array(self):
+        """Consume an array without keeping its elements; return its length"""
+        self.expect('[')
+        count = 0
+        for _ in self.items(']'):
+            self.value()
+            count += 1
+        return count
+
+
+class LazyRows:
+    """Re-iterable view of a table's rows, decoded on demand from the source"""
+
+    def __init__(self, source, offset, count):
+        self.source = source
+        self.offset = offset
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        with self.source.open() as f:
+            f.seek(self.offset)
+            scanner = _Scanner(f, self.offset)
+            scanner.expect('[')
+            for _ in scanner.items(']'):
+                yield scanner.value()
+
+    def __repr__(self):
+        return f"<LazyRows count={self.count} offset={self.offset}>"
+
+
+class _FileSource:
+    """A JSON file on disk that lazy views can reopen"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def open(self):
+        return open(self.path, 'rb')
+
+
+class _SpooledSource(_FileSource):
+    """A non-seekable stream copied to a temporary file, removed once unused"""
+
+    def __init__(self, stream):
+        fd, path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(fd, 'wb') as f:
+            shutil.copyfileobj(stream, f)
+        super().__init__(path)
+        weakref.finalize(self, os.unlink, path)
+
+
+def _parse_table(scanner, source):
+    """Parse one table object, leaving its rows on disk"""
+    table = {}
+    for _ in scanner.items('}'):
+        key = scanner.value()
+        scanner.expect(':')
+        if key == 'rows' and scanner.peek() == '[':
+            offset = scanner.tell()
+            table[key] = LazyRows(source, offset, scanner.skip_array())
+        else:
+            table[key] = scanner.value()
+    return table
+
+
+def _parse_document(scanner, source):
+    if scanner.peek() != '{':
+        return scanner.value()
+    scanner.pos += 1
+    data = {}
+    for _ in scanner.items('}'):
+        key = scanner.value()
+        scanner.expect(':')
+        if key == 'tables' and scanner.peek() == '[':
+            scanner.pos += 1
+            tables = []
+            for _ in scanner.items(']'):
+                if scanner.peek() == '{':
+                    scanner.pos += 1
+                    tables.append(_parse_table(scanner, source))
+                else:
+                    tables.append(scanner.value())
+            data[key] = tables
+        else:
+            data[key] = scanner.value()
+    return data
+
+
+def load_json_stream(file_path):
+    """Load dashboard JSON from a file path or '-' (stdin) incrementally
+
+    Returns the same structure as json.load, except that every
+    tables[*].rows array is a LazyRows iterable. Stdin is spooled to a
+    temporary file first so the rows can be re-read without holding them.
+    """
+    if file_path == '-':
+        source = _SpooledSource(sys.stdin.buffer)
+    else:
+        source = _FileSource(file_path)
+
+    with source.open() as f:
+        scanner = _Scanner(f)
+        data = _parse_document(scanner, source)
+        if scanner.peek():
+            raise scanner.error('Extra data')
+    return data
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Live Dashboard Updates
+Computes deltas between successive process_data outputs and fans them out to
+browsers subscribed over server-sent events. Metric values, alerts and chart
+points are patched into the open page (Chart.js instances are updated in
+place); changes that the page cannot patch, such as a different set of tables
+or charts, ask it to reload instead.
+"""
+
+import threading
+from collections import deque
+
+# Deltas remembered for clients that reconnect (EventSource sends Last-Event-ID)
+HISTORY_SIZE = 256
+
+# Processed-data fields the page cannot patch in place
+_RELOAD_FIELDS = ('title', 'description', 'tables', 'cards')
+
+# Chart fields that require recreating the chart
+_CHART_SHAPE_FIELDS = ('id', 'title', 'type', 'x_scale', 'width', 'height')
+
+
+def _appended(old, new):
+    """The items appended to old to make new, or None if new does not extend old
+
+    Packed chart series (tools.chart_data.pack_series) never extend; they are
+    replaced whole.
+    """
+    if not isinstance(old, list) or not isinstance(new, list):
+        return None
+    if len(new) < len(old) or new[:len(old)] != old:
+        return None
+    return new[len(old):]
+
+
+def _diff_chart(old, new):
+    """Delta for one chart: appended points, full data, or None if unchanged"""
+    if old['labels'] == new['labels'] and old['datasets'] == new['datasets']:
+        return None
+
+    labels = _appended(old['labels'], new['labels'])
+    same_series = len(old['datasets']) == len(new['datasets']) and all(
+        {k: v for k, v in a.items() if k != 'data'} == {k: v for k, v in b.items() if k != 'data'}
+        for a, b in zip(old['datasets'], new['datasets'])
+    )
+    if labels is not None and same_series:
+        data = [_appended(a.get('data', []), b.get('data', []))
+                for a, b in zip(old['datasets'], new['datasets'])]
+        if all(points is not None and len(points) == len(labels) for points in data):
+            return {'id': new['id'], 'append': {'labels': labels, 'data': data}}
+    return {'id': new['id'], 'replace': {'labels': new['labels'], 'datasets': new['datasets']}}
+
+
+def diff_dashboards(old, new):
+    """Return the delta turning processed data old into new, or None if equal
+
+    The delta holds only what changed: 'metrics' as [index, metric] pairs,
+    'alerts' as the new list, 'charts' as per-chart appends or replacements,
+    and the new 'timestamp'. It is {'reload': True} when the page structure
+    changed.
+    """
+    for field in _RELOAD_FIELDS:
+        if old.get(field) != new.get(field):
+            return {'reload': True}
+
+    old_metrics, new_metrics = old.get('metrics', []), new.get('metrics', [])
+    old_charts, new_charts = old.get('charts', []), new.get('charts', [])
+    if len(old_metrics) != len(new_metrics) or len(old_charts) != len(new_charts):
+        return {'reload': True}
+    for a, b in zip(old_charts, new_charts):
+        if any(a.get(field) != b.get(field) for field in _CHART_SHAPE_FIELDS):
+            return {'reload': True}
+
+    delta = {}
+    metrics = [[index, b] for index, (a, b) in enumerate(zip(old_metrics, new_metrics)) if a != b]
+    if metrics:
+        delta['metrics'] = metrics
+    if old.get('alerts', []) != new.get('alerts', []):
+        delta['alerts'] = new.get('alerts', [])
+    charts = [d for d in (_diff_chart(a, b) for a, b in zip(old_charts, new_charts)) if d]
+    if charts:
+        delta['charts'] = charts
+    if not delta:
+        return None
+    delta['timestamp'] = new.get('timestamp')
+    return delta
+
+
+class LiveFeed:
+    """Current dashboard data plus a versioned history of deltas
+
+    publish() is called with each new process_data output; subscribers call
+    wait() with the last version they have seen and get the deltas since.
+    Thread-safe.
+    """
+
+    def __init__(self, data=None, history=HISTORY_SIZE):
+        self.condition = threading.Condition()
+        self.data = data
+        self.version = 0
+        self.history = deque(maxlen=history)
+        self.closed = False
+
+    def snapshot(self):
+        """Return (version, data) consistently"""
+        with self.condition:
+            return self.version, self.data
+
+    def publish(self, data):
+        """Make data current and notify subscribers; return the delta (or None)"""
+        with self.condition:
+            if self.data is None:
+                delta = {'reload': True}
+            else:
+                delta = diff_dashboards(self.data, data)
+            self.data = data
+            if delta is None:
+                return None
+            self.version += 1
+            self.history.append((self.version, delta))
+            self.condition.notify_all()
+            return delta
+
+    def wait(self, since, timeout=None):
+        """Return [(version, delta), ...] published after version since
+
+        Blocks up to timeout seconds for something new; returns [] on timeout
+        or once the feed is closed. A client too far behind for the history
+        gets a single reload.
+        """
+        with self.condition:
+            self.condition.wait_for(lambda: self.version > since or self.closed, timeout)
+            if self.closed or self.version <= since:
+                return []
+            oldest = self.history[0][0]
+            if since < oldest - 1 or since > self.version:
+                return [(self.version, {'reload': True})]
+            return [(version, delta) for version, delta in self.history if version > since]
+
+    def close(self):
+        """Release every waiting subscriber"""
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+
+# Patches an open dashboard page with deltas from the events endpoint
+LIVE_SCRIPT = """
+function escapeHtml(value) {
+    return String(value == null ? '' : value).replace(/[&<>"']/g, c => ({
+        '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'
+    })[c]);
+}
+
+function applyMetric(index, metric) {
+    const card = document.querySelectorAll('.metric-card')[index];
+    if (!card) return;
+    const arrow = metric.trend === 'up' ? 'up' : metric.trend === 'down' ? 'down' : 'right';
+    card.style.background = `linear-gradient(135deg, ${metric.color} 0%, ${metric.color}dd 100%)`;
+    card.innerHTML = `<div class="metric-name">${escapeHtml(metric.name)}</div>` +
+        `<div class="metric-value">${escapeHtml(metric.value)}${escapeHtml(metric.unit)}</div>` +
+        (metric.change ? `<div class="metric-change trend-${escapeHtml(metric.trend)}">` +
+            `<i class="fas fa-arrow-${arrow}"></i> ${escapeHtml(metric.change)}</div>` : '');
+}
+
+function applyAlerts(alerts) {
+    let section = document.querySelector('.alerts-section');
+    if (!section) {
+        section = document.createElement('div');
+        section.className = 'alerts-section';
+        document.querySelector('.timestamp').after(section);
+    }
+    section.innerHTML = alerts.map(alert =>
+        `<div class="alert alert-${escapeHtml(alert.type)}">` +
+        `<i class="fas fa-${escapeHtml(alert.icon || 'info-circle')}"></i> ${escapeHtml(alert.message)}</div>`
+    ).join('');
+    section.style.display = alerts.length ? '' : 'none';
+}
+
+function applyChart(change) {
+    if (change.append) {
+        appendChartData(change.id, change.append.labels, change.append.data);
+    } else {
+        replaceChartData(change.id, change.replace.labels, change.replace.datasets);
+    }
+}
+
+function applyDelta(delta) {
+    if (delta.reload) {
+        location.reload();
+        return;
+    }
+    (delta.metrics || []).forEach(([index, metric]) => applyMetric(index, metric));
+    if (delta.alerts) applyAlerts(delta.alerts);
+    (delta.charts || []).forEach(applyChart);
+    if (delta.timestamp) {
+        document.querySelector('.timestamp').innerHTML =
+            `<i class="fas fa-clock"></i> Generated on: ${escapeHtml(delta.timestamp)}`;
+    }
+}
+
+function connectLive(url) {
+    const source = new EventSource(url);
+    source.addEventListener('delta', event => applyDelta(JSON.parse(event.data)));
+    return source;
+}
+"""
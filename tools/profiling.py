@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Render Pipeline Profiling
+Records per-stage timings (wall and CPU), sizes and counts for the stages of
+a dashboard render (load, process, compile, context, render, write) and
+optionally the peak traced memory of each stage. Attach a Profiler to a
+DashboardGenerator (its profiler attribute) or use --profile on the CLI.
+"""
+
+import cProfile
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# Record fields printed as columns; everything else is listed as details
+_COLUMNS = ('stage', 'wall_ms', 'cpu_ms', 'peak_bytes')
+
+
+def _series_length(data):
+    # Packed series (tools.chart_data.pack_series) record their length
+    return data['length'] if isinstance(data, dict) else len(data)
+
+
+def data_counts(data):
+    """Row, point and section counts of processed dashboard data"""
+    tables = data.get('tables', [])
+    charts = data.get('charts', [])
+    rows = sum(len(t['rows']) for t in tables if hasattr(t.get('rows'), '__len__'))
+    points = sum(_series_length(d.get('data', [])) for c in charts for d in c.get('datasets', []))
+    return {
+        'metrics': len(data.get('metrics', [])),
+        'charts': len(charts),
+        'points': points,
+        'tables': len(tables),
+        'rows': rows,
+    }
+
+
+class Profiler:
+    """Collects one record per pipeline stage
+
+    Each record is a dict with the stage name, wall_ms, cpu_ms, peak_bytes
+    (with memory=True, the peak traced Python memory during the stage) and
+    any counts the stage reports (bytes_in, bytes_out, rows, points, ...).
+    Tracing memory slows rendering down considerably, so it is off by default.
+    """
+
+    def __init__(self, memory=False):
+        self.memory = memory
+        self.records = []
+        self._tracing = memory and not tracemalloc.is_tracing()
+        if self._tracing:
+            tracemalloc.start()
+
+    @contextmanager
+    def stage(self, name, **counts):
+        """Time the enclosed block; the yielded record accepts extra counts"""
+        record = {'stage': name}
+        if self.memory:
+            tracemalloc.reset_peak()
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield counts
+        finally:
+            record['wall_ms'] = round((time.perf_counter() - wall) * 1000, 3)
+            record['cpu_ms'] = round((time.process_time() - cpu) * 1000, 3)
+            if self.memory:
+                record['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+            record.update(counts)
+            self.records.append(record)
+
+    def reset(self):
+        self.records = []
+
+    def close(self):
+        """Stop memory tracing if this profiler started it"""
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+
+    def totals(self):
+        """Sum of the stage timings and the highest stage peak"""
+        totals = {
+            'stage': 'total',
+            'wall_ms': round(sum(r['wall_ms'] for r in self.records), 3),
+            'cpu_ms': round(sum(r['cpu_ms'] for r in self.records), 3),
+        }
+        if self.memory:
+            totals['peak_bytes'] = max((r['peak_bytes'] for r in self.records), default=0)
+        return totals
+
+    def json_lines(self):
+        """One JSON object per stage, then the totals"""
+        return '\n'.join(json.dumps(r) for r in self.records + [self.totals()])
+
+    def summary(self):
+        """Human-readable table of the stages"""
+        lines = [f"{'Stage':<12} {'Wall ms':>10} {'CPU ms':>10} {'Peak MB':>9}  Details"]
+        for record in self.records + [self.totals()]:
+            peak = record.get('peak_bytes')
+            peak = f"{peak / (1024 * 1024):.1f}" if peak is not None else '-'
+            details = ', '.join(f"{key}={_format(value)}" for key, value in record.items()
+                                if key not in _COLUMNS)
+            lines.append(f"{record['stage']:<12} {record['wall_ms']:>10.1f} "
+                         f"{record['cpu_ms']:>10.1f} {peak:>9}  {details}".rstrip())
+        return '\n'.join(lines)
+
+
+def _format(value):
+    return f"{value:,}" if isinstance(value, int) and not isinstance(value, bool) else str(value)
+
+
+@contextmanager
+def cprofile_to(path):
+    """Run the enclosed block under cProfile and dump the stats to path"""
+    profile = cProfile.Profile()
+    profile.enable()
+    try:
+        yield profile
+    finally:
+        profile.disable()
+        profile.dump_stats(path)
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Render Cache
+Remembers rendered dashboards by a hash of their processed data (ignoring the
+generation timestamp) plus the template version, so re-running an unchanged
+input skips the render. Entries are evicted least-recently-used first once the
+cache exceeds its entry or size limits. FragmentCache does the same for
+individual page sections, so a partly changed dashboard only re-renders the
+sections whose data changed, and TemplateBytecodeCache bounds Jinja2's
+compiled-template cache the same way.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+
+from jinja2 import FileSystemBytecodeCache
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Characters of rendered fragments kept in memory per FragmentCache
+DEFAULT_MEMORY_CHARS = 64 * 1024 * 1024
+
+# Compiled templates kept per directory; only a couple are in use at a time,
+# the rest are left behind by edited templates or Jinja2 upgrades
+DEFAULT_MAX_BYTECODE_ENTRIES = 8
+
+# Processed-data fields that change on every run without changing the content
+VOLATILE_FIELDS = ('timestamp',)
+
+
+def _feed(h, obj):
+    """Feed a canonical encoding of obj to hash h without materializing rows"""
+    if isinstance(obj, dict):
+        h.update(b'{')
+        for key in sorted(obj):
+            h.update(json.dumps(str(key)).encode('utf-8'))
+            h.update(b':')
+            _feed(h, obj[key])
+            h.update(b',')
+        h.update(b'}')
+    elif isinstance(obj, (list, tuple)):
+        try:
+            # Plain rows and lists encode in one C-level call
+            h.update(json.dumps(obj, sort_keys=True, separators=(',', ':')).encode('utf-8'))
+        except TypeError:
+            h.update(b'[')
+            for item in obj:
+                _feed(h, item)
+                h.update(b',')
+            h.update(b']')
+    elif isinstance(obj, (str, int, float, bool)) or obj is None:
+        h.update(json.dumps(obj).encode('utf-8'))
+    elif hasattr(obj, '__iter__') and iter(obj) is not obj:
+        # Re-iterable views such as LazyRows
+        h.update(b'[')
+        for item in obj:
+            _feed(h, item)
+            h.update(b',')
+        h.update(b']')
+    else:
+        raise TypeError(f"Cannot hash {type(obj).__name__} without consuming it")
+
+
+def content_key(data, version):
+    """Return the cache key for processed data rendered with a template version
+
+    Returns None if the data contains one-shot iterators (e.g. generators),
+    which cannot be hashed without consuming them.
+    """
+    h = hashlib.sha256()
+    h.update(version.encode('utf-8'))
+    try:
+        _feed(h, {k: v for k, v in data.items() if k not in VOLATILE_FIELDS})
+    except TypeError:
+        return None
+    return h.hexdigest()
+
+
+def _write_atomic(path, text):
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def _file_mode(path):
+    """Mode a replacement for path should get: path's own, else the umask default"""
+    try:
+        return path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def _copy_atomic(source, target):
+    # mkstemp creates 0600 files; give the copy the mode a plain write would
+    mode = _file_mode(target)
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix='.tmp-')
+    os.close(fd)
+    shutil.copyfile(source, tmp)
+    os.chmod(tmp, mode)
+    os.replace(tmp, target)
+
+
+class RenderCache:
+    """On-disk cache of rendered dashboards stored next to the output files"""
+
+    def __init__(self, cache_dir, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.entries_dir = self.cache_dir / 'entries'
+        self.outputs_dir = self.cache_dir / 'outputs'
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries_dir.mkdir(parents=True, exist_ok=True)
+        self.outputs_dir.mkdir(parents=True, exist_ok=True)
+
+    def key(self, data, version):
+        return content_key(data, version)
+
+    def _entry(self, key):
+        return self.entries_dir / f"{key}.html"
+
+    def _marker(self, output_path):
+        name = hashlib.sha1(str(Path(output_path).resolve()).encode('utf-8')).hexdigest()
+        return self.outputs_dir / name
+
+    def _stamp(self, key, output_path):
+        """Marker text recording that output_path, as it is now, holds key's render"""
+        stat = output_path.stat()
+        return f"{key} {stat.st_size} {stat.st_mtime_ns}"
+
+    def restore(self, key, output_path):
+        """Make output_path hold the cached render for key
+
+        Returns True on a cache hit. If output_path still holds that render
+        (same size and mtime as when it was recorded) nothing is written;
+        otherwise, e.g. after an uncached render overwrote it, the cached HTML
+        is copied into place.
+        """
+        entry = self._entry(key)
+        if not entry.exists():
+            return False
+        marker = self._marker(output_path)
+        output_path = Path(output_path)
+        try:
+            current = marker.read_text(encoding='utf-8')
+            unchanged = current == self._stamp(key, output_path)
+        except FileNotFoundError:
+            unchanged = False
+        if not unchanged:
+            _copy_atomic(entry, output_path)
+            _write_atomic(marker, self._stamp(key, output_path))
+        os.utime(entry)  # mark as recently used
+        return True
+
+    def store(self, key, output_path):
+        """Add a freshly rendered output to the cache and evict if needed"""
+        output_path = Path(output_path)
+        _copy_atomic(output_path, self._entry(key))
+        _write_atomic(self._marker(output_path), self._stamp(key, output_path))
+        self.evict()
+
+    def evict(self):
+        """Remove least recently used entries until within the limits"""
+        _evict(self.entries_dir, self.max_entries, self.max_bytes)
+
+
+def _evict(directory, max_entries, max_bytes, pattern='*.html'):
+    """Delete the least recently used files matching pattern beyond the limits"""
+    entries = []
+    for entry in directory.glob(pattern):
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            continue  # removed concurrently
+        entries.append((stat.st_mtime, stat.st_size, entry))
+    entries.sort()
+    total = sum(size for _, size, _ in entries)
+    while entries and (len(entries) > max_entries or total > max_bytes):
+        _, size, entry = entries.pop(0)
+        try:
+            entry.unlink()
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+class FragmentCache:
+    """Rendered page sections keyed by a hash of the data they depend on
+
+    Fragments are kept in memory (least recently used dropped first) for the
+    life of the cache and, with a cache_dir, on disk so that separate runs
+    share them.
+    """
+
+    def __init__(self, cache_dir=None, max_entries=DEFAULT_MAX_ENTRIES,
+                 max_bytes=DEFAULT_MAX_BYTES, memory_chars=DEFAULT_MEMORY_CHARS):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.memory_chars = memory_chars
+        self._memory = OrderedDict()
+        self._memory_size = 0
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def key(self, value, version):
+        """Key for a section's data, or None if it cannot be hashed"""
+        return content_key({'section': value}, version)
+
+    def get(self, key):
+        """Return the cached fragment for key, or None"""
+        text = self._memory.get(key)
+        if text is not None:
+            self._memory.move_to_end(key)
+            return text
+        if self.cache_dir:
+            path = self.cache_dir / f"{key}.html"
+            try:
+                text = path.read_text(encoding='utf-8')
+            except FileNotFoundError:
+                return None
+            os.utime(path)  # mark as recently used
+            self._remember(key, text)
+        return text
+
+    def put(self, key, text):
+        self._remember(key, text)
+        if self.cache_dir:
+            _write_atomic(self.cache_dir / f"{key}.html", text)
+
+    def _remember(self, key, text):
+        if key in self._memory:
+            self._memory_size -= len(self._memory.pop(key))
+        self._memory[key] = text
+        self._memory_size += len(text)
+        while len(self._memory) > 1 and (len(self._memory) > self.max_entries
+                                         or self._memory_size > self.memory_chars):
+            _, dropped = self._memory.popitem(last=False)
+            self._memory_size -= len(dropped)
+
+    def evict(self):
+        """Apply the entry and size limits to the on-disk fragments"""
+        if self.cache_dir:
+            _evict(self.cache_dir, self.max_entries, self.max_bytes)
+
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """Jinja2 bytecode cache that drops least recently used templates
+
+    Template names hash their source, so every edit to a template (or Jinja2
+    upgrade) compiles under a new name; without a limit the old entries would
+    accumulate in the directory forever.
+    """
+
+    def __init__(self, directory, max_entries=DEFAULT_MAX_BYTECODE_ENTRIES):
+        super().__init__(str(directory))
+        self.max_entries = max_entries
+
+    def load_bytecode(self, bucket):
+        super().load_bytecode(bucket)
+        if bucket.code is not None:
+            try:
+                os.utime(self._get_cache_filename(bucket))
+            except OSError:
+                pass  # removed concurrently; it is recompiled next time
+
+    def dump_bytecode(self, bucket):
+        super().dump_bytecode(bucket)
+        _evict(Path(self.directory), self.max_entries, float('inf'), self.pattern % '*')
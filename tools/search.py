@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+Table Search Index
+Builds the per-row search strings embedded next to a table, so the page
+filters rows by matching the query against one string per row instead of
+reading every cell out of the DOM on each keystroke. The page applies the
+same normalization to the query.
+"""
+
+# Joins cells within a row's search string; the search box cannot contain
+# it, so a query never matches across two cells
+CELL_SEPARATOR = '\n'
+
+
+def normalize_cell(cell):
+    """Text of a cell as the search compares it"""
+    return '' if cell is None else str(cell).lower()
+
+
+def search_index(rows):
+    """One normalized search string per row, in row order"""
+    return [CELL_SEPARATOR.join(map(normalize_cell, row)) for row in rows]
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Dashboard Render Server
+A long-running HTTP server that keeps a warm DashboardGenerator and compiled
+template in memory, so callers can render dashboards without paying process
+startup on every request.
+
+Endpoints:
+  POST /render   JSON body (same schema as process_data) -> HTML
+                 (gzip-compressed when the client sends Accept-Encoding: gzip)
+  GET  /stats    Request latency statistics as JSON
+  GET  /health   Liveness check
+
+In live mode (see tools/live.py) the server also provides:
+  GET  /         The current dashboard, subscribed to /events
+  GET  /events   Server-sent events carrying deltas to the current dashboard
+  POST /update   JSON body -> becomes the current dashboard; its delta is pushed
+"""
+
+import gzip
+import json
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from dashboard_generator import DashboardGenerator
+from tools import json_backend
+
+# Seconds between keep-alive comments on idle event streams
+KEEPALIVE_SECONDS = 15
+
+
+class RenderStats:
+    """Thread-safe request latency statistics over a sliding window"""
+
+    def __init__(self, window=1000):
+        self.lock = threading.Lock()
+        self.latencies = deque(maxlen=window)
+        self.requests = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.started = time.time()
+
+    def record(self, seconds, error=False):
+        with self.lock:
+            self.requests += 1
+            self.errors += int(error)
+            self.total_seconds += seconds
+            self.latencies.append(seconds)
+
+    def snapshot(self):
+        """Return a JSON-serializable summary (latencies in milliseconds)"""
+        with self.lock:
+            latencies = sorted(self.latencies)
+            summary = {
+                'requests': self.requests,
+                'errors': self.errors,
+                'uptime_seconds': round(time.time() - self.started, 3),
+                'mean_ms': round(self.total_seconds / self.requests * 1000, 3) if self.requests else None,
+            }
+        for name, fraction in (('p50_ms', 0.5), ('p90_ms', 0.9), ('p99_ms', 0.99)):
+            summary[name] = round(_percentile(latencies, fraction) * 1000, 3) if latencies else None
+        summary['max_ms'] = round(latencies[-1] * 1000, 3) if latencies else None
+        return summary
+
+
+def _percentile(values, fraction):
+    index = min(len(values) - 1, int(round(fraction * (len(values) - 1))))
+    return values[index]
+
+
+class DashboardRequestHandler(BaseHTTPRequestHandler):
+    server_version = 'DashboardGenerator/1.0'
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == '/stats':
+            self._send_json(200, self.server.stats.snapshot())
+        elif url.path == '/health':
+            self._send_json(200, {'status': 'ok'})
+        elif url.path == '/' and self.server.live:
+            self._send_live_page()
+        elif url.path == '/events' and self.server.live:
+            self._stream_events(parse_qs(url.query))
+        else:
+            self._send_json(404, {'error': f"Not found: {self.path}"})
+
+    def do_POST(self):
+        if self.path == '/update' and self.server.live:
+            self._update_live()
+            return
+        if self.path != '/render':
+            self._send_json(404, {'error': f"Not found: {self.path}"})
+            return
+
+        start = time.perf_counter()
+        status = 200
+        try:
+            raw_data = self._read_json()
+            html = self.server.generator.render_html(self.server.generator.process_data(raw_data))
+            self._send_body(200, html.encode('utf-8'), 'text/html; charset=utf-8')
+        except ValueError as e:
+            # json.JSONDecodeError is a ValueError too
+            status = 400
+            self._send_json(status, {'error': str(e)})
+        except Exception as e:
+            status = 500
+            self._send_json(status, {'error': f"{type(e).__name__}: {e}"})
+        finally:
+            self.server.stats.record(time.perf_counter() - start, error=status != 200)
+
+    def _send_live_page(self):
+        from tools.live import LIVE_SCRIPT
+        version, data = self.server.live.snapshot()
+        if data is None:
+            self._send_json(503, {'error': 'No dashboard data yet: POST it to /update'})
+            return
+        live = {'script': LIVE_SCRIPT, 'events_url': f"/events?since={version}"}
+        html = self.server.generator.render_html(dict(data, live=live))
+        self._send_body(200, html.encode('utf-8'), 'text/html; charset=utf-8')
+
+    def _stream_events(self, query):
+        """Send deltas as server-sent events until the client or server goes away"""
+        since = self.headers.get('Last-Event-ID') or query.get('since', ['0'])[0]
+        try:
+            since = int(since)
+        except ValueError:
+            since = 0
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        self.close_connection = True
+        feed = self.server.live
+        try:
+            self.wfile.write(b'retry: 2000\n\n')
+            self.wfile.flush()
+            while not feed.closed:
+                events = feed.wait(since, timeout=KEEPALIVE_SECONDS)
+                if not events:
+                    self.wfile.write(b': keepalive\n\n')
+                for version, delta in events:
+                    payload = json_backend.dumps(delta)
+                    self.wfile.write(f"id: {version}\nevent: delta\ndata: {payload}\n\n".encode('utf-8'))
+                    since = version
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _update_live(self):
+        try:
+            data = self.server.generator.process_data(self._read_json())
+        except ValueError as e:
+            self._send_json(400, {'error': str(e)})
+            return
+        delta = self.server.live.publish(data)
+        self._send_json(200, {
+            'version': self.server.live.version,
+            'changed': sorted(k for k in delta if k != 'timestamp') if delta else []
+        })
+
+    def _read_json(self):
+        raw_data = json_backend.loads(self._read_body())
+        if not isinstance(raw_data, dict):
+            raise ValueError('Request body must be a JSON object')
+        return raw_data
+
+    def _read_body(self):
+        length = self.headers.get('Content-Length')
+        if length is None:
+            raise ValueError('Content-Length header required')
+        return self.rfile.read(int(length))
+
+    def _send_json(self, status, payload):
+        self._send_body(status, json.dumps(payload).encode('utf-8'), 'application/json')
+
+    def _send_body(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body, compresslevel=6)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class DashboardServer(ThreadingHTTPServer):
+    """Threaded HTTP server owning one warm DashboardGenerator"""
+
+    daemon_threads = True
+
+    def __init__(self, address, generator=None, verbose=False, live=None):
+        super().__init__(address, DashboardRequestHandler)
+        self.generator = generator or DashboardGenerator()
+        self.generator.get_template()
+        self.stats = RenderStats()
+        self.verbose = verbose
+        self.live = live
+
+    def server_close(self):
+        if self.live:
+            self.live.close()
+        super().server_close()
+
+
+def create_server(host='127.0.0.1', port=8000, generator=None, verbose=False, live=None):
+    """Create a server bound to host:port (port 0 picks a free port)
+
+    Pass a tools.live.LiveFeed as live to enable the live dashboard endpoints.
+    """
+    return DashboardServer((host, port), generator=generator, verbose=verbose, live=live)
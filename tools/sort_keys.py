@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Table Sort Orders
+Parses formatted cells ("₹2,45,000", "+15%", "3:45") into numbers once at
+render time and precomputes, for each numeric column, the row order that
+sorting by it produces, so clicking a header in the page only reorders rows.
+A column is numeric when every non-empty cell parses as a number; empty cells
+sort last. Text columns are left to the page, which orders them once with the
+browser's locale-aware collation (Intl.Collator) as before, something Python
+cannot reproduce. sortKey in the page script mirrors parse_sort_key for
+tables whose orders are not embedded.
+"""
+
+import math
+import re
+
+CURRENCY_SYMBOLS = '₹$€£¥'
+
+# ASCII digits only, like \d in the page's sortKey (float() would take "٣")
+_NUMBER = re.compile(r'(?:\d[\d,]*)?\.?\d+(?:[eE][+-]?\d+)?', re.ASCII)
+_DURATION = re.compile(r'(\d+):([0-5]\d)(?::([0-5]\d))?', re.ASCII)
+
+
+def parse_sort_key(value):
+    """Numeric value of a cell, or None if it is not a number
+
+    Accepts numbers and strings with an optional sign, currency symbol,
+    thousands separators (any grouping) and percent sign, as well as
+    durations as m:ss or h:mm:ss (in seconds).
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return None if isinstance(value, float) and math.isnan(value) else value
+    if not isinstance(value, str):
+        return None
+    text = value.strip()
+    match = _DURATION.fullmatch(text)
+    if match:
+        parts = [int(part) for part in match.groups() if part is not None]
+        seconds = 0
+        for part in parts:
+            seconds = seconds * 60 + part
+        return seconds
+    sign = ''
+    if text[:1] in ('+', '-'):
+        sign, text = text[0], text[1:]
+    text = text.lstrip(CURRENCY_SYMBOLS).strip()
+    if text.endswith('%'):
+        text = text[:-1].rstrip()
+    if not _NUMBER.fullmatch(text):
+        return None
+    return float(sign + text.replace(',', ''))
+
+
+def _is_blank(value):
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def column_order(values):
+    """Row indices that sort a numeric column ascending (ties keep row order)
+
+    Returns None for text columns, which the page orders itself.
+    """
+    keys = [parse_sort_key(value) for value in values]
+    numeric = any(key is not None for key in keys) and all(
+        key is not None or _is_blank(value) for key, value in zip(keys, values))
+    if not numeric:
+        return None
+    sort_keys = [(key is None, key or 0) for key in keys]
+    return sorted(range(len(values)), key=sort_keys.__getitem__)
+
+
+def sort_orders(rows, column_count):
+    """column_order for each of the first column_count columns of rows (None for text)"""
+    return [column_order([row[column] if column < len(row) else None for row in rows])
+            for column in range(column_count)]
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Input File Watching
+Reports changed files in a set of directories, using Linux inotify when it
+is available and polling file modification times otherwise. watch() adds
+debouncing, so an editor's burst of writes (or a generator rewriting many
+inputs) turns into a single callback with every path that changed.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import threading
+import time
+from pathlib import Path
+
+# Quiet period after the last change before on_change is called
+DEBOUNCE_SECONDS = 0.2
+POLL_INTERVAL = 0.5
+
+_IN_MODIFY = 0x002
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+class PollingWatcher:
+    """Detects changes by comparing file mtimes and sizes between scans"""
+
+    def __init__(self, directories, interval=POLL_INTERVAL):
+        self.directories = [Path(d).resolve() for d in directories]
+        self.interval = interval
+        self._state = self._scan()
+
+    def _scan(self):
+        state = {}
+        for directory in self.directories:
+            try:
+                entries = list(os.scandir(directory))
+            except FileNotFoundError:
+                continue
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        state[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+                except FileNotFoundError:
+                    pass
+        return state
+
+    def changes(self, timeout):
+        """Return the set of paths that changed, waiting up to timeout seconds"""
+        deadline = time.monotonic() + timeout
+        while True:
+            state = self._scan()
+            changed = {path for path in state.keys() | self._state.keys()
+                       if state.get(path) != self._state.get(path)}
+            self._state = state
+            remaining = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            time.sleep(min(self.interval, remaining))
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify watches on each directory (no polling, no dependency)"""
+
+    def __init__(self, directories):
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.directories = {}
+        try:
+            for directory in directories:
+                directory = Path(directory).resolve()
+                wd = libc.inotify_add_watch(self.fd, os.fsencode(directory), _IN_MASK)
+                if wd < 0:
+                    raise OSError(ctypes.get_errno(), f"Cannot watch {directory}")
+                self.directories[wd] = directory
+        except OSError:
+            os.close(self.fd)
+            raise
+
+    def changes(self, timeout):
+        """Return the set of paths that changed, waiting up to timeout seconds"""
+        readable, _, _ = select.select([self.fd], [], [], max(timeout, 0))
+        changed = set()
+        while readable:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, _, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                if name and wd in self.directories:
+                    changed.add(self.directories[wd] / os.fsdecode(name))
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+def create_watcher(directories, polling=False):
+    """Return an inotify watcher where supported, else a polling one"""
+    if not polling:
+        try:
+            return InotifyWatcher(directories)
+        except (OSError, AttributeError):
+            pass  # not Linux, or out of inotify watches
+    return PollingWatcher(directories)
+
+
+def watch(directories, on_change, debounce=DEBOUNCE_SECONDS, stop=None, watcher=None):
+    """Call on_change(paths) with the resolved paths of changed files
+
+    Changes are collected until debounce seconds pass without another one.
+    Runs until the stop event (if given) is set.
+    """
+    stop = stop or threading.Event()
+    watcher = watcher or create_watcher(directories)
+    try:
+        while not stop.is_set():
+            changed = watcher.changes(timeout=0.5)
+            if not changed:
+                continue
+            while True:
+                more = watcher.changes(timeout=debounce)
+                if not more:
+                    break
+                changed |= more
+            if not stop.is_set():
+                on_change(changed)
+    finally:
+        watcher.close()